@@ -22,7 +22,7 @@ class SQLiteCache:
     def __init__(
         self,
         db_path: str = "data/privatinvestor.db",
-        ttl_hours: int = 24,
+        ttl_hours: float = 24,
         provider: str = "yfinance",
     ):
         """
@@ -100,10 +100,12 @@ class SQLiteCache:
         """
         Get cached value for a symbol and field.
 
-        Returns None if not cached or expired.
+        Returns None if not cached or expired. Entries carrying an
+        ``expires_at`` honour the TTL they were written with and are evicted
+        on read once past it; older rows fall back to this cache's TTL.
         """
-        cutoff_time = datetime.now() - timedelta(hours=self.ttl_hours)
-        cutoff_str = cutoff_time.isoformat()
+        now = datetime.now()
+        cutoff_str = (now - timedelta(hours=self.ttl_hours)).isoformat()
 
         with sqlite3.connect(self.db_path) as conn:
             if self._legacy_mode:
@@ -114,18 +116,38 @@ class SQLiteCache:
                     """,
                     (symbol, field, cutoff_str),
                 )
+                row = cursor.fetchone()
             else:
                 cursor = conn.execute(
                     """
-                    SELECT value_json, fetched_at FROM provider_cache
+                    SELECT value_json, fetched_at, expires_at FROM provider_cache
                     WHERE symbol = ?
                       AND provider = ?
                       AND field = ?
-                      AND fetched_at >= ?
                     """,
-                    (symbol, self.provider, field, cutoff_str),
+                    (symbol, self.provider, field),
                 )
-            row = cursor.fetchone()
+                row = cursor.fetchone()
+
+                if row:
+                    value_json, fetched_at, expires_at = row
+                    fresh = (
+                        expires_at >= now.isoformat()
+                        if expires_at is not None
+                        else fetched_at >= cutoff_str
+                    )
+                    if fresh:
+                        row = (value_json, fetched_at)
+                    else:
+                        conn.execute(
+                            """
+                            DELETE FROM provider_cache
+                            WHERE symbol = ? AND provider = ? AND field = ?
+                            """,
+                            (symbol, self.provider, field),
+                        )
+                        conn.commit()
+                        row = None
 
             if row:
                 value_json, fetched_at = row
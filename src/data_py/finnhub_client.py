@@ -1,6 +1,7 @@
 """Finnhub API client with rate limiting and retry logic."""
 
 import logging
+import threading
 import time
 from typing import Optional, Any
 from datetime import datetime, timedelta
@@ -23,9 +24,16 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests = []
+        # Serializes callers from worker threads; a waiting thread holds the
+        # lock so the others queue behind it instead of overshooting the limit.
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
-        """Block if rate limit would be exceeded."""
+        """Block if rate limit would be exceeded (thread-safe)."""
+        with self._lock:
+            self._wait_locked()
+
+    def _wait_locked(self) -> None:
         now = time.time()
 
         # Remove requests outside the time window
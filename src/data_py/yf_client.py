@@ -8,7 +8,7 @@ import logging
 import os
 import tempfile
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 import pandas as pd
@@ -23,6 +23,17 @@ except ImportError:
     yf = None
     logger.warning("yfinance not installed - Yahoo Finance functionality unavailable")
 
+# Cache TTL (hours) per dataset, matched to how often Yahoo actually changes it:
+# statements only move with quarterly filings, info/history daily.
+TTL_BY_KIND: Dict[str, float] = {
+    "quote": 0.25,
+    "info": 24,
+    "analyst_data": 24,
+    "history_daily": 24,
+    "financials": 90 * 24,
+    "balance_sheet": 90 * 24,
+}
+
 
 def _configure_yfinance_cache() -> None:
     """
@@ -93,13 +104,68 @@ def _retry_call(fn, *, retries: int = 3, backoff: float = 1.0) -> Any:
     raise RuntimeError("Retry logic failed without exception")
 
 
+def _date_label(value: Any) -> Any:
+    """Format Timestamp/datetime values as YYYY-MM-DD; pass others through."""
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def _index_label(value: Any) -> str:
+    """Index label as YYYY-MM-DD for dates, str() otherwise."""
+    return value.strftime("%Y-%m-%d") if hasattr(value, "strftime") else str(value)
+
+
+def _df_to_json_dict(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Convert a yfinance statement DataFrame to {line_item: {date: value}}.
+
+    DataFrames from yfinance have rows=line items, columns=dates.
+    """
+    if df.empty:
+        return {}
+    df_copy = df.copy()
+    # Convert column names (dates) to strings
+    if hasattr(df_copy.columns, 'strftime'):
+        df_copy.columns = df_copy.columns.strftime('%Y-%m-%d')
+    else:
+        df_copy.columns = [str(col) for col in df_copy.columns]
+    # Use orient='index' to get {row_name: {column_name: value}}
+    return df_copy.to_dict(orient='index')
+
+
+def _df_to_index_dict(df: Any) -> Dict[str, Any]:
+    """Convert an analyst DataFrame to {index_label: {column: value}}."""
+    if df is None or (hasattr(df, "empty") and getattr(df, "empty")):
+        return {}
+
+    df_copy = df.copy()
+
+    # Normalize index
+    if hasattr(df_copy.index, "strftime"):
+        df_copy.index = df_copy.index.map(_index_label)
+    else:
+        df_copy.index = [str(idx) for idx in df_copy.index]
+
+    # Normalize columns
+    if hasattr(df_copy.columns, "strftime"):
+        df_copy.columns = df_copy.columns.strftime("%Y-%m-%d")
+    else:
+        df_copy.columns = [str(col) for col in df_copy.columns]
+
+    df_copy = df_copy.applymap(_date_label)
+
+    return df_copy.to_dict(orient="index")
+
+
 def fetch_history(
     symbol: str,
     *,
     period: str = "1y",
+    days: Optional[int] = None,
     interval: str = "1d",
     use_cache: bool = True,
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: float = TTL_BY_KIND["history_daily"]
 ) -> Dict[str, Any]:
     """
     Fetch historical price data.
@@ -107,6 +173,7 @@ def fetch_history(
     Args:
         symbol: Ticker symbol (e.g., "AAPL")
         period: Time period (e.g., "1y", "2y", "5y", "max")
+        days: Fetch exactly the last N calendar days instead of ``period``
         interval: Data interval (e.g., "1d", "1wk", "1mo")
         use_cache: Whether to use cache
         cache_ttl_hours: Cache TTL in hours
@@ -117,13 +184,16 @@ def fetch_history(
             "data": [
                 {"Date": "2024-01-01", "Open": 150.0, "High": 152.0, ...},
                 ...
-            ]
+            ],
+            "timestamps": [1704067200, ...]  # epoch seconds, one per row
         }
     """
     if yf is None:
         raise RuntimeError("yfinance is not installed. Run: pip install yfinance")
 
-    cache_key = f"history_{period}_{interval}"
+    # v2: payload carries typed "timestamps" next to the row dicts
+    window = f"{days}d" if days is not None else period
+    cache_key = f"history_v2_{window}_{interval}"
     cache = SQLiteCache(ttl_hours=cache_ttl_hours)
 
     # Try cache first
@@ -136,11 +206,24 @@ def fetch_history(
     # Fetch from yfinance
     def _fetch():
         ticker = yf.Ticker(normalize_symbol(symbol))
-        hist = ticker.history(period=period, interval=interval, auto_adjust=False)
+        if days is not None:
+            start = datetime.now() - timedelta(days=days)
+            hist = ticker.history(start=start, interval=interval, auto_adjust=False)
+        else:
+            hist = ticker.history(period=period, interval=interval, auto_adjust=False)
 
         if hist.empty:
             logger.warning(f"No historical data for {symbol}")
-            return {"symbol": normalize_symbol(symbol), "data": []}
+            return {"symbol": normalize_symbol(symbol), "data": [], "timestamps": []}
+
+        # Epoch seconds per row (UTC midnight of the trading day), read once
+        # from the DatetimeIndex so consumers don't re-parse the Date strings
+        index = pd.DatetimeIndex(hist.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        timestamps = (
+            index.normalize().values.astype("datetime64[s]").astype("int64").tolist()
+        )
 
         # Convert to JSON-friendly format
         hist = hist.reset_index()
@@ -154,7 +237,8 @@ def fetch_history(
 
         return {
             "symbol": normalize_symbol(symbol),
-            "data": data
+            "data": data,
+            "timestamps": timestamps
         }
 
     result = _retry_call(_fetch)
@@ -170,7 +254,7 @@ def fetch_financials(
     symbol: str,
     *,
     use_cache: bool = True,
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: float = TTL_BY_KIND["financials"]
 ) -> Dict[str, Any]:
     """
     Fetch annual financial statements (Income Statement, Cash Flow).
@@ -180,7 +264,7 @@ def fetch_financials(
     Args:
         symbol: Ticker symbol
         use_cache: Whether to use cache
-        cache_ttl_hours: Cache TTL (default 24h for fundamentals)
+        cache_ttl_hours: Cache TTL (default 90 days; statements change quarterly)
 
     Returns:
         {
@@ -216,27 +300,12 @@ def fetch_financials(
         quarterly_cf = ticker.quarterly_cashflow
         quarterly_fin = ticker.quarterly_financials
 
-        # Convert DataFrames to dict - need to handle Timestamp columns
-        def df_to_json_dict(df):
-            if df.empty:
-                return {}
-            # DataFrames from yfinance: rows=line items, columns=dates
-            # We want: {line_item: {date: value}}
-            df_copy = df.copy()
-            # Convert column names (dates) to strings
-            if hasattr(df_copy.columns, 'strftime'):
-                df_copy.columns = df_copy.columns.strftime('%Y-%m-%d')
-            else:
-                df_copy.columns = [str(col) for col in df_copy.columns]
-            # Use orient='index' to get {row_name: {column_name: value}}
-            return df_copy.to_dict(orient='index')
-
         result = {
             "symbol": normalize_symbol(symbol),
-            "cashflow": df_to_json_dict(cashflow),
-            "financials": df_to_json_dict(financials),
-            "quarterly_cashflow": df_to_json_dict(quarterly_cf),
-            "quarterly_financials": df_to_json_dict(quarterly_fin)
+            "cashflow": _df_to_json_dict(cashflow),
+            "financials": _df_to_json_dict(financials),
+            "quarterly_cashflow": _df_to_json_dict(quarterly_cf),
+            "quarterly_financials": _df_to_json_dict(quarterly_fin)
         }
 
         logger.info(
@@ -260,7 +329,7 @@ def fetch_balance_sheet(
     symbol: str,
     *,
     use_cache: bool = True,
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: float = TTL_BY_KIND["balance_sheet"]
 ) -> Dict[str, Any]:
     """
     Fetch balance sheet data.
@@ -299,23 +368,10 @@ def fetch_balance_sheet(
         balance_sheet = ticker.balance_sheet  # Annual
         quarterly_bs = ticker.quarterly_balance_sheet  # Quarterly
 
-        # Convert DataFrames to dict - handle Timestamp columns
-        def df_to_json_dict(df):
-            if df.empty:
-                return {}
-            df_copy = df.copy()
-            # Convert column names (dates) to strings
-            if hasattr(df_copy.columns, 'strftime'):
-                df_copy.columns = df_copy.columns.strftime('%Y-%m-%d')
-            else:
-                df_copy.columns = [str(col) for col in df_copy.columns]
-            # Use orient='index' to get {row_name: {column_name: value}}
-            return df_copy.to_dict(orient='index')
-
         result = {
             "symbol": normalize_symbol(symbol),
-            "balance_sheet": df_to_json_dict(balance_sheet),
-            "quarterly_balance_sheet": df_to_json_dict(quarterly_bs)
+            "balance_sheet": _df_to_json_dict(balance_sheet),
+            "quarterly_balance_sheet": _df_to_json_dict(quarterly_bs)
         }
 
         logger.info(
@@ -338,7 +394,7 @@ def fetch_info(
     symbol: str,
     *,
     use_cache: bool = True,
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: float = TTL_BY_KIND["info"]
 ) -> Dict[str, Any]:
     """
     Fetch comprehensive stock info/metadata.
@@ -402,7 +458,7 @@ def fetch_analyst_data(
     symbol: str,
     *,
     use_cache: bool = True,
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: float = TTL_BY_KIND["analyst_data"]
 ) -> Dict[str, Any]:
     """
     Fetch analyst-related data: price targets, recommendations, earnings dates.
@@ -421,35 +477,6 @@ def fetch_analyst_data(
             logger.debug(f"Cache hit for {symbol} {cache_key}")
             return cached
 
-    def _df_to_index_dict(df: Any) -> Dict[str, Any]:
-        if df is None or (hasattr(df, "empty") and getattr(df, "empty")):
-            return {}
-
-        df_copy = df.copy()
-
-        def normalize_value(value: Any) -> Any:
-            if isinstance(value, (pd.Timestamp, datetime)):
-                return value.strftime("%Y-%m-%d")
-            return value
-
-        # Normalize index
-        if hasattr(df_copy.index, "strftime"):
-            df_copy.index = df_copy.index.map(
-                lambda x: x.strftime("%Y-%m-%d") if hasattr(x, "strftime") else str(x)
-            )
-        else:
-            df_copy.index = [str(idx) for idx in df_copy.index]
-
-        # Normalize columns
-        if hasattr(df_copy.columns, "strftime"):
-            df_copy.columns = df_copy.columns.strftime("%Y-%m-%d")
-        else:
-            df_copy.columns = [str(col) for col in df_copy.columns]
-
-        df_copy = df_copy.applymap(normalize_value)
-
-        return df_copy.to_dict(orient="index")
-
     def _fetch():
         ticker = yf.Ticker(normalize_symbol(symbol))
 
@@ -472,7 +499,7 @@ def fetch_all_dcf_data(
     symbol: str,
     *,
     use_cache: bool = True,
-    cache_ttl_hours: int = 24
+    cache_ttl_hours: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to fetch all data needed for DCF valuation.
@@ -482,7 +509,7 @@ def fetch_all_dcf_data(
     Args:
         symbol: Ticker symbol
         use_cache: Whether to use cache
-        cache_ttl_hours: Cache TTL
+        cache_ttl_hours: Cache TTL applied to every dataset (default: TTL_BY_KIND)
 
     Returns:
         {
@@ -495,10 +522,13 @@ def fetch_all_dcf_data(
     """
     logger.info(f"Fetching all DCF data for {symbol}")
 
+    def _ttl(kind: str) -> float:
+        return TTL_BY_KIND[kind] if cache_ttl_hours is None else cache_ttl_hours
+
     return {
         "symbol": normalize_symbol(symbol),
-        "financials": fetch_financials(symbol, use_cache=use_cache, cache_ttl_hours=cache_ttl_hours),
-        "balance_sheet": fetch_balance_sheet(symbol, use_cache=use_cache, cache_ttl_hours=cache_ttl_hours),
-        "info": fetch_info(symbol, use_cache=use_cache, cache_ttl_hours=cache_ttl_hours),
-        "history": fetch_history(symbol, period="1y", use_cache=use_cache, cache_ttl_hours=cache_ttl_hours)
+        "financials": fetch_financials(symbol, use_cache=use_cache, cache_ttl_hours=_ttl("financials")),
+        "balance_sheet": fetch_balance_sheet(symbol, use_cache=use_cache, cache_ttl_hours=_ttl("balance_sheet")),
+        "info": fetch_info(symbol, use_cache=use_cache, cache_ttl_hours=_ttl("info")),
+        "history": fetch_history(symbol, period="1y", use_cache=use_cache, cache_ttl_hours=_ttl("history_daily"))
     }
@@ -0,0 +1,151 @@
+"""
+yfinance info field maps
+
+Table-driven projections of a yfinance ``Ticker.info`` dict into the output
+shapes used by YFinanceClient (Finnhub-compatible) and yfinance_batch.py.
+Each map is a tuple of ``(output key, info keys in fallback order)``; the
+first non-None info value wins.
+
+No third-party imports, so standalone scripts can load it cheaply.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+FieldMap = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+# YFinanceClient.get_quote (Finnhub quote shape)
+QUOTE_MAP: FieldMap = (
+    ("c", ("currentPrice", "regularMarketPrice")),
+    ("h", ("dayHigh", "regularMarketDayHigh")),
+    ("l", ("dayLow", "regularMarketDayLow")),
+    ("o", ("open", "regularMarketOpen")),
+    ("pc", ("previousClose", "regularMarketPreviousClose")),
+)
+
+# YFinanceClient.get_company_profile (Finnhub profile shape)
+PROFILE_MAP: FieldMap = (
+    ("name", ("longName", "shortName")),
+    ("shareOutstanding", ("sharesOutstanding",)),
+    ("marketCapitalization", ("marketCap",)),
+    ("country", ("country",)),
+    ("currency", ("currency",)),
+    ("exchange", ("exchange",)),
+    ("industry", ("industry",)),
+    ("sector", ("sector",)),
+    ("ipo", ("ipoDate",)),
+)
+
+# YFinanceClient.get_basic_financials metric block (Finnhub metric keys)
+METRIC_MAP: FieldMap = (
+    # Price & Valuation
+    ("currentPrice", ("currentPrice", "regularMarketPrice")),
+    ("marketCapitalization", ("marketCap",)),
+
+    # Profitability
+    ("beta", ("beta",)),
+    ("roeTTM", ("returnOnEquity",)),
+    ("roaTTM", ("returnOnAssets",)),
+    ("roiTTM", ("returnOnInvestment",)),  # Proxy for ROIC
+
+    # Margins
+    ("grossMarginTTM", ("grossMargins",)),
+    ("operatingMarginTTM", ("operatingMargins",)),
+    ("profitMarginTTM", ("profitMargins",)),
+
+    # Valuation Ratios
+    ("pb", ("priceToBook",)),
+    ("pbQuarterly", ("priceToBook",)),  # Same for yfinance
+    ("peTTM", ("trailingPE",)),
+    ("peForward", ("forwardPE",)),
+    ("evEbitdaTTM", ("enterpriseToEbitda",)),
+    ("debtToEquity", ("debtToEquity",)),
+
+    # Shares
+    ("sharesOutstanding", ("sharesOutstanding",)),
+
+    # Growth
+    ("revenueGrowthTTM", ("revenueGrowth",)),
+    ("earningsGrowthTTM", ("earningsGrowth",)),
+
+    # Dividend
+    ("dividendYieldTTM", ("dividendYield",)),
+
+    # Additional useful fields
+    ("enterpriseValue", ("enterpriseValue",)),
+    ("freeCashflow", ("freeCashflow",)),  # TTM from info
+)
+
+# yfinance_batch.py 'basic_financials' (raw yfinance-style keys)
+BATCH_FINANCIALS_MAP: FieldMap = (
+    ("marketCap", ("marketCap",)),
+    ("enterpriseValue", ("enterpriseValue",)),
+    ("trailingPE", ("trailingPE",)),
+    ("forwardPE", ("forwardPE",)),
+    ("priceToBook", ("priceToBook",)),
+    ("priceToSales", ("priceToSalesTrailing12Months",)),
+    ("profitMargin", ("profitMargins",)),
+    ("grossMargins", ("grossMargins",)),
+    ("operatingMargins", ("operatingMargins",)),
+    ("netMargins", ("profitMargins",)),
+    ("returnOnEquity", ("returnOnEquity",)),
+    ("returnOnAssets", ("returnOnAssets",)),
+    ("roic", ("returnOnCapital",)),
+    ("debtToEquity", ("debtToEquity",)),
+    ("currentRatio", ("currentRatio",)),
+    ("quickRatio", ("quickRatio",)),
+    ("revenueGrowth", ("revenueGrowth",)),
+    ("earningsGrowth", ("earningsGrowth",)),
+    ("dividendYield", ("dividendYield",)),
+    ("trailingAnnualDividendYield", ("trailingAnnualDividendYield",)),
+    ("payoutRatio", ("payoutRatio",)),
+    ("freeCashFlow", ("freeCashflow",)),
+    ("evToEbitda", ("enterpriseToEbitda",)),
+    ("beta", ("beta",)),
+)
+
+# yfinance_batch.py 'analyst_data'
+BATCH_ANALYST_MAP: FieldMap = (
+    ("target_mean", ("targetMeanPrice",)),
+    ("target_low", ("targetLowPrice",)),
+    ("target_high", ("targetHighPrice",)),
+    ("num_analysts", ("numberOfAnalystOpinions",)),
+    ("recommendation", ("recommendationKey",)),
+)
+
+# yfinance_batch.py 'profile'
+BATCH_PROFILE_MAP: FieldMap = (
+    ("name", ("longName", "shortName")),
+    ("country", ("country",)),
+    ("industry", ("industry",)),
+    ("sector", ("sector",)),
+    ("logo", ("logo_url",)),
+    ("weburl", ("website",)),
+    ("ipo", ("ipoDate",)),
+)
+
+
+def _first(info: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[Any]:
+    get = info.get
+    for key in keys:
+        value = get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def project(info: Dict[str, Any], mapping: FieldMap, drop_none: bool = False) -> Dict[str, Any]:
+    """
+    Project ``info`` through ``mapping`` into a new dict.
+
+    Args:
+        info: yfinance Ticker.info dict
+        mapping: One of the *_MAP tables above
+        drop_none: Omit keys whose value is None instead of emitting null
+
+    Returns:
+        Dict keyed by the mapping's output keys, in mapping order
+    """
+    if drop_none:
+        pairs = ((out, _first(info, keys)) for out, keys in mapping)
+        return {k: v for k, v in pairs if v is not None}
+    return {out: _first(info, keys) for out, keys in mapping}
@@ -18,10 +18,18 @@ Based on:
 """
 
 import logging
-from typing import Any, Dict, Optional, List
-from datetime import datetime
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Optional, List, Tuple
+import numpy as np
 import pandas as pd
 
+from .cache import SQLiteCache
+from .yf_fields import METRIC_MAP, PROFILE_MAP, QUOTE_MAP, project
 from .yf_client import (
     fetch_all_dcf_data,
     fetch_history,
@@ -29,11 +37,102 @@ from .yf_client import (
     fetch_balance_sheet,
     fetch_info,
     fetch_analyst_data,
-    normalize_symbol
+    normalize_symbol,
+    TTL_BY_KIND,
 )
 
 logger = logging.getLogger(__name__)
 
+# Process-wide memo of raw yfinance payloads shared by every YFinanceClient:
+# (endpoint, symbol) -> (monotonic expiry, payload)
+_SHARED_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_SHARED_CACHE_MAXSIZE = 4096
+_SHARED_CACHE_LOCK = threading.Lock()
+# Fetches currently running, so concurrent callers of one key share a request
+_INFLIGHT: Dict[Tuple[str, str], Future] = {}
+
+# Threads for a client's concurrent per-symbol statement fetches
+_FETCH_POOL_WORKERS = 16
+
+# Row fields of fetch_history() records, in candle output order
+_CANDLE_FIELDS = itemgetter("Close", "High", "Low", "Open", "Volume")
+
+# get_candles fetches history in multiples of this many days
+_CANDLE_WINDOW_DAYS = 30
+
+# Balance-sheet line items to try, in order, for each Finnhub metric
+_BALANCE_SHEET_ALIASES: Dict[str, tuple] = {
+    "totalDebt": ("Total Debt", "TotalDebt", "Long Term Debt", "LongTermDebt"),
+    "totalEquity": (
+        "Total Equity",
+        "Stockholders Equity",
+        "StockholdersEquity",
+        "Total Stockholder Equity",
+        "Stockholder Equity",
+    ),
+}
+
+# (series name, fin_data statement, candidate line items in priority order)
+_SERIES_SPEC = (
+    ("freeCashFlow", "cashflow", ("Free Cash Flow", "FreeCashFlow", "Operating Cash Flow")),
+    ("netIncome", "financials", ("Net Income", "NetIncome", "Net Income Common Stockholders")),
+    ("revenue", "financials", ("Total Revenue", "TotalRevenue", "Revenue")),
+)
+
+
+@lru_cache(maxsize=4096)
+def _ts_key(value: Any) -> pd.Timestamp:
+    """
+    Sort key for yfinance date keys (strings or Timestamps).
+
+    Memoized: statement dates repeat across line items and across symbols
+    (fiscal year-ends), so each distinct key is parsed once per process.
+    """
+    return value if isinstance(value, pd.Timestamp) else pd.Timestamp(value)
+
+
+def _latest_nonnull(date_values: Dict[Any, Any]) -> Optional[float]:
+    """Value at the most recent date, or None if empty or NaN."""
+    if not date_values:
+        return None
+    latest_val = date_values[max(date_values, key=_ts_key)]
+    if latest_val is None or pd.isna(latest_val):
+        return None
+    return float(latest_val)
+
+
+def _trim_candles(candles: Dict[str, Any], cutoff: int) -> Dict[str, Any]:
+    """Drop candles older than ``cutoff`` (epoch seconds); "t" is ascending."""
+    timestamps = candles.get("t")
+    if not timestamps:
+        return candles
+
+    start = bisect_left(timestamps, cutoff)
+    if start == 0:
+        return candles
+
+    trimmed = {key: candles[key][start:] for key in ("c", "h", "l", "o", "t", "v")}
+    trimmed["s"] = "ok" if trimmed["t"] else "no_data"
+    return trimmed
+
+
+def _pack_series(periods: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Drop rows with a missing date or value and order them newest first.
+
+    Args:
+        periods: datetime64 array (NaT for unparseable dates)
+        values: float64 array (NaN for missing values)
+
+    Returns:
+        (periods, values) as contiguous arrays of equal length
+    """
+    keep = ~(np.isnat(periods) | np.isnan(values))
+    periods = periods[keep]
+    values = values[keep]
+    order = np.argsort(periods, kind="stable")[::-1]
+    return periods[order], values[order]
+
 
 class YFinanceClient:
     """
@@ -43,16 +142,95 @@ class YFinanceClient:
     Can be used as a drop-in replacement for hybrid data sourcing.
     """
 
-    def __init__(self, cache_ttl_hours: int = 24):
+    def __init__(self, cache_ttl_hours: int = 24, persist_results: bool = True):
         """
         Initialize yfinance client.
 
         Args:
-            cache_ttl_hours: Cache TTL for all yfinance requests
+            cache_ttl_hours: Cache TTL for converted results; raw yfinance
+                payloads use the per-dataset TTL_BY_KIND from yf_client
+            persist_results: Also cache the converted Finnhub-format results,
+                so repeated runs skip the yfinance dict walk entirely
         """
         self.cache_ttl_hours = cache_ttl_hours
+        self.persist_results = persist_results
+        self._result_cache: Optional[SQLiteCache] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
         logger.info(f"Initialized YFinanceClient (cache TTL: {cache_ttl_hours}h)")
 
+    def _shared_fetch(self, endpoint: str, fetch_fn: Any, symbol: str) -> Dict[str, Any]:
+        """
+        Call a yf_client fetch function through the process-wide memo.
+
+        Warm processes (notebooks, servers, batch loops) get the same payload
+        back without touching SQLite or re-decoding JSON. Concurrent misses on
+        the same key are coalesced: one thread fetches, the others wait on
+        its result.
+        """
+        key = (endpoint, normalize_symbol(symbol))
+        now = time.monotonic()
+        entry = _SHARED_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        with _SHARED_CACHE_LOCK:
+            entry = _SHARED_CACHE.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            pending = _INFLIGHT.get(key)
+            if pending is None:
+                pending = _INFLIGHT[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return pending.result()
+
+        ttl_hours = TTL_BY_KIND[endpoint]
+        try:
+            value = fetch_fn(symbol, cache_ttl_hours=ttl_hours)
+        except BaseException as exc:
+            with _SHARED_CACHE_LOCK:
+                _INFLIGHT.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with _SHARED_CACHE_LOCK:
+            if key not in _SHARED_CACHE and len(_SHARED_CACHE) >= _SHARED_CACHE_MAXSIZE:
+                # Evict the oldest insertion
+                _SHARED_CACHE.pop(next(iter(_SHARED_CACHE)))
+            _SHARED_CACHE[key] = (now + ttl_hours * 3600, value)
+            _INFLIGHT.pop(key, None)
+        pending.set_result(value)
+        return value
+
+    def _fetch_pool(self) -> ThreadPoolExecutor:
+        """Executor shared by all calls on this client (created on first use)."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=_FETCH_POOL_WORKERS,
+                        thread_name_prefix="yfinance-fetch",
+                    )
+        return self._pool
+
+    def _get_cached_result(self, symbol: str, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Return a previously converted result, or None on miss."""
+        if not self.persist_results:
+            return None
+        if self._result_cache is None:
+            self._result_cache = SQLiteCache(
+                ttl_hours=self.cache_ttl_hours, provider="yfinance_adapter"
+            )
+        return self._result_cache.get(normalize_symbol(symbol), endpoint)
+
+    def _set_cached_result(self, symbol: str, endpoint: str, result: Dict[str, Any]) -> None:
+        """Store a converted result under (symbol, endpoint)."""
+        if not self.persist_results or self._result_cache is None:
+            return
+        self._result_cache.set(normalize_symbol(symbol), endpoint, result)
+
     def get_basic_financials(self, symbol: str) -> Dict[str, Any]:
         """
         Fetch basic financials in Finnhub-compatible format.
@@ -87,10 +265,22 @@ class YFinanceClient:
             }
         """
         try:
-            # Fetch all data needed
-            info_data = fetch_info(symbol, cache_ttl_hours=self.cache_ttl_hours)
-            fin_data = fetch_financials(symbol, cache_ttl_hours=self.cache_ttl_hours)
-            bs_data = fetch_balance_sheet(symbol, cache_ttl_hours=self.cache_ttl_hours)
+            cached = self._get_cached_result(symbol, "basic_financials")
+            if cached is not None:
+                return cached
+
+            # Fetch all data needed; the three requests are independent, so
+            # statements load on the pool while info loads on this thread
+            pool = self._fetch_pool()
+            fin_future = pool.submit(
+                self._shared_fetch, "financials", fetch_financials, symbol
+            )
+            bs_future = pool.submit(
+                self._shared_fetch, "balance_sheet", fetch_balance_sheet, symbol
+            )
+            info_data = self._shared_fetch("info", fetch_info, symbol)
+            fin_data = fin_future.result()
+            bs_data = bs_future.result()
 
             info = info_data.get("info", {})
 
@@ -106,20 +296,82 @@ class YFinanceClient:
             }
 
             logger.debug(
-                f"{symbol}: Built financials with {len(metric)} metrics, "
-                f"{len(series.get('annual', {}))} annual series"
+                "%s: Built financials with %d metrics, %d annual series",
+                symbol,
+                len(metric),
+                len(series.get("annual", {})),
             )
 
+            if metric:
+                self._set_cached_result(symbol, "basic_financials", result)
+
             return result
 
         except Exception as e:
             logger.error(f"{symbol}: Failed to fetch basic financials: {e}")
             return {"metric": {}, "series": {}}
 
-    def get_quote(self, symbol: str) -> Dict[str, Any]:
+    def get_basic_financials_batch(
+        self,
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch basic financials for many symbols concurrently.
+
+        Each symbol is independent and dominated by network/SQLite I/O, so a
+        thread pool gives near-linear speedup for screeners.
+
+        Args:
+            symbols: Ticker symbols
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            Dict mapping symbol -> get_basic_financials() result
+        """
+        if not symbols:
+            return {}
+
+        workers = max(1, min(max_workers, len(symbols)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.get_basic_financials, symbols)
+            return dict(zip(symbols, results))
+
+    def get_quote_batch(
+        self,
+        symbols: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch quotes for many symbols concurrently.
+
+        All quotes share one timestamp taken before the fetches start.
+
+        Args:
+            symbols: Ticker symbols
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            Dict mapping symbol -> get_quote() result
+        """
+        if not symbols:
+            return {}
+
+        now_ts = int(time.time())
+        workers = max(1, min(max_workers, len(symbols)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda s: self.get_quote(s, now_ts=now_ts), symbols)
+            return dict(zip(symbols, results))
+
+    def get_quote(self, symbol: str, now_ts: Optional[int] = None) -> Dict[str, Any]:
         """
         Fetch current quote.
 
+        Args:
+            symbol: Ticker symbol
+            now_ts: Epoch seconds to stamp the quote with; batch callers pass
+                one value for all symbols instead of reading the clock each time
+
         Returns:
             {
                 "c": 150.0,  # current price
@@ -131,20 +383,13 @@ class YFinanceClient:
             }
         """
         try:
-            info_data = fetch_info(symbol, cache_ttl_hours=self.cache_ttl_hours)
+            info_data = self._shared_fetch("info", fetch_info, symbol)
             info = info_data.get("info", {})
 
-            # Extract quote fields
-            quote = {
-                "c": info.get("currentPrice") or info.get("regularMarketPrice"),
-                "h": info.get("dayHigh") or info.get("regularMarketDayHigh"),
-                "l": info.get("dayLow") or info.get("regularMarketDayLow"),
-                "o": info.get("open") or info.get("regularMarketOpen"),
-                "pc": info.get("previousClose") or info.get("regularMarketPreviousClose"),
-                "t": int(datetime.now().timestamp())
-            }
+            quote = project(info, QUOTE_MAP)
+            quote["t"] = now_ts if now_ts is not None else int(time.time())
 
-            logger.debug(f"{symbol}: Quote - current price: ${quote.get('c')}")
+            logger.debug("%s: Quote - current price: %s", symbol, quote.get("c"))
             return quote
 
         except Exception as e:
@@ -169,23 +414,19 @@ class YFinanceClient:
             }
         """
         try:
-            info_data = fetch_info(symbol, cache_ttl_hours=self.cache_ttl_hours)
+            info_data = self._shared_fetch("info", fetch_info, symbol)
             info = info_data.get("info", {})
 
-            profile = {
-                "name": info.get("longName") or info.get("shortName"),
-                "ticker": normalize_symbol(symbol),
-                "shareOutstanding": info.get("sharesOutstanding"),
-            "marketCapitalization": info.get("marketCap"),
-            "country": info.get("country"),
-            "currency": info.get("currency"),
-            "exchange": info.get("exchange"),
-            "industry": info.get("industry"),
-            "sector": info.get("sector"),
-            "ipo": info.get("ipoDate")
-        }
+            profile = project(info, PROFILE_MAP)
+            profile["ticker"] = normalize_symbol(symbol)
 
-            logger.debug(f"{symbol}: Profile - shares: {profile.get('shareOutstanding'):,}")
+            if logger.isEnabledFor(logging.DEBUG):
+                shares = profile.get("shareOutstanding")
+                logger.debug(
+                    "%s: Profile - shares: %s",
+                    symbol,
+                    format(shares, ",") if shares is not None else "n/a",
+                )
             return profile
 
         except Exception as e:
@@ -216,10 +457,18 @@ class YFinanceClient:
         }
 
         try:
-            analyst_data = fetch_analyst_data(
-                symbol, cache_ttl_hours=self.cache_ttl_hours
+            analyst_data = self._shared_fetch(
+                "analyst_data", fetch_analyst_data, symbol
             )
 
+            # No analyst coverage (common for small caps): skip all row scans
+            if not (
+                analyst_data.get("price_targets")
+                or analyst_data.get("recommendations")
+                or analyst_data.get("earnings_dates")
+            ):
+                return empty
+
             targets_row = self._latest_row(analyst_data.get("price_targets"))
             rec_row = self._latest_row(analyst_data.get("recommendations"))
             next_earnings_date = self._extract_next_earnings_date(
@@ -282,27 +531,21 @@ class YFinanceClient:
             }
         """
         try:
-            # Convert days_back to yfinance period
-            if days_back <= 7:
-                period = "1wk"
-            elif days_back <= 30:
-                period = "1mo"
-            elif days_back <= 90:
-                period = "3mo"
-            elif days_back <= 180:
-                period = "6mo"
-            elif days_back <= 365:
-                period = "1y"
-            elif days_back <= 730:
-                period = "2y"
-            else:
-                period = "5y"
+            # Fetch a window rounded up to whole 30-day buckets so nearby
+            # days_back values share one cache entry, then trim to the request
+            window = max(1, -(-days_back // _CANDLE_WINDOW_DAYS)) * _CANDLE_WINDOW_DAYS
+            cutoff = (int(time.time()) // 86400 - days_back) * 86400
+
+            cache_endpoint = f"candles_{window}d"
+            cached = self._get_cached_result(symbol, cache_endpoint)
+            if cached is not None:
+                return _trim_candles(cached, cutoff)
 
             hist_data = fetch_history(
                 symbol,
-                period=period,
+                days=window,
                 interval="1d",
-                cache_ttl_hours=self.cache_ttl_hours
+                cache_ttl_hours=TTL_BY_KIND["history_daily"]
             )
 
             data = hist_data.get("data", [])
@@ -311,36 +554,26 @@ class YFinanceClient:
                 logger.warning(f"{symbol}: No candle data available")
                 return {"s": "no_data"}
 
-            # Convert list of dicts to Finnhub format (lists of values)
+            # Convert list of dicts to Finnhub format (lists of values):
+            # one C-level itemgetter call per row, then transpose into columns
+            closes, highs, lows, opens, volumes = (
+                list(column) for column in zip(*map(_CANDLE_FIELDS, data))
+            )
+
             candles = {
-                "c": [],
-                "h": [],
-                "l": [],
-                "o": [],
-                "t": [],
-                "v": [],
+                "c": closes,
+                "h": highs,
+                "l": lows,
+                "o": opens,
+                # Epoch seconds typed at ingest by fetch_history
+                "t": list(hist_data["timestamps"]),
+                "v": volumes,
                 "s": "ok"
             }
 
-            for row in data:
-                candles["c"].append(row.get("Close"))
-                candles["h"].append(row.get("High"))
-                candles["l"].append(row.get("Low"))
-                candles["o"].append(row.get("Open"))
-
-                # Convert date to timestamp
-                date_str = row.get("Date")
-                if isinstance(date_str, str):
-                    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    candles["t"].append(int(dt.timestamp()))
-                else:
-                    # Already a timestamp or datetime
-                    candles["t"].append(int(date_str) if isinstance(date_str, (int, float)) else 0)
-
-                candles["v"].append(row.get("Volume", 0))
-
-            logger.debug(f"{symbol}: Fetched {len(candles['c'])} candles")
-            return candles
+            logger.debug("%s: Fetched %d candles", symbol, len(candles["c"]))
+            self._set_cached_result(symbol, cache_endpoint, candles)
+            return _trim_candles(candles, cutoff)
 
         except Exception as e:
             logger.error(f"{symbol}: Failed to fetch candles: {e}")
@@ -358,92 +591,33 @@ class YFinanceClient:
         Maps yfinance field names to Finnhub field names.
         """
         # Get most recent balance sheet data
+        # bs is a dict where each key is a line item, and values are dicts of {date: value}
         bs = bs_data.get("balance_sheet", {})
-        bs_latest = {}
-
-        # Extract debt and equity from balance sheet
-        total_debt = None
-        total_equity = None
+        bs_values: Dict[str, float] = {}
 
         if bs and isinstance(bs, dict):
             # Try various field names (yfinance naming can vary)
-            debt_fields = ["Total Debt", "TotalDebt", "Long Term Debt", "LongTermDebt"]
-            equity_fields = ["Total Equity", "Stockholders Equity", "StockholdersEquity",
-                           "Total Stockholder Equity", "Stockholder Equity"]
-
-            # bs is a dict where each key is a line item, and values are dicts of {date: value}
-            for field in debt_fields:
-                if field in bs and isinstance(bs[field], dict):
-                    # Get the most recent value (sort dates desc)
-                    date_values = bs[field]
-                    if date_values:
-                        # Convert Timestamp keys to strings for comparison
-                        sorted_dates = sorted(date_values.keys(), reverse=True,
-                                             key=lambda x: pd.Timestamp(x) if not isinstance(x, pd.Timestamp) else x)
-                        if sorted_dates:
-                            latest_val = date_values[sorted_dates[0]]
-                            if latest_val is not None and not pd.isna(latest_val):
-                                total_debt = float(latest_val)
-                                break
-
-            for field in equity_fields:
-                if field in bs and isinstance(bs[field], dict):
-                    date_values = bs[field]
-                    if date_values:
-                        sorted_dates = sorted(date_values.keys(), reverse=True,
-                                             key=lambda x: pd.Timestamp(x) if not isinstance(x, pd.Timestamp) else x)
-                        if sorted_dates:
-                            latest_val = date_values[sorted_dates[0]]
-                            if latest_val is not None and not pd.isna(latest_val):
-                                total_equity = float(latest_val)
-                                break
-
-        # Build metric dict
-        metric = {
-            # Price & Valuation
-            "currentPrice": info.get("currentPrice") or info.get("regularMarketPrice"),
-            "marketCapitalization": info.get("marketCap"),
-
-            # Profitability
-            "beta": info.get("beta"),
-            "roeTTM": info.get("returnOnEquity"),
-            "roaTTM": info.get("returnOnAssets"),
-            "roiTTM": info.get("returnOnInvestment"),  # Proxy for ROIC
-
-            # Margins
-            "grossMarginTTM": info.get("grossMargins"),
-            "operatingMarginTTM": info.get("operatingMargins"),
-            "profitMarginTTM": info.get("profitMargins"),
-
-            # Valuation Ratios
-            "pb": info.get("priceToBook"),
-            "pbQuarterly": info.get("priceToBook"),  # Same for yfinance
-            "peTTM": info.get("trailingPE"),
-            "peForward": info.get("forwardPE"),
-            "evEbitdaTTM": info.get("enterpriseToEbitda"),
-
-            # Debt & Capital Structure
-            "totalDebt": total_debt,
-            "totalEquity": total_equity,
-            "debtToEquity": info.get("debtToEquity"),
-
-            # Shares
-            "sharesOutstanding": info.get("sharesOutstanding"),
-
-            # Growth
-            "revenueGrowthTTM": info.get("revenueGrowth"),
-            "earningsGrowthTTM": info.get("earningsGrowth"),
-
-            # Dividend
-            "dividendYieldTTM": info.get("dividendYield"),
-
-            # Additional useful fields
-            "enterpriseValue": info.get("enterpriseValue"),
-            "freeCashflow": info.get("freeCashflow"),  # TTM from info
-        }
+            for canonical, aliases in _BALANCE_SHEET_ALIASES.items():
+                for field in aliases:
+                    date_values = bs.get(field)
+                    if isinstance(date_values, dict):
+                        latest_val = _latest_nonnull(date_values)
+                        if latest_val is not None:
+                            bs_values[canonical] = latest_val
+                            break
+
+        total_debt = bs_values.get("totalDebt")
+        total_equity = bs_values.get("totalEquity")
+
+        metric = project(info, METRIC_MAP, drop_none=True)
+
+        # Debt & capital structure come from the balance sheet, not info
+        if total_debt is not None:
+            metric["totalDebt"] = total_debt
+        if total_equity is not None:
+            metric["totalEquity"] = total_equity
 
-        # Remove None values
-        return {k: v for k, v in metric.items() if v is not None}
+        return metric
 
     def _build_series_from_financials(
         self,
@@ -456,43 +630,26 @@ class YFinanceClient:
         Converts annual time series to Finnhub format:
         [{"period": "2023-12-31", "v": 99000000000}, ...]
         """
-        cashflow = fin_data.get("cashflow", {})
-        financials = fin_data.get("financials", {})
+        annual: Dict[str, List[Dict[str, Any]]] = {}
 
-        series = {
-            "annual": {}
-        }
-
-        # Extract Free Cash Flow
-        fcf_series = self._extract_time_series(
-            cashflow,
-            ["Free Cash Flow", "FreeCashFlow", "Operating Cash Flow"]
-        )
-        if fcf_series:
-            series["annual"]["freeCashFlow"] = fcf_series
+        # Line items of one statement share their date columns, so each
+        # distinct set of dates is parsed only once across all series.
+        parsed_indexes: Dict[tuple, np.ndarray] = {}
 
-        # Extract Net Income
-        ni_series = self._extract_time_series(
-            financials,
-            ["Net Income", "NetIncome", "Net Income Common Stockholders"]
-        )
-        if ni_series:
-            series["annual"]["netIncome"] = ni_series
-
-        # Extract Revenue
-        revenue_series = self._extract_time_series(
-            financials,
-            ["Total Revenue", "TotalRevenue", "Revenue"]
-        )
-        if revenue_series:
-            series["annual"]["revenue"] = revenue_series
+        for name, statement, field_names in _SERIES_SPEC:
+            values = self._extract_time_series(
+                fin_data.get(statement, {}), field_names, parsed_indexes
+            )
+            if values:
+                annual[name] = values
 
-        return series
+        return {"annual": annual}
 
     def _extract_time_series(
         self,
         df_dict: Dict,
-        field_names: List[str]
+        field_names: List[str],
+        parsed_indexes: Optional[Dict[tuple, np.ndarray]] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract time series from yfinance DataFrame dict.
@@ -500,45 +657,37 @@ class YFinanceClient:
         Args:
             df_dict: DataFrame as dict (from yfinance)
             field_names: List of possible field names to try
+            parsed_indexes: Optional memo of date keys -> parsed datetime64
+                array, shared between calls on the same statement
 
         Returns:
             [{"period": "2023-12-31", "v": 99000000000}, ...]
         """
         for field_name in field_names:
-            if field_name in df_dict and isinstance(df_dict[field_name], dict):
-                data = df_dict[field_name]
-
-                # data is a dict with dates as keys (potentially Timestamp objects)
-                series = []
+            data = df_dict.get(field_name)
+            if not isinstance(data, dict) or not data:
+                continue
+
+            # One vectorized date parse, then NaN drop + sort in a NumPy kernel
+            keys = tuple(data.keys())
+            periods = parsed_indexes.get(keys) if parsed_indexes is not None else None
+            if periods is None:
+                periods = pd.to_datetime(list(keys), format="ISO8601", errors="coerce").values
+                if parsed_indexes is not None:
+                    parsed_indexes[keys] = periods
+
+            periods, values = _pack_series(
+                periods, np.array(list(data.values()), dtype="float64")
+            )
+            if not len(values):
+                continue
 
-                # Sort by date (handle Timestamp objects)
-                try:
-                    sorted_items = sorted(
-                        data.items(),
-                        reverse=True,
-                        key=lambda item: pd.Timestamp(item[0]) if not isinstance(item[0], pd.Timestamp) else item[0]
-                    )
-                except Exception:
-                    # Fallback: just use items as-is
-                    sorted_items = list(data.items())
-
-                for date, value in sorted_items:
-                    if value is not None and not pd.isna(value):
-                        # Convert date to string format
-                        if isinstance(date, pd.Timestamp):
-                            period_str = date.strftime("%Y-%m-%d")
-                        elif hasattr(date, 'isoformat'):
-                            period_str = date.isoformat()[:10]  # YYYY-MM-DD
-                        else:
-                            period_str = str(date)[:10]
-
-                        series.append({
-                            "period": period_str,
-                            "v": float(value)
-                        })
-
-                if series:
-                    return series
+            return [
+                {"period": period, "v": v}
+                for period, v in zip(
+                    np.datetime_as_string(periods, unit="D").tolist(), values.tolist()
+                )
+            ]
 
         return []
 
@@ -547,15 +696,18 @@ class YFinanceClient:
             return None
 
         try:
-            sorted_keys = sorted(
-                rows.keys(),
-                reverse=True,
-                key=lambda x: pd.Timestamp(x) if not isinstance(x, pd.Timestamp) else x,
-            )
+            latest_key = max(rows, key=_ts_key)
         except Exception:
-            sorted_keys = list(rows.keys())
+            # Keys are not dates: keep insertion order
+            ordered_keys = list(rows.keys())
+        else:
+            row = rows.get(latest_key)
+            if isinstance(row, dict) and row:
+                return row
+            # Newest row is empty; fall back to scanning older rows
+            ordered_keys = sorted(rows.keys(), reverse=True, key=_ts_key)
 
-        for key in sorted_keys:
+        for key in ordered_keys:
             row = rows.get(key)
             if isinstance(row, dict) and row:
                 return row
@@ -595,38 +747,48 @@ class YFinanceClient:
 
         return None
 
-    def _extract_next_earnings_date(self, rows: Optional[Dict[str, Any]]) -> Optional[str]:
+    def _extract_next_earnings_date(
+        self,
+        rows: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Pick the next upcoming earnings date (or the most recent past one).
+
+        Args:
+            rows: earnings_dates dict keyed by date
+        """
         if not rows or not isinstance(rows, dict):
             return None
 
-        today = datetime.utcnow().date()
-        parsed_dates = []
+        keys = list(rows.keys())
+        parsed = pd.Series(
+            pd.to_datetime(keys, format="ISO8601", errors="coerce", utc=True)
+        )
 
-        for key in rows.keys():
-            row = rows.get(key) if isinstance(rows, dict) else None
-            dt = self._parse_date(key) or (row and self._parse_date(row.get("Earnings Date")))
-            if dt:
-                parsed_dates.append(dt.date())
+        # Keys that are not dates fall back to the row's "Earnings Date" column
+        missing = parsed.isna()
+        if missing.any():
+            fallback = [
+                row.get("Earnings Date") if isinstance(row, dict) else None
+                for row in (rows[key] for key in keys)
+            ]
+            parsed = parsed.fillna(
+                pd.Series(
+                    pd.to_datetime(fallback, format="ISO8601", errors="coerce", utc=True)
+                )
+            )
 
-        if not parsed_dates:
+        dates = parsed.dropna().dt.normalize()
+        if dates.empty:
             return None
 
-        future = sorted([d for d in parsed_dates if d >= today])
-        if future:
-            return future[0].isoformat()
+        today = pd.Timestamp.now(tz="UTC").normalize()
+        future = dates[dates >= today]
+        if not future.empty:
+            return future.min().strftime("%Y-%m-%d")
 
         # Fallback to the most recent past date
-        parsed_dates.sort()
-        return parsed_dates[-1].isoformat()
-
-    def _parse_date(self, value: Any) -> Optional[datetime]:
-        try:
-            ts = pd.to_datetime(value)
-            if pd.isna(ts):
-                return None
-            return ts.to_pydatetime()
-        except Exception:
-            return None
+        return dates.max().strftime("%Y-%m-%d")
 
     def close(self):
         """Close client (no-op for yfinance, kept for API compatibility)."""
@@ -10,17 +10,39 @@ import json
 import os
 import sys
 import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 try:
+    import numpy as np
     import yfinance as yf
     import pandas as pd
 except ImportError as e:
     print(json.dumps({"error": f"Missing dependency: {e}"}), file=sys.stderr)
     sys.exit(1)
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_py.yf_json import dumps
+from data_py.yf_fields import (
+    BATCH_ANALYST_MAP,
+    BATCH_FINANCIALS_MAP,
+    BATCH_PROFILE_MAP,
+    QUOTE_MAP,
+    project,
+)
+
+# Upper bound on concurrent per-symbol fetches
+MAX_WORKERS = 16
+
+# Ticker.info is reused within this window (seconds) for repeat requests
+INFO_BUCKET_SECONDS = 900
+
 
 def configure_yfinance_cache() -> None:
     """
@@ -51,10 +73,171 @@ def configure_yfinance_cache() -> None:
         )
 
 
+def _candle_window() -> Tuple[datetime, datetime]:
+    """Default candle window: the last 365 days."""
+    end_date = datetime.now()
+    return end_date - timedelta(days=365), end_date
+
+
+def _download_candles(
+    symbols: List[str],
+    start_date: datetime,
+    end_date: datetime
+) -> Dict[str, pd.DataFrame]:
+    """
+    Download daily history for all symbols with one multi-ticker request.
+
+    yf.download batches tickers into Yahoo's multi-symbol endpoint, so N
+    symbols cost a handful of HTTP calls instead of N. Symbols missing from
+    the result are simply absent and fall back to Ticker.history().
+    """
+    try:
+        hist_all = yf.download(
+            symbols,
+            start=start_date,
+            end=end_date,
+            group_by='ticker',
+            auto_adjust=True,
+            ignore_tz=False,
+            threads=True,
+            progress=False,
+        )
+    except Exception:
+        return {}
+
+    if hist_all is None or hist_all.empty:
+        return {}
+
+    frames: Dict[str, pd.DataFrame] = {}
+    if isinstance(hist_all.columns, pd.MultiIndex):
+        available = set(hist_all.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol in available:
+                # Rows are aligned across tickers; drop this ticker's padding
+                frames[symbol] = hist_all[symbol].dropna(how='all')
+    elif len(symbols) == 1:
+        frames[symbols[0]] = hist_all.dropna(how='all')
+
+    return frames
+
+
+def _column_to_list(series: pd.Series) -> List[Any]:
+    """
+    Column -> JSON-ready list with NaN as None.
+
+    Integer columns (Volume usually is int64) cannot hold NaN and skip the
+    check; float columns get one np.isnan mask instead of a per-cell test.
+    """
+    values = series.to_numpy()
+    if values.dtype.kind in 'iu':
+        return values.tolist()
+
+    values = values.astype('float64', copy=False)
+    mask = np.isnan(values)
+    if not mask.any():
+        return values.tolist()
+
+    out = values.astype(object)
+    out[mask] = None
+    return out.tolist()
+
+
+def _candles_from_history(hist: pd.DataFrame) -> Dict[str, List[Any]]:
+    """
+    Convert a history DataFrame to columnar candles.
+
+    Returns one array per field ({'t', 'close', 'high', 'low', 'volume'})
+    instead of a dict per bar, so the JSON payload carries each key once.
+    The DatetimeIndex becomes epoch seconds in one vectorized step.
+    """
+    timestamps = (
+        pd.DatetimeIndex(hist.index).values.astype('datetime64[s]').astype('int64').tolist()
+    )
+    return {
+        't': timestamps,
+        'close': _column_to_list(hist['Close']),
+        'high': _column_to_list(hist['High']),
+        'low': _column_to_list(hist['Low']),
+        'volume': _column_to_list(hist['Volume']),
+    }
+
+
+@lru_cache(maxsize=256)
+def _ticker(symbol: str) -> "yf.Ticker":
+    """Shared Ticker per symbol, so its lazily loaded data is fetched once."""
+    return yf.Ticker(symbol)
+
+
+@lru_cache(maxsize=256)
+def _cached_info(symbol: str, bucket: int) -> Dict[str, Any]:
+    """Ticker.info for one time bucket; a new bucket forces a refetch."""
+    return _ticker(symbol).info or {}
+
+
+def _fetch_one(
+    symbol: str,
+    methods: List[str],
+    history: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    """
+    Fetch the requested methods for a single symbol.
+
+    Errors are captured as {'error': ...} so one bad ticker does not abort
+    the whole batch.
+
+    Args:
+        symbol: Stock symbol
+        methods: Methods to fetch
+        history: Pre-downloaded candle history; fetched per ticker if missing
+    """
+    result: Dict[str, Any] = {}
+
+    try:
+        ticker = _ticker(symbol)
+        info = _cached_info(symbol, int(time.time() // INFO_BUCKET_SECONDS))
+
+        if 'basic_financials' in methods:
+            result['basic_financials'] = project(info, BATCH_FINANCIALS_MAP)
+
+        if 'quote' in methods:
+            result['quote'] = project(info, QUOTE_MAP)
+
+        if 'candles' in methods:
+            hist = history
+            if hist is None or hist.empty:
+                # Default: 365 days of history
+                start_date, end_date = _candle_window()
+                hist = ticker.history(start=start_date, end=end_date)
+
+            candles = {'t': [], 'close': [], 'high': [], 'low': [], 'volume': []}
+            if hist is not None and not hist.empty:
+                candles = _candles_from_history(hist)
+
+            result['candles'] = candles
+
+        if 'analyst_data' in methods:
+            analyst = project(info, BATCH_ANALYST_MAP)
+            analyst['next_earnings_date'] = None  # Would need earnings_dates call
+            result['analyst_data'] = analyst
+
+        if 'profile' in methods:
+            profile = project(info, BATCH_PROFILE_MAP)
+            profile['ticker'] = symbol
+            result['profile'] = profile
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+
 def fetch_batch(symbols: List[str], methods: List[str]) -> Dict[str, Dict[str, Any]]:
     """
     Fetch data for multiple symbols in one call.
 
+    Symbols are fetched concurrently: the work is network-bound, so a thread
+    pool overlaps the per-ticker Yahoo round trips.
+
     Args:
         symbols: List of stock symbols
         methods: List of methods to call (basic_financials, quote, candles, analyst_data, profile)
@@ -62,95 +245,22 @@ def fetch_batch(symbols: List[str], methods: List[str]) -> Dict[str, Dict[str, A
     Returns:
         Dict mapping symbol -> method -> data
     """
-    results = {}
-
-    for symbol in symbols:
-        results[symbol] = {}
-
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info or {}
-
-            if 'basic_financials' in methods:
-                results[symbol]['basic_financials'] = {
-                    'marketCap': info.get('marketCap'),
-                    'enterpriseValue': info.get('enterpriseValue'),
-                    'trailingPE': info.get('trailingPE'),
-                    'forwardPE': info.get('forwardPE'),
-                    'priceToBook': info.get('priceToBook'),
-                    'priceToSales': info.get('priceToSalesTrailing12Months'),
-                    'profitMargin': info.get('profitMargins'),
-                    'grossMargins': info.get('grossMargins'),
-                    'operatingMargins': info.get('operatingMargins'),
-                    'netMargins': info.get('profitMargins'),
-                    'returnOnEquity': info.get('returnOnEquity'),
-                    'returnOnAssets': info.get('returnOnAssets'),
-                    'roic': info.get('returnOnCapital'),
-                    'debtToEquity': info.get('debtToEquity'),
-                    'currentRatio': info.get('currentRatio'),
-                    'quickRatio': info.get('quickRatio'),
-                    'revenueGrowth': info.get('revenueGrowth'),
-                    'earningsGrowth': info.get('earningsGrowth'),
-                    'dividendYield': info.get('dividendYield'),
-                    'trailingAnnualDividendYield': info.get('trailingAnnualDividendYield'),
-                    'payoutRatio': info.get('payoutRatio'),
-                    'freeCashFlow': info.get('freeCashflow'),
-                    'evToEbitda': info.get('enterpriseToEbitda'),
-                    'beta': info.get('beta'),
-                }
-
-            if 'quote' in methods:
-                results[symbol]['quote'] = {
-                    'c': info.get('currentPrice') or info.get('regularMarketPrice'),
-                    'h': info.get('dayHigh') or info.get('regularMarketDayHigh'),
-                    'l': info.get('dayLow') or info.get('regularMarketDayLow'),
-                    'o': info.get('open') or info.get('regularMarketOpen'),
-                    'pc': info.get('previousClose') or info.get('regularMarketPreviousClose'),
-                }
-
-            if 'candles' in methods:
-                # Default: 365 days of history
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=365)
-                hist = ticker.history(start=start_date, end=end_date)
+    # Pre-seed in request order so output ordering is stable
+    results: Dict[str, Dict[str, Any]] = {symbol: {} for symbol in symbols}
+    if not symbols:
+        return results
+
+    histories: Dict[str, pd.DataFrame] = {}
+    if 'candles' in methods:
+        histories = _download_candles(list(dict.fromkeys(symbols)), *_candle_window())
 
-                candles = []
-                if hist is not None and not hist.empty:
-                    for idx, row in hist.iterrows():
-                        candles.append({
-                            't': int(idx.timestamp()),
-                            'close': float(row['Close']) if not pd.isna(row['Close']) else None,
-                            'high': float(row['High']) if not pd.isna(row['High']) else None,
-                            'low': float(row['Low']) if not pd.isna(row['Low']) else None,
-                            'volume': float(row['Volume']) if not pd.isna(row['Volume']) else None,
-                        })
-
-                results[symbol]['candles'] = candles
-
-            if 'analyst_data' in methods:
-                results[symbol]['analyst_data'] = {
-                    'target_mean': info.get('targetMeanPrice'),
-                    'target_low': info.get('targetLowPrice'),
-                    'target_high': info.get('targetHighPrice'),
-                    'num_analysts': info.get('numberOfAnalystOpinions'),
-                    'recommendation': info.get('recommendationKey'),
-                    'next_earnings_date': None,  # Would need earnings_dates call
-                }
-
-            if 'profile' in methods:
-                results[symbol]['profile'] = {
-                    'name': info.get('longName') or info.get('shortName'),
-                    'ticker': symbol,
-                    'country': info.get('country'),
-                    'industry': info.get('industry'),
-                    'sector': info.get('sector'),
-                    'logo': info.get('logo_url'),
-                    'weburl': info.get('website'),
-                    'ipo': info.get('ipoDate'),
-                }
-
-        except Exception as e:
-            results[symbol]['error'] = str(e)
+    with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_WORKERS)) as executor:
+        futures = {
+            executor.submit(_fetch_one, symbol, methods, histories.get(symbol)): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
 
     return results
 
@@ -173,7 +283,8 @@ def main():
         results = fetch_batch(symbols, methods)
 
         # Write JSON output to stdout
-        print(json.dumps(results))
+        sys.stdout.write(dumps(results))
+        sys.stdout.write('\n')
 
     except json.JSONDecodeError as e:
         print(json.dumps({"error": f"Invalid JSON input: {e}"}), file=sys.stderr)
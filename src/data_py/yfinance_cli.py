@@ -3,35 +3,119 @@
 CLI wrapper for YFinanceClient - invoked by TypeScript via child_process.
 
 Usage:
+    python3 yfinance_cli.py --symbols AAPL,MSFT --methods basic_financials,quote
+    echo '{"symbols": ["AAPL", "MSFT"], "methods": ["quote"]}' | python3 yfinance_cli.py
+
+Batch mode runs yfinance_batch.fetch_batch, so a whole ticker set costs one
+process start. Without --symbols/--symbol the request is read from stdin as
+JSON, identical to yfinance_batch.py.
+
+Single-symbol mode (used by YFinanceProvider.spawnCli when no daemon runs):
     python3 yfinance_cli.py --symbol AAPL --method get_basic_financials
-    python3 yfinance_cli.py --symbol MSFT --method get_quote
     python3 yfinance_cli.py --symbol JNJ --method get_candles --days_back 365
+
+get_candles can also be written as an Arrow IPC stream (requires pyarrow):
+    python3 yfinance_cli.py --symbol JNJ --method get_candles --format arrow
 """
 
 import sys
 import json
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from data_py.yfinance_adapter import YFinanceClient
+from data_py.yf_json import dumps
+
+if TYPE_CHECKING:
+    from data_py.yfinance_adapter import YFinanceClient
+
+METHODS = (
+    "get_basic_financials",
+    "get_quote",
+    "get_company_profile",
+    "get_candles",
+    "get_analyst_data",
+)
+
+
+def dispatch(client: "YFinanceClient", method: str, symbol: str, days_back: int = 365):
+    """Invoke one YFinanceClient method by name (shared with yfinance_daemon)."""
+    if method == "get_basic_financials":
+        return client.get_basic_financials(symbol)
+    if method == "get_quote":
+        return client.get_quote(symbol)
+    if method == "get_company_profile":
+        return client.get_company_profile(symbol)
+    if method == "get_candles":
+        return client.get_candles(symbol, days_back=days_back)
+    if method == "get_analyst_data":
+        return client.get_analyst_data(symbol)
+    raise ValueError(f"Unsupported method: {method}")
+
+
+# get_candles() keys written as Arrow columns, with their Arrow type
+_ARROW_CANDLE_COLUMNS = (
+    ("t", "int64"),
+    ("o", "float64"),
+    ("h", "float64"),
+    ("l", "float64"),
+    ("c", "float64"),
+    ("v", "float64"),
+)
+
+
+def write_arrow_candles(candles: Dict[str, Any], stream) -> None:
+    """
+    Write a get_candles() result to ``stream`` as one Arrow IPC record batch.
+
+    Columns t/o/h/l/c/v; a no_data result becomes an empty batch.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise RuntimeError("pyarrow is not installed. Run: pip install pyarrow") from exc
+
+    arrays = [
+        pa.array(candles.get(key) or [], type=getattr(pa, type_name)())
+        for key, type_name in _ARROW_CANDLE_COLUMNS
+    ]
+    batch = pa.record_batch(arrays, names=[key for key, _ in _ARROW_CANDLE_COLUMNS])
+    with pa.ipc.new_stream(stream, batch.schema) as writer:
+        writer.write_batch(batch)
+
+
+def _split_csv(value: str):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def run_batch(symbols, methods):
+    """Fetch many symbols in this process via yfinance_batch.fetch_batch."""
+    from data_py.yfinance_batch import configure_yfinance_cache, fetch_batch
+
+    configure_yfinance_cache()
+    return fetch_batch(symbols, methods)
 
 
 def main():
     parser = argparse.ArgumentParser(description="YFinance CLI")
-    parser.add_argument("--symbol", required=True, help="Stock symbol")
+    parser.add_argument(
+        "--symbols",
+        help="Comma-separated stock symbols (batch mode)",
+    )
+    parser.add_argument(
+        "--methods",
+        default="basic_financials,quote,candles",
+        help="Comma-separated batch methods "
+             "(basic_financials, quote, candles, analyst_data, profile)",
+    )
+    parser.add_argument("--symbol", help="Single stock symbol (one-shot mode)")
     parser.add_argument(
         "--method",
-        required=True,
-        choices=[
-            "get_basic_financials",
-            "get_quote",
-            "get_company_profile",
-            "get_candles",
-            "get_analyst_data",
-        ],
+        choices=METHODS,
+        help="Client method for --symbol",
     )
     parser.add_argument(
         "--days_back",
@@ -39,26 +123,61 @@ def main():
         default=365,
         help="Days back for candles",
     )
+    parser.add_argument(
+        "--format",
+        choices=("json", "arrow"),
+        default="json",
+        help="Output format; arrow is only supported for get_candles",
+    )
 
     args = parser.parse_args()
 
+    if args.symbol is None:
+        try:
+            if args.symbols is not None:
+                symbols = _split_csv(args.symbols)
+                methods = _split_csv(args.methods)
+            else:
+                input_data = json.loads(sys.stdin.read())
+                symbols = input_data.get("symbols", [])
+                methods = input_data.get(
+                    "methods", ["basic_financials", "quote", "candles"]
+                )
+
+            if not symbols:
+                print(json.dumps({"error": "No symbols provided"}), file=sys.stderr)
+                sys.exit(1)
+
+            sys.stdout.write(dumps(run_batch(symbols, methods)))
+            sys.stdout.write("\n")
+            sys.exit(0)
+
+        except json.JSONDecodeError as exc:
+            print(json.dumps({"error": f"Invalid JSON input: {exc}"}), file=sys.stderr)
+            sys.exit(1)
+        except Exception as exc:  # pragma: no cover - defensive CLI guard
+            print(json.dumps({"error": f"Batch fetch failed: {exc}"}), file=sys.stderr)
+            sys.exit(1)
+
+    if args.method is None:
+        parser.error("--method is required with --symbol")
+    if args.format == "arrow" and args.method != "get_candles":
+        parser.error("--format arrow is only supported for get_candles")
+
     try:
+        # Imported here so batch mode and argument errors skip the adapter
+        from data_py.yfinance_adapter import YFinanceClient
+
         client = YFinanceClient(cache_ttl_hours=24)
 
-        if args.method == "get_basic_financials":
-            result = client.get_basic_financials(args.symbol)
-        elif args.method == "get_quote":
-            result = client.get_quote(args.symbol)
-        elif args.method == "get_company_profile":
-            result = client.get_company_profile(args.symbol)
-        elif args.method == "get_candles":
-            result = client.get_candles(args.symbol, days_back=args.days_back)
-        elif args.method == "get_analyst_data":
-            result = client.get_analyst_data(args.symbol)
-        else:
-            raise ValueError(f"Unsupported method: {args.method}")
+        result = dispatch(client, args.method, args.symbol, days_back=args.days_back)
 
-        print(json.dumps(result, ensure_ascii=False))
+        if args.format == "arrow":
+            write_arrow_candles(result, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(dumps(result))
+            sys.stdout.write("\n")
         sys.exit(0)
 
     except Exception as exc:  # pragma: no cover - defensive CLI guard
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Long-lived yfinance server - keeps one YFinanceClient warm across requests.
+
+yfinance_cli.py pays interpreter start-up, the pandas/yfinance imports and a
+cold client for every (symbol, method) call. This daemon does that once and
+then serves requests over a Unix socket, so the in-process caches of
+YFinanceClient stay hot.
+
+Protocol: newline-delimited JSON, one request per line:
+    {"id": 1, "symbol": "AAPL", "method": "get_quote", "args": {"days_back": 365}}
+Replies are written in completion order and matched by id:
+    {"id": 1, "result": {...}}    or    {"id": 1, "error": "..."}
+
+Usage:
+    python3 yfinance_daemon.py --socket /tmp/retail-investor-1000/yfinance.sock
+
+The default socket lives in a per-user directory (mode 0700) and is itself
+chmod 0600; a second instance refuses to start while one is listening.
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_py.yfinance_adapter import YFinanceClient
+from data_py.yfinance_cli import METHODS, dispatch, dumps
+
+DEFAULT_SOCKET = os.path.join(
+    tempfile.gettempdir(), f"retail-investor-{os.getuid()}", "yfinance.sock"
+)
+
+
+class YFinanceDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server sharing one client and worker pool across connections."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, client: YFinanceClient, max_workers: int = 8):
+        self.client = client
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        # Only the owning user may talk to the daemon
+        os.chmod(self.server_address, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads request lines and answers each one from the shared worker pool."""
+
+    def handle(self) -> None:
+        write_lock = threading.Lock()
+
+        def respond(payload: Dict[str, Any]) -> None:
+            data = (dumps(payload) + "\n").encode("utf-8")
+            try:
+                with write_lock:
+                    self.wfile.write(data)
+                    self.wfile.flush()
+            except OSError:
+                # Peer went away; nothing left to answer
+                pass
+
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                respond({"id": None, "error": f"Invalid JSON input: {exc}"})
+                continue
+            if not isinstance(request, dict):
+                respond({"id": None, "error": "Request must be a JSON object"})
+                continue
+            self.server.executor.submit(_serve, self.server.client, request, respond)
+
+
+def _serve(
+    client: YFinanceClient,
+    request: Dict[str, Any],
+    respond: Callable[[Dict[str, Any]], None]
+) -> None:
+    req_id = request.get("id")
+    try:
+        method = request.get("method")
+        if method not in METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        args = request.get("args") or {}
+        result = dispatch(
+            client,
+            method,
+            request["symbol"],
+            days_back=int(args.get("days_back", 365)),
+        )
+        respond({"id": req_id, "result": result})
+    except Exception as exc:
+        respond({"id": req_id, "error": str(exc)})
+
+
+def claim_socket_path(socket_path: str) -> None:
+    """
+    Make socket_path free to bind: remove a stale socket file left by a dead
+    daemon, but raise RuntimeError if a daemon is still listening on it.
+    """
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A yfinance daemon is already listening on {socket_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YFinance daemon")
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("YFINANCE_DAEMON_SOCKET", DEFAULT_SOCKET),
+        help="Unix socket path to listen on",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent requests served",
+    )
+    args = parser.parse_args()
+
+    socket_dir = os.path.dirname(os.path.abspath(args.socket))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    try:
+        claim_socket_path(args.socket)
+    except RuntimeError as exc:
+        print(json.dumps({"error": str(exc)}), file=sys.stderr)
+        sys.exit(1)
+
+    server = YFinanceDaemon(
+        args.socket, YFinanceClient(cache_ttl_hours=24), max_workers=args.workers
+    )
+    print(json.dumps({"listening": args.socket}), file=sys.stderr)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
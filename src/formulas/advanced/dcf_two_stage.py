@@ -6,9 +6,9 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 try:  # Allow running as script from this folder
-    from .utils import _as_decimal_if_percent, _get_nested, _require
+    from .utils import FormulaResult, _as_decimal_if_percent, _get_nested, _require
 except ImportError:  # pragma: no cover - fallback for direct execution
-    from utils import _as_decimal_if_percent, _get_nested, _require
+    from utils import FormulaResult, _as_decimal_if_percent, _get_nested, _require
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +126,7 @@ def calculate_two_stage_dcf(
     risk_free_rate: float = 0.04,
     market_risk_premium: float = 0.055,
     **kwargs: Any,
-) -> Dict[str, Any]:
+) -> FormulaResult:
     """
     BERECHNET: Intrinsic Value pro Aktie via Two-Stage FCFE DCF (High Growth + Terminal Value).
 
@@ -161,7 +161,7 @@ def calculate_two_stage_dcf(
 
     RETURNS:
     --------
-    dict mit:
+    FormulaResult (``to_dict()`` für JSON) mit:
     - 'value': float (intrinsic value pro Aktie; Einheit wie Inputs)
     - 'components': dict (Zwischenwerte)
     - 'assumptions': list[str]
@@ -380,13 +380,13 @@ def calculate_two_stage_dcf(
         "model_path": "net_income_path" if use_net_income_path else "fcfe_cagr_path",
     }
 
-    return {
-        "value": float(intrinsic_per_share),
-        "components": components,
-        "assumptions": assumptions,
-        "data_quality": data_quality,
-        "confidence": confidence,
-    }
+    return FormulaResult(
+        value=float(intrinsic_per_share),
+        components=components,
+        assumptions=assumptions,
+        data_quality=data_quality,
+        confidence=confidence,
+    )
 
 
 def _fetch_finnhub_data(symbol: str, client: object) -> Dict[str, Any]:
@@ -467,11 +467,11 @@ def test_calculate_two_stage_dcf() -> None:
     )
 
     # Buchziel: ca. 109.09; wegen Rundungen tolerieren wir leicht.
-    assert abs(result["value"] - 109.09) < 0.75, f"Value mismatch: {result['value']}"
-    assert result["confidence"] > 0.80, f"Low confidence: {result['confidence']}"
-    assert len(result["assumptions"]) > 0, "Assumptions missing"
+    assert abs(result.value - 109.09) < 0.75, f"Value mismatch: {result.value}"
+    assert result.confidence > 0.80, f"Low confidence: {result.confidence}"
+    assert len(result.assumptions) > 0, "Assumptions missing"
 
-    print(f"Two-Stage DCF Test PASSED: {result['value']:.4f} (confidence={result['confidence']})")
+    print(f"Two-Stage DCF Test PASSED: {result.value:.4f} (confidence={result.confidence})")
 
 
 if __name__ == "__main__":
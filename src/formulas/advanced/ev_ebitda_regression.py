@@ -1,55 +1,122 @@
 """Dynamic EV/EBITDA multiple via daily OLS regression on the current universe."""
 
 import logging
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-from sklearn.linear_model import LinearRegression
+
+try:  # Allow running as script from this folder
+    from .utils import FormulaResult, _cached_daily
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from utils import FormulaResult, _cached_daily
 
 logger = logging.getLogger(__name__)
 
 
-def _fetch_universe_data(universe: List[str], client: object) -> pd.DataFrame:
-    """Lade EV/EBITDA, ROIC, Growth, Beta für ALLE Symbole."""
-    data = []
-    for symbol in universe:
-        try:
-            fin = client.company_basic_financials(symbol, "all")
-            metric = fin.get("metric", {})
-
-            # Wir brauchen 4 Felder - wenn eins fehlt, skippe das Symbol
-            ev_ebitda = metric.get("enterpriseValueOverEBITDA")
-            roic = metric.get("roic")
-            beta = metric.get("beta")
-
-            # Growth aus FCFE-Serie berechnen
-            fcfe_series = fin.get("series", {}).get("annual", {}).get("freeCashFlow", [])
-            growth = _calculate_cagr(fcfe_series) if len(fcfe_series) >= 5 else None
-
-            if all(v is not None for v in [ev_ebitda, roic, beta, growth]):
-                data.append(
-                    {
-                        "symbol": symbol,
-                        "ev_ebitda": ev_ebitda,
-                        "roic": roic,
-                        "growth": growth,
-                        "beta": beta,
-                    }
-                )
-        except Exception as exc:
-            logger.warning("%s: Daten unvollständig - überspringe in Regression: %s", symbol, exc)
+# Parallele Finnhub-Requests beim Laden des Universums
+MAX_WORKERS = 16
 
-    return pd.DataFrame(data)
 
+def _fetch_one(symbol: str, client: object) -> Optional[Dict[str, Any]]:
+    """Lade EV/EBITDA, ROIC, Growth, Beta für ein Symbol (None wenn unvollständig)."""
+    try:
+        fin = _cached_daily(
+            "basic_financials",
+            client,
+            symbol,
+            lambda: client.company_basic_financials(symbol, "all"),
+        )
+        metric = fin.get("metric", {})
+
+        # Wir brauchen 4 Felder - wenn eins fehlt, skippe das Symbol
+        ev_ebitda = metric.get("enterpriseValueOverEBITDA")
+        roic = metric.get("roic")
+        beta = metric.get("beta")
+
+        # FCFE der letzten 5 Jahre; Growth (CAGR) wird gebündelt berechnet
+        fcfe_series = fin.get("series", {}).get("annual", {}).get("freeCashFlow", [])
+        fcfe = (
+            tuple(float(p["v"]) for p in fcfe_series[-5:]) if len(fcfe_series) >= 5 else None
+        )
+
+        if all(v is not None for v in [ev_ebitda, roic, beta, fcfe]):
+            return {
+                "symbol": symbol,
+                "ev_ebitda": ev_ebitda,
+                "roic": roic,
+                "beta": beta,
+                "fcfe": fcfe,
+            }
+    except Exception as exc:
+        logger.warning("%s: Daten unvollständig - überspringe in Regression: %s", symbol, exc)
+
+    return None
 
-def _calculate_cagr(series: List[Dict[str, Any]]) -> float:
-    """Berechne CAGR aus Finnhub-Zeitreihe."""
-    if len(series) < 5:
+
+def _fetch_universe_data(
+    universe: List[str], client: object
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """
+    Lade EV/EBITDA, ROIC, Growth, Beta für ALLE Symbole (parallel, I/O-bound).
+
+    Payloads und die fertigen Trainings-Arrays werden pro Client und UTC-Tag
+    gecacht, damit das Scoren jedes Symbols nicht erneut das ganze Universum
+    lädt. Zurück kommen Kopien der Arrays; der Cache bleibt unverändert.
+
+    Returns:
+        (symbols, X, y): X ist (n, 3) mit Spalten roic, growth, beta;
+        y ist (n,) EV/EBITDA
+    """
+    empty = ((), np.empty((0, 3)), np.empty(0))
+    if not universe:
+        return empty
+
+    def _load() -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+        workers = min(MAX_WORKERS, len(universe))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(lambda symbol: _fetch_one(symbol, client), universe))
+        rows = [row for row in rows if row is not None]
+        if not rows:
+            return empty
+
+        # Spaltenweise aufbauen (kein DataFrame-Umweg)
+        y = np.array([row["ev_ebitda"] for row in rows], dtype=np.float64)
+        roic = np.array([row["roic"] for row in rows], dtype=np.float64)
+        beta = np.array([row["beta"] for row in rows], dtype=np.float64)
+        growth = _calculate_cagr(np.array([row["fcfe"] for row in rows], dtype=np.float64))
+
+        # Ohne sinnvolle CAGR (FCFE-Vorzeichenwechsel) fällt das Symbol raus
+        keep = np.isfinite(growth)
+        symbols = tuple(row["symbol"] for row, k in zip(rows, keep) if k)
+        X = np.column_stack([roic[keep], growth[keep], beta[keep]])
+        return symbols, X, y[keep]
+
+    symbols, X, y = _cached_daily("ev_ebitda_universe", client, tuple(universe), _load)
+    return symbols, X.copy(), y.copy()
+
+
+def _calculate_cagr(values: np.ndarray) -> np.ndarray:
+    """
+    Berechne 4-Jahres-CAGR für alle Symbole auf einmal.
+
+    Args:
+        values: (n_symbols, 5) FCFE-Werte der letzten 5 Jahre
+
+    Returns:
+        (n_symbols,) CAGR; NaN wo Start- oder Endwert <= 0 ist
+    """
+    if values.ndim != 2 or values.shape[1] < 5:
         raise ValueError("Weniger als 5 Jahre Daten für CAGR")
 
-    values = [float(p["v"]) for p in series[-5:]]  # Letzte 5 Jahre
-    return (values[-1] / values[0]) ** (1 / 4) - 1
+    start = values[:, -5]
+    end = values[:, -1]
+    valid = start > 0
+    cagr = np.full(len(values), np.nan)
+    with np.errstate(invalid="ignore"):
+        # Negativer Endwert -> NaN statt komplexer Zahl
+        cagr[valid] = (end[valid] / start[valid]) ** 0.25 - 1.0
+    return cagr
 
 
 def calculate_ev_ebitda_regression(
@@ -57,7 +124,7 @@ def calculate_ev_ebitda_regression(
     finnhub_client: object,
     universe: List[str],
     **config: Any,
-) -> Dict[str, Any]:
+) -> FormulaResult:
     """
     Dynamische OLS-Regression für EV/EBITDA Multiple.
 
@@ -66,56 +133,68 @@ def calculate_ev_ebitda_regression(
     """
 
     # 1. Universum-Daten sammeln
-    df = _fetch_universe_data(universe, finnhub_client)
+    symbols, X, y = _fetch_universe_data(universe, finnhub_client)
+    n_samples = len(y)
 
-    if len(df) < 10:
-        raise ValueError(f"Zu wenige vollständige Daten für Regression (min 10, haben {len(df)})")
+    if n_samples < 10:
+        raise ValueError(f"Zu wenige vollständige Daten für Regression (min 10, haben {n_samples})")
 
     # 2. OLS Regression: EV/EBITDA ~ ROIC + Growth + Beta
-    X = df[["roic", "growth", "beta"]].values
-    y = df["ev_ebitda"].values
 
-    model = LinearRegression().fit(X, y)
+    # Direkte Least-Squares-Lösung mit Intercept-Spalte (ein LAPACK-Call)
+    X_aug = np.column_stack([np.ones(len(X)), X])
+    coef, *_ = np.linalg.lstsq(X_aug, y, rcond=None)
 
     coefficients = {
-        "intercept": float(model.intercept_),
-        "roic": float(model.coef_[0]),
-        "growth": float(model.coef_[1]),
-        "beta": float(model.coef_[2]),
+        "intercept": float(coef[0]),
+        "roic": float(coef[1]),
+        "growth": float(coef[2]),
+        "beta": float(coef[3]),
     }
 
-    r_squared = float(model.score(X, y))
+    residuals = y - X_aug @ coef
+    ss_res = float(residuals @ residuals)
+    ss_tot = float(((y - y.mean()) ** 2).sum())
+    # Konstantes y: wie sklearn (1.0 bei perfektem Fit, sonst 0.0)
+    if ss_tot > 0:
+        r_squared = 1.0 - ss_res / ss_tot
+    else:
+        r_squared = 1.0 if ss_res == 0 else 0.0
 
     # 3. Predicipt für das angefragte Symbol
     try:
-        symbol_data = _fetch_universe_data([symbol], finnhub_client)
-        if symbol_data.empty:
-            raise ValueError(f"{symbol}: Keine Daten für Prediction")
+        # Im Universum (Normalfall): Zeile wiederverwenden, kein zweiter Fetch
+        if symbol in symbols:
+            x_symbol = X[symbols.index(symbol)]
+        else:
+            _, X_symbol, _ = _fetch_universe_data([symbol], finnhub_client)
+            if len(X_symbol) == 0:
+                raise ValueError(f"{symbol}: Keine Daten für Prediction")
+            x_symbol = X_symbol[0]
 
-        X_symbol = symbol_data[["roic", "growth", "beta"]].values
-        prediction = float(model.predict(X_symbol)[0])
+        prediction = float(np.r_[1.0, x_symbol] @ coef)
 
     except Exception as exc:
         logger.error("%s: Prediction fehlgeschlagen: %s", symbol, exc)
         raise ValueError(f"{symbol}: Kann EV/EBITDA nicht predicipten")
 
-    return {
-        "value": prediction,
-        "components": {
+    return FormulaResult(
+        value=prediction,
+        components={
             "coefficients": coefficients,
             "r_squared": r_squared,
-            "training_samples": len(df),
+            "training_samples": n_samples,
         },
-        "assumptions": [
-            f"OLS auf {len(df)} Universe-Symbolen",
+        assumptions=[
+            f"OLS auf {n_samples} Universe-Symbolen",
             f"R² = {r_squared:.3f}",
             f"Koeffizienten: {coefficients}",
         ],
-        "data_quality": {
-            "training_completeness": len(df) / len(universe),
+        data_quality={
+            "training_completeness": n_samples / len(universe),
             "r_squared": r_squared,
         },
-    }
+    )
 
 
 def test_calculate_ev_ebitda_regression() -> None:
@@ -164,11 +243,11 @@ def test_calculate_ev_ebitda_regression() -> None:
 
     # Tabelle sagt: Actual = 5.60, Predicted sollte in Richtung 4.91 gehen
     # (es wird nicht exakt 4.91 sein, weil wir mehr Variablen nutzen als Damodaran)
-    assert result["value"] > 3.0, f"EV/EBITDA zu niedrig: {result['value']}"
-    assert result["value"] < 8.0, f"EV/EBITDA zu hoch: {result['value']}"
-    assert result["components"]["r_squared"] > 0.5, f"Modellqualität zu schlecht: {result['r_squared']}"
+    assert result.value > 3.0, f"EV/EBITDA zu niedrig: {result.value}"
+    assert result.value < 8.0, f"EV/EBITDA zu hoch: {result.value}"
+    assert result.components["r_squared"] > 0.5, f"Modellqualität zu schlecht: {result.components['r_squared']}"
 
-    print(f"EV/EBITDA Regression Test PASSED: {result['value']:.2f}x (R²={result['components']['r_squared']:.3f})")
+    print(f"EV/EBITDA Regression Test PASSED: {result.value:.2f}x (R²={result.components['r_squared']:.3f})")
 
 
 if __name__ == "__main__":
@@ -1,20 +1,101 @@
 """Shared helpers for advanced valuation formulas."""
 
-from typing import Any, Dict
+import threading
+import weakref
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 import numpy as np
 
+# Tages-Cache für Finnhub-Payloads, pro Client: client -> {(namespace, key): Wert}.
+# Weak-Keys, damit ein neuer Client nie die Daten eines alten (mit recycelter id)
+# sieht; wird beim UTC-Datumswechsel komplett verworfen.
+_DAILY_CACHE: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, Hashable], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_DAILY_CACHE_DAY = ""
+_DAILY_CACHE_MAXSIZE = 8192  # Einträge pro Client
+_DAILY_CACHE_LOCK = threading.Lock()
 
-def _get_nested(data: Dict[str, Any], path: str) -> Any:
-    """Safely read nested dict fields using dot-separated paths."""
+
+# Dot-Pfad -> Tuple der Keys; die FINNHUB_FIELDS-Pfade sind eine kleine, feste Menge
+_PATH_PARTS: Dict[str, Tuple[str, ...]] = {}
+
+
+def _path_parts(path: str) -> Tuple[str, ...]:
+    """Split a dot-separated path once and memoize the key tuple."""
+    parts = _PATH_PARTS.get(path)
+    if parts is None:
+        parts = _PATH_PARTS[path] = tuple(path.split("."))
+    return parts
+
+
+def _get_nested(data: Dict[str, Any], path: Union[str, Tuple[str, ...]]) -> Any:
+    """Safely read nested dict fields using dot-separated paths or key tuples."""
     cur: Any = data
-    for key in path.split("."):
+    for key in _path_parts(path) if isinstance(path, str) else path:
         if not isinstance(cur, dict) or key not in cur:
             return None
         cur = cur[key]
     return cur
 
 
+def _cached_daily(
+    namespace: str, client: object, key: Hashable, fetch: Callable[[], Any]
+) -> Any:
+    """
+    Memoize ``fetch()`` für ``client`` bis zum UTC-Datumswechsel.
+
+    Finnhub-Fundamentaldaten und Tageskerzen ändern sich höchstens einmal pro
+    Handelstag; wiederholte Scoring-Läufe mit demselben Client sparen so die
+    Requests. Der Cache hängt per weakref am Client-Objekt und verschwindet mit
+    ihm; nicht weakref-fähige Clients werden nicht gecacht. Exceptions werden
+    nicht gecacht.
+    """
+    global _DAILY_CACHE_DAY
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    cache_key = (namespace, key)
+    with _DAILY_CACHE_LOCK:
+        if _DAILY_CACHE_DAY != today:
+            _DAILY_CACHE.clear()
+            _DAILY_CACHE_DAY = today
+        try:
+            entries = _DAILY_CACHE.setdefault(client, {})
+        except TypeError:  # nicht weakref-fähig oder nicht hashbar
+            entries = None
+        if entries is not None and cache_key in entries:
+            return entries[cache_key]
+
+    value = fetch()
+    if entries is None:
+        return value
+    with _DAILY_CACHE_LOCK:
+        if _DAILY_CACHE_DAY == today:
+            if len(entries) >= _DAILY_CACHE_MAXSIZE:
+                entries.pop(next(iter(entries)))
+            entries[cache_key] = value
+    return value
+
+
+@dataclass(slots=True)
+class FormulaResult:
+    """Ergebnis eines Formel-Calculators; ``to_dict()`` erst an der Serialisierungsgrenze."""
+
+    value: float
+    components: Dict[str, Any]
+    assumptions: List[str]
+    data_quality: Dict[str, Any]
+    confidence: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        if self.confidence is None:
+            del result["confidence"]
+        return result
+
+
 def _require(value: Any, symbol: str, field_name: str) -> Any:
     """Raise when a required field is missing."""
     if value is None:
@@ -2,18 +2,57 @@
 
 import logging
 import math
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 try:  # Allow running as script from this folder
-    from .utils import _require
+    from .utils import FormulaResult, _cached_daily, _require
 except ImportError:  # pragma: no cover - fallback for direct execution
-    from utils import _require
+    from utils import FormulaResult, _cached_daily, _require
 
 logger = logging.getLogger(__name__)
 
+# Parallele Finnhub-Requests in calculate_monte_carlo_var_batch
+MAX_WORKERS = 16
+
+
+def _vol_kernel(prices: np.ndarray, trading_days: int) -> float:
+    """Annualisierte Std der Log-Returns; ein einziges Zwischen-Array (in-place log)."""
+    rets = prices[1:] / prices[:-1]
+    np.log(rets, out=rets)
+    return float(rets.std(ddof=1) * math.sqrt(trading_days))
+
+
+def _antithetic_normals(rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    n Standardnormal-Werte als antithetische Paare (Z, -Z).
+
+    Zieht nur ceil(n/2) Zufallszahlen; die gespiegelte Hälfte halbiert die
+    Varianz symmetrischer Quantilschätzer bei gleicher Pfadzahl.
+    """
+    half = (n + 1) // 2
+    z = np.empty(n)
+    rng.standard_normal(half, out=z[:half])
+    np.negative(z[: n - half], out=z[half:])
+    return z
+
+
+def _gbm_pnl(z: np.ndarray, s0: float, drift: float, diffusion: float) -> np.ndarray:
+    """
+    PnL = S0 * exp(drift + diffusion * Z) - S0, in-place auf dem Z-Buffer.
+
+    Überschreibt ``z``; keine weiteren Array-Allokationen.
+    """
+    z *= diffusion
+    z += drift
+    np.exp(z, out=z)
+    z *= s0
+    z -= s0
+    return z
+
 
 def _annualized_vol_from_closes(closes: List[float], trading_days: int = 252) -> float:
     if len(closes) < 30:
@@ -21,8 +60,7 @@ def _annualized_vol_from_closes(closes: List[float], trading_days: int = 252) ->
     prices = np.asarray(closes, dtype=float)
     if np.any(prices <= 0):
         raise ValueError("Close-Preise müssen > 0 sein")
-    rets = np.diff(np.log(prices))
-    vol = float(np.std(rets, ddof=1) * math.sqrt(trading_days))
+    vol = _vol_kernel(prices, trading_days)
     if not np.isfinite(vol) or vol <= 0:
         raise ValueError(f"Ungültige Volatilität berechnet: {vol}")
     return vol
@@ -37,7 +75,7 @@ def calculate_monte_carlo_var(
     lookback_days: int = 365,
     risk_free_rate: float = 0.05,
     **kwargs: Any,
-) -> Dict[str, Any]:
+) -> FormulaResult:
     """
     BERECHNET: Monte-Carlo VaR einer Einzelposition (GBM) in absoluten Währungseinheiten.
 
@@ -57,6 +95,7 @@ def calculate_monte_carlo_var(
     current_price_override: float
     sigma_override: float
     seed: int (für deterministische Tests; Produktion default None)
+    as_of_ts: int (Unix-Sekunden als Candle-Stichtag; default jetzt)
 
     RAISES:
     -------
@@ -95,8 +134,7 @@ def calculate_monte_carlo_var(
         sigma = float(kwargs["sigma_override"])
         assumptions.append("sigma via sigma_override (Buchtest).")
     else:
-        candle = _fetch_finnhub_candles(symbol, finnhub_client, lookback_days=lookback_days)
-        closes = _require(candle.get("c"), symbol, "candle.c")
+        closes = _closes_for(symbol, finnhub_client, lookback_days, kwargs.get("as_of_ts"))
         sigma = _annualized_vol_from_closes(closes)
         assumptions.append("sigma via historische annualisierte Volatilität aus Finnhub /stock/candle (Daily closes).")
 
@@ -104,9 +142,10 @@ def calculate_monte_carlo_var(
         raise ValueError(f"{symbol}: sigma muss > 0 und endlich sein (got {sigma})")
 
     T = float(horizon_days / 365.0)
-    z = rng.standard_normal(simulations)
-    st = s0 * np.exp((risk_free_rate - 0.5 * sigma ** 2) * T + sigma * math.sqrt(T) * z)
-    pnl = st - s0
+    drift = (risk_free_rate - 0.5 * sigma ** 2) * T
+    diffusion = sigma * math.sqrt(T)
+    pnl = _gbm_pnl(_antithetic_normals(rng, simulations), s0, drift, diffusion)
+    assumptions.append("Antithetische Variates: jede Ziehung Z wird mit -Z gepaart (Varianzreduktion).")
 
     var_percentile = (1.0 - confidence_level) * 100.0
     q = float(np.percentile(pnl, var_percentile))
@@ -132,20 +171,87 @@ def calculate_monte_carlo_var(
     }
     confidence = float(round(data_quality["required_fields_present_ratio"], 4))
 
-    return {
-        "value": var_value,
-        "components": components,
-        "assumptions": assumptions,
-        "data_quality": data_quality,
-        "confidence": confidence,
-    }
+    return FormulaResult(
+        value=var_value,
+        components=components,
+        assumptions=assumptions,
+        data_quality=data_quality,
+        confidence=confidence,
+    )
+
+
+def calculate_monte_carlo_var_batch(
+    symbols: List[str],
+    finnhub_client: object,
+    max_workers: int = MAX_WORKERS,
+    **kwargs: Any,
+) -> Dict[str, FormulaResult]:
+    """
+    Monte-Carlo VaR für viele Symbole.
 
+    Die Finnhub-Requests (Quote, Candles) dominieren und laufen parallel;
+    Candles kommen pro Tag aus dem Cache. Symbole, für die der VaR nicht
+    berechnet werden kann, werden geloggt und fehlen im Ergebnis.
 
-def _fetch_finnhub_candles(symbol: str, client: object, lookback_days: int = 365, resolution: str = "D") -> Dict[str, Any]:
-    """Holt Finnhub /stock/candle und validiert Status und Close-Array."""
+    Returns:
+        Dict symbol -> Ergebnis von calculate_monte_carlo_var
+    """
+    if not symbols:
+        return {}
+
+    # Ein Stichtag für den ganzen Batch (Daily Candles, Sekunden sind egal)
+    kwargs.setdefault("as_of_ts", int(time.time()))
+
+    def _one(symbol: str) -> Optional[FormulaResult]:
+        try:
+            return calculate_monte_carlo_var(symbol, finnhub_client, **kwargs)
+        except Exception as exc:
+            logger.warning("%s: VaR nicht berechenbar - überspringe: %s", symbol, exc)
+            return None
+
+    workers = max(1, min(max_workers, len(symbols)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_one, symbols))
+
+    return {symbol: result for symbol, result in zip(symbols, results) if result is not None}
+
+
+def _closes_for(
+    symbol: str, client: object, lookback_days: int, as_of_ts: Optional[int] = None
+) -> Tuple[float, ...]:
+    """
+    Daily Closes für lookback_days, pro UTC-Tag gecacht (ändern sich 1x täglich).
+
+    Der Stichtag (as_of_ts, Default jetzt) gehört als UTC-Tag zum Key, damit
+    Aufrufe mit einem anderen Stichtag nicht das Fenster des ersten bekommen.
+    """
+    as_of_day = (int(time.time()) if as_of_ts is None else int(as_of_ts)) // 86400
+
+    def _load() -> Tuple[float, ...]:
+        candle = _fetch_finnhub_candles(
+            symbol, client, lookback_days=lookback_days, as_of_ts=as_of_ts
+        )
+        return tuple(_require(candle.get("c"), symbol, "candle.c"))
+
+    return _cached_daily("candles", client, (symbol, int(lookback_days), as_of_day), _load)
+
+
+def _fetch_finnhub_candles(
+    symbol: str,
+    client: object,
+    lookback_days: int = 365,
+    resolution: str = "D",
+    as_of_ts: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Holt Finnhub /stock/candle und validiert Status und Close-Array.
+
+    as_of_ts: Unix-Sekunden des Stichtags (Default: jetzt); Batches übergeben
+    einen gemeinsamen Wert.
+    """
     try:
-        end_ts = int(datetime.utcnow().timestamp())
-        start_ts = int((datetime.utcnow() - timedelta(days=int(lookback_days))).timestamp())
+        end_ts = int(time.time()) if as_of_ts is None else int(as_of_ts)
+        start_ts = end_ts - int(lookback_days) * 86400
 
         if not hasattr(client, "stock_candles"):
             raise ValueError(f"{symbol}: Finnhub-Client hat keine Methode stock_candles")
@@ -193,11 +299,11 @@ def test_calculate_monte_carlo_var() -> None:
         seed=14,  # deterministisch, um Buchwert (Beispielausgabe) eng zu treffen
     )
 
-    assert abs(result["value"] - 10.824) < 0.15, f"VaR mismatch: {result['value']}"
-    assert result["confidence"] > 0.80, f"Low confidence: {result['confidence']}"
-    assert len(result["assumptions"]) > 0, "Assumptions missing"
+    assert abs(result.value - 10.824) < 0.15, f"VaR mismatch: {result.value}"
+    assert result.confidence > 0.80, f"Low confidence: {result.confidence}"
+    assert len(result.assumptions) > 0, "Assumptions missing"
 
-    print(f"Monte Carlo VaR Test PASSED: {result['value']:.6f}")
+    print(f"Monte Carlo VaR Test PASSED: {result.value:.6f}")
 
 
 if __name__ == "__main__":
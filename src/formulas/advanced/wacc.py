@@ -3,10 +3,12 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
+
 try:  # Allow running as script from this folder
-    from .utils import _get_nested, _require
+    from .utils import FormulaResult, _get_nested, _require
 except ImportError:  # pragma: no cover - fallback for direct execution
-    from utils import _get_nested, _require
+    from utils import FormulaResult, _get_nested, _require
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,11 @@ FINNHUB_FIELDS = {
 }
 
 
+# D/E-Schwellen (jeweils exklusive Obergrenze) und zugehörige Credit Spreads
+_DE_BREAKS = np.array([0.10, 0.50, 1.00, 2.00, 3.00, 5.00])
+_DE_SPREADS = np.array([0.010, 0.015, 0.020, 0.030, 0.040, 0.060, 0.080])
+
+
 def _estimate_credit_spread_from_de_ratio(de_ratio: float) -> float:
     """
     Deterministische Heuristik (kein Dummy-0), weil laut Projektvorgabe rd aus debtToEquity
@@ -27,19 +34,7 @@ def _estimate_credit_spread_from_de_ratio(de_ratio: float) -> float:
     if de_ratio < 0:
         raise ValueError(f"debtToEquity muss >= 0 sein (got {de_ratio})")
 
-    if de_ratio < 0.10:
-        return 0.010
-    if de_ratio < 0.50:
-        return 0.015
-    if de_ratio < 1.00:
-        return 0.020
-    if de_ratio < 2.00:
-        return 0.030
-    if de_ratio < 3.00:
-        return 0.040
-    if de_ratio < 5.00:
-        return 0.060
-    return 0.080
+    return float(_DE_SPREADS[np.searchsorted(_DE_BREAKS, de_ratio, side="right")])
 
 
 def calculate_wacc(
@@ -49,7 +44,7 @@ def calculate_wacc(
     market_risk_premium: float = 0.055,
     default_us_corporate_tax: float = 0.21,
     **kwargs: Any,
-) -> Dict[str, Any]:
+) -> FormulaResult:
     """
     BERECHNET: WACC (Kapitalgewichtete Kapitalkosten).
 
@@ -74,6 +69,13 @@ def calculate_wacc(
 
     data = _fetch_finnhub_data(symbol, finnhub_client)
 
+    # Felder einmal auflösen; die Zweige unten (inkl. Data Quality) nutzen die Locals
+    beta_raw = _get_nested(data, FINNHUB_FIELDS["beta"])
+    de_raw = _get_nested(data, FINNHUB_FIELDS["debt_to_equity"])
+    tax_raw = _get_nested(data, FINNHUB_FIELDS["tax_rate_for_calcs"])
+    if tax_raw is None:
+        tax_raw = _get_nested(data, FINNHUB_FIELDS["tax_rate_effective"])
+
     assumptions: List[str] = []
     components: Dict[str, Any] = {}
 
@@ -82,7 +84,6 @@ def calculate_wacc(
         re_cost = float(kwargs["cost_of_equity_override"])
         assumptions.append("Cost of equity via cost_of_equity_override.")
     else:
-        beta_raw = _get_nested(data, FINNHUB_FIELDS["beta"])
         beta = float(_require(beta_raw, symbol, FINNHUB_FIELDS["beta"]))
         re_cost = float(risk_free_rate + beta * market_risk_premium)
         assumptions.append("Cost of equity via CAPM (beta aus Finnhub).")
@@ -93,9 +94,6 @@ def calculate_wacc(
         tax_rate = float(kwargs["tax_rate_override"])
         assumptions.append("Tax rate via tax_rate_override.")
     else:
-        tax_raw = _get_nested(data, FINNHUB_FIELDS["tax_rate_for_calcs"])
-        if tax_raw is None:
-            tax_raw = _get_nested(data, FINNHUB_FIELDS["tax_rate_effective"])
         if tax_raw is None:
             tax_rate = float(default_us_corporate_tax)
             assumptions.append("Tax rate defaulted to 0.21 (US corporate), da Finnhub tax-Feld fehlte.")
@@ -121,7 +119,6 @@ def calculate_wacc(
         components["market_value_equity"] = mv_e
         components["market_value_debt"] = mv_d
     else:
-        de_raw = _get_nested(data, FINNHUB_FIELDS["debt_to_equity"])
         de_ratio = float(_require(de_raw, symbol, FINNHUB_FIELDS["debt_to_equity"]))
         if de_ratio < 0:
             raise ValueError(f"{symbol}: debtToEquity muss >= 0 sein (got {de_ratio})")
@@ -136,7 +133,6 @@ def calculate_wacc(
         assumptions.append("Pre-tax cost of debt via pre_tax_cost_of_debt_override.")
     else:
         # Estimate rd from debtToEquity + rf via deterministic spread function
-        de_raw = _get_nested(data, FINNHUB_FIELDS["debt_to_equity"])
         de_ratio = float(_require(de_raw, symbol, FINNHUB_FIELDS["debt_to_equity"]))
         spread = _estimate_credit_spread_from_de_ratio(de_ratio)
         rd_pre_tax = float(risk_free_rate + spread)
@@ -165,29 +161,29 @@ def calculate_wacc(
     )
 
     # Data quality / confidence
-    required_fields = []
+    required_values = []
     if "cost_of_equity_override" not in kwargs:
-        required_fields.append(FINNHUB_FIELDS["beta"])
+        required_values.append(beta_raw)
     if "market_value_equity_override" not in kwargs or "market_value_debt_override" not in kwargs:
-        required_fields.append(FINNHUB_FIELDS["debt_to_equity"])
+        required_values.append(de_raw)
     if "pre_tax_cost_of_debt_override" not in kwargs:
-        required_fields.append(FINNHUB_FIELDS["debt_to_equity"])
+        required_values.append(de_raw)
 
-    present_required = sum(1 for f in required_fields if _get_nested(data, f) is not None)
-    dq_required = present_required / max(1, len(required_fields))
+    present_required = sum(1 for v in required_values if v is not None)
+    dq_required = present_required / max(1, len(required_values))
     confidence = float(round(dq_required, 4))
 
     data_quality = {
         "required_fields_present_ratio": float(round(dq_required, 4)),
     }
 
-    return {
-        "value": float(wacc),
-        "components": components,
-        "assumptions": assumptions,
-        "data_quality": data_quality,
-        "confidence": confidence,
-    }
+    return FormulaResult(
+        value=float(wacc),
+        components=components,
+        assumptions=assumptions,
+        data_quality=data_quality,
+        confidence=confidence,
+    )
 
 
 def _fetch_finnhub_data(symbol: str, client: object) -> Dict[str, Any]:
@@ -222,11 +218,11 @@ def test_calculate_wacc() -> None:
         market_value_debt_override=800.0,
     )
 
-    assert abs(result["value"] - 0.0994) < 0.0005, f"WACC mismatch: {result['value']}"
-    assert result["confidence"] > 0.80, f"Low confidence: {result['confidence']}"
-    assert len(result["assumptions"]) > 0, "Assumptions missing"
+    assert abs(result.value - 0.0994) < 0.0005, f"WACC mismatch: {result.value}"
+    assert result.confidence > 0.80, f"Low confidence: {result.confidence}"
+    assert len(result.assumptions) > 0, "Assumptions missing"
 
-    print(f"WACC Test PASSED: {result['value']:.6f}")
+    print(f"WACC Test PASSED: {result.value:.6f}")
 
 
 if __name__ == "__main__":
@@ -22,13 +22,27 @@ interface BatchResult {
   [symbol: string]: {
     basic_financials?: BasicFinancials;
     quote?: Quote;
-    candles?: unknown[];
+    candles?: BatchCandles;
     analyst_data?: Record<string, unknown>;
     profile?: CompanyProfile;
     error?: string;
   };
 }
 
+/**
+ * Columnar candles as emitted by yfinance_batch.py: one array per field.
+ * A legacy array of per-bar objects is still accepted.
+ */
+interface BatchCandleColumns {
+  t: unknown[];
+  close: unknown[];
+  high?: unknown[];
+  low?: unknown[];
+  volume?: unknown[];
+}
+
+type BatchCandles = BatchCandleColumns | unknown[];
+
 interface BatchCandlePoint {
   t: number;
   close: number;
@@ -159,7 +173,7 @@ export class YFinanceBatchProvider implements MarketDataProvider {
   mapBatchTechnicalMetrics(
     symbol: string,
     quote?: Quote,
-    candles?: unknown[],
+    candles?: BatchCandles,
     basicFinancials?: BasicFinancials
   ): TechnicalMetrics | null {
     return this.buildTechnicalMetrics(symbol, quote, candles, basicFinancials);
@@ -253,7 +267,7 @@ export class YFinanceBatchProvider implements MarketDataProvider {
   private buildTechnicalMetrics(
     symbol: string,
     quote?: Quote,
-    candles?: unknown[],
+    candles?: BatchCandles,
     basicFinancials?: BasicFinancials
   ): TechnicalMetrics | null {
     if (!quote || typeof quote.c !== 'number') return null;
@@ -316,10 +330,12 @@ export class YFinanceBatchProvider implements MarketDataProvider {
     };
   }
 
-  private normalizeCandles(candles?: unknown[]): BatchCandlePoint[] | null {
-    if (!Array.isArray(candles) || candles.length === 0) {
-      return null;
+  private normalizeCandles(candles?: BatchCandles): BatchCandlePoint[] | null {
+    if (!candles) return null;
+    if (!Array.isArray(candles)) {
+      return this.normalizeCandleColumns(candles);
     }
+    if (candles.length === 0) return null;
 
     const points: BatchCandlePoint[] = [];
     for (const candle of candles) {
@@ -341,6 +357,28 @@ export class YFinanceBatchProvider implements MarketDataProvider {
     return points.length > 0 ? points : null;
   }
 
+  private normalizeCandleColumns(columns: BatchCandleColumns): BatchCandlePoint[] | null {
+    if (!Array.isArray(columns.t) || !Array.isArray(columns.close)) return null;
+
+    const points: BatchCandlePoint[] = [];
+    const len = Math.min(columns.t.length, columns.close.length);
+    for (let i = 0; i < len; i++) {
+      const t = this.toNumberOrNull(columns.t[i]);
+      const close = this.toNumberOrNull(columns.close[i]);
+      if (t === null || close === null) continue;
+      points.push({
+        t,
+        close,
+        high: this.toNumberOrNull(columns.high?.[i]),
+        low: this.toNumberOrNull(columns.low?.[i]),
+        volume: this.toNumberOrNull(columns.volume?.[i]),
+      });
+    }
+
+    points.sort((a, b) => a.t - b.t);
+    return points.length > 0 ? points : null;
+  }
+
   private calcReturn(prices: number[], periods: number): number | null {
     if (prices.length <= periods) return null;
     const start = prices[prices.length - 1 - periods];
@@ -0,0 +1,149 @@
+import { createConnection, type Socket } from 'net';
+
+interface PendingRequest {
+  resolve: (value: unknown) => void;
+  reject: (error: Error) => void;
+  timeout: NodeJS.Timeout;
+}
+
+interface DaemonResponse {
+  id: number | null;
+  result?: unknown;
+  error?: string;
+}
+
+/**
+ * Error reported by the daemon itself (bad method, fetch failure), as opposed
+ * to a transport problem such as a missing socket.
+ */
+export class YFinanceDaemonError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = 'YFinanceDaemonError';
+  }
+}
+
+/**
+ * Client for src/data_py/yfinance_daemon.py.
+ *
+ * Keeps one Unix-socket connection open and multiplexes requests over it as
+ * newline-delimited JSON matched by id, so Node talks to a single warm Python
+ * process instead of spawning one per call.
+ */
+export class YFinanceDaemonClient {
+  private socket: Socket | null = null;
+  private connecting: Promise<Socket> | null = null;
+  private buffer = '';
+  private nextId = 1;
+  private readonly pending = new Map<number, PendingRequest>();
+
+  constructor(
+    private readonly socketPath: string,
+    private readonly timeoutMs = 30_000
+  ) {}
+
+  async request<T>(
+    symbol: string,
+    method: string,
+    args: Record<string, unknown> = {}
+  ): Promise<T> {
+    const socket = await this.connect();
+    const id = this.nextId++;
+
+    return new Promise<T>((resolve, reject) => {
+      const timeout = setTimeout(() => {
+        this.pending.delete(id);
+        reject(new Error(`yfinance daemon timeout (${this.timeoutMs / 1000}s)`));
+      }, this.timeoutMs);
+
+      this.pending.set(id, {
+        resolve: (value) => resolve(value as T),
+        reject,
+        timeout,
+      });
+      socket.write(`${JSON.stringify({ id, symbol, method, args })}\n`);
+    });
+  }
+
+  close(): void {
+    this.socket?.end();
+    this.socket = null;
+    this.connecting = null;
+  }
+
+  private connect(): Promise<Socket> {
+    if (this.socket) return Promise.resolve(this.socket);
+
+    if (!this.connecting) {
+      this.connecting = new Promise<Socket>((resolve, reject) => {
+        const socket = createConnection(this.socketPath);
+        socket.setEncoding('utf8');
+
+        socket.once('connect', () => {
+          // Do not keep the Node process alive just for an idle connection
+          socket.unref();
+          this.socket = socket;
+          resolve(socket);
+        });
+
+        socket.on('data', (chunk: string) => this.onData(chunk));
+
+        socket.on('error', (err) => {
+          this.failAll(err);
+          reject(err);
+        });
+
+        socket.on('close', () => {
+          this.socket = null;
+          this.connecting = null;
+          this.buffer = '';
+          this.failAll(new Error('yfinance daemon connection closed'));
+        });
+      });
+    }
+
+    return this.connecting;
+  }
+
+  private onData(chunk: string): void {
+    this.buffer += chunk;
+
+    let newline = this.buffer.indexOf('\n');
+    while (newline >= 0) {
+      const line = this.buffer.slice(0, newline).trim();
+      this.buffer = this.buffer.slice(newline + 1);
+      if (line) this.onResponse(line);
+      newline = this.buffer.indexOf('\n');
+    }
+  }
+
+  private onResponse(line: string): void {
+    let response: DaemonResponse;
+    try {
+      response = JSON.parse(line) as DaemonResponse;
+    } catch {
+      return;
+    }
+
+    if (response.id === null) return;
+    const pending = this.pending.get(response.id);
+    if (!pending) return;
+
+    this.pending.delete(response.id);
+    clearTimeout(pending.timeout);
+
+    if (response.error !== undefined) {
+      pending.reject(new YFinanceDaemonError(response.error));
+    } else {
+      pending.resolve(response.result);
+    }
+  }
+
+  private failAll(error: Error): void {
+    for (const pending of this.pending.values()) {
+      clearTimeout(pending.timeout);
+      pending.reject(error);
+    }
+    this.pending.clear();
+  }
+}
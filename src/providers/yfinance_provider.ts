@@ -11,6 +11,7 @@ import {
   TechnicalMetrics,
 } from './types';
 import { resolvePythonExecutable } from '@/utils/python';
+import { YFinanceDaemonClient, YFinanceDaemonError } from './yfinance_daemon_client';
 
 interface CandlePoint {
   t: number;
@@ -39,6 +40,16 @@ export class YFinanceProvider implements MarketDataProvider {
   );
   private requestCount = 0;
 
+  /**
+   * Optional warm Python process (src/data_py/yfinance_daemon.py). When
+   * YFINANCE_DAEMON_SOCKET is set, requests go over that socket and only fall
+   * back to spawning yfinance_cli.py if the daemon is unreachable.
+   */
+  private readonly daemon: YFinanceDaemonClient | null = (() => {
+    const socketPath = process.env.YFINANCE_DAEMON_SOCKET?.trim();
+    return socketPath ? new YFinanceDaemonClient(socketPath) : null;
+  })();
+
   private basicFinancialsCache = new Map<string, Promise<BasicFinancials>>();
   private quoteCache = new Map<string, Promise<Quote>>();
   private candlesCache = new Map<string, Promise<Candles>>();
@@ -67,7 +78,7 @@ export class YFinanceProvider implements MarketDataProvider {
   }
 
   close(): void {
-    // No persistent resources to clean up
+    this.daemon?.close();
   }
 
   getCompanyProfile(symbol: string) {
@@ -137,6 +148,28 @@ export class YFinanceProvider implements MarketDataProvider {
     symbol: string,
     method: string,
     options?: { daysBack?: number }
+  ): Promise<T> {
+    if (!this.daemon) {
+      return this.spawnCli<T>(symbol, method, options);
+    }
+
+    const args = options?.daysBack !== undefined ? { days_back: options.daysBack } : {};
+    this.requestCount += 1;
+
+    return this.daemon.request<T>(symbol, method, args).catch((error: Error) => {
+      if (error instanceof YFinanceDaemonError) {
+        throw new ProviderError(error.message, 'yfinance', symbol, method, error);
+      }
+      // Daemon not running or connection dropped: use the one-shot CLI
+      this.requestCount -= 1;
+      return this.spawnCli<T>(symbol, method, options);
+    });
+  }
+
+  private spawnCli<T>(
+    symbol: string,
+    method: string,
+    options?: { daysBack?: number }
   ): Promise<T> {
     return new Promise((resolve, reject) => {
       const args = [
@@ -1,7 +1,7 @@
 """Stock scoring system for retail investors."""
 
-from .config import WEIGHT_PROFILES, WeightProfile
-from .quality_gate import should_score_symbol, passes_quality_gate
+from .config import SUBSCORE_KEYS, WEIGHT_PROFILES, WEIGHT_VECTORS, WeightProfile
+from .quality_gate import should_score_symbol, passes_quality_gate, passes_quality_gate_batch
 from .ranking import rank_universe, format_ranking_summary
 
 # Legacy compatibility: older modules expect composite helpers at package level.
@@ -15,10 +15,13 @@ except ImportError:  # pragma: no cover - optional legacy module
     calculate_composite_score = None
 
 __all__ = [
+    "SUBSCORE_KEYS",
     "WEIGHT_PROFILES",
+    "WEIGHT_VECTORS",
     "WeightProfile",
     "should_score_symbol",
     "passes_quality_gate",
+    "passes_quality_gate_batch",
     "rank_universe",
     "format_ranking_summary",
 ]
@@ -1,16 +1,28 @@
 """Scoring configuration and feature registry."""
 
 from dataclasses import dataclass
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, Mapping
+
+import numpy as np
 
 WeightProfile = Literal["pure_value", "conservative", "balanced"]
 
-WEIGHT_PROFILES: dict[str, dict[str, float]] = {
+WEIGHT_PROFILES: Mapping[str, Mapping[str, float]] = {
     "pure_value": {"value": 0.50, "quality": 0.30, "risk": 0.20, "momentum": 0.00},
     "conservative": {"value": 0.40, "quality": 0.30, "risk": 0.20, "momentum": 0.10},
     "balanced": {"value": 0.35, "quality": 0.30, "risk": 0.20, "momentum": 0.15},
 }
 
+# Subscore order for WEIGHT_VECTORS (columns of an (N, 4) subscore matrix)
+SUBSCORE_KEYS: tuple[str, ...] = ("value", "quality", "risk", "momentum")
+
+# Pre-built (4,) float64 weight vectors per profile: composite = subscores @ w
+WEIGHT_VECTORS: Mapping[str, np.ndarray] = {
+    name: np.array([profile[key] for key in SUBSCORE_KEYS], dtype=np.float64)
+    for name, profile in WEIGHT_PROFILES.items()
+}
+
 # Quality Gate Red Flags
 RED_FLAG_THRESHOLDS = {
     "min_roa": 0.0,  # ROA must be > 0
@@ -53,3 +65,17 @@ MOMENTUM_SCORE_WEIGHTS = {
     "price_vs_sma200": 0.60,
     "return_12m_1m": 0.40,
 }
+
+# Freeze the tables above: read-only views guard against accidental mutation.
+WEIGHT_PROFILES = MappingProxyType(
+    {name: MappingProxyType(profile) for name, profile in WEIGHT_PROFILES.items()}
+)
+for _vector in WEIGHT_VECTORS.values():
+    _vector.flags.writeable = False
+del _vector
+WEIGHT_VECTORS = MappingProxyType(WEIGHT_VECTORS)
+RED_FLAG_THRESHOLDS = MappingProxyType(RED_FLAG_THRESHOLDS)
+FINNHUB_FIELDS = MappingProxyType(FINNHUB_FIELDS)
+VALUE_SCORE_WEIGHTS = MappingProxyType(VALUE_SCORE_WEIGHTS)
+QUALITY_SCORE_WEIGHTS = MappingProxyType(QUALITY_SCORE_WEIGHTS)
+MOMENTUM_SCORE_WEIGHTS = MappingProxyType(MOMENTUM_SCORE_WEIGHTS)
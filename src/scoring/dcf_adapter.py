@@ -7,14 +7,19 @@ and error handling without modifying the mathematical formulas.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .formulas.dcf_two_stage import calculate_two_stage_dcf
+from .formulas.dcf_two_stage import _fetch_finnhub_bundle, calculate_two_stage_dcf
 from .formulas.wacc import calculate_wacc
-from .formulas.var_monte_carlo import calculate_monte_carlo_var
+from .formulas.var_monte_carlo import calculate_monte_carlo_var, calculate_monte_carlo_var_batch
 
 logger = logging.getLogger(__name__)
 
+# Parallel symbols in the *_many batch helpers (network-bound)
+MAX_WORKERS = 16
+
 
 class FinnhubClientAdapter:
     """
@@ -27,6 +32,10 @@ class FinnhubClientAdapter:
     - stock_candles(symbol, resolution, from_ts, to_ts)
 
     This adapter wraps our existing FinnhubClient to match this interface.
+
+    Fundamentals (basic financials, profile) are cached per symbol for the
+    current day, so running DCF, WACC and VaR on one adapter fetches them
+    once. Quotes and candles are not cached.
     """
 
     def __init__(self, finnhub_client):
@@ -35,19 +44,68 @@ class FinnhubClientAdapter:
             finnhub_client: Instance of src.data_py.finnhub_client.FinnhubClient
         """
         self.client = finnhub_client
+        self._fetch_cache: Dict[Tuple[str, str], Any] = {}
+        self._fetch_cache_day = ""
+
+        # Resolve client methods once instead of hasattr() on every call
+        self._basic_fn = finnhub_client.get_basic_financials
+        self._quote_fn = getattr(finnhub_client, 'get_quote', None)
+        self._profile_fn = getattr(finnhub_client, 'get_company_profile', None)
+        self._candles_fn = getattr(finnhub_client, 'get_candles', None)
+
+    def _cached(self, endpoint: str, symbol: str, fetch: Callable[[], Any]) -> Any:
+        """Return today's cached ``fetch()`` result for (endpoint, symbol)."""
+        today = date.today().isoformat()
+        if today != self._fetch_cache_day:
+            # Fundamentals from yesterday are stale; drop them all at once
+            self._fetch_cache = {}
+            self._fetch_cache_day = today
+
+        key = (endpoint, symbol)
+        value = self._fetch_cache.get(key)
+        if value is None:
+            value = fetch()
+            self._fetch_cache[key] = value
+        return value
+
+    def fetch_all(self, symbol: str) -> Dict[str, Any]:
+        """
+        DCF data bundle {metric, series, quote, profile}.
+
+        Fundamentals come from today's cache; the quote is fetched live on
+        every call so a long-lived adapter never prices with a stale quote.
+        """
+        return _fetch_finnhub_bundle(symbol, self)
 
     def company_basic_financials(self, symbol: str, metric: str):
         """Fetch basic financials (matches DCF formula expectations)."""
-        return self.client.get_basic_financials(symbol)
+        return self._cached("basic_financials", symbol, lambda: self._basic_fn(symbol))
 
     def quote(self, symbol: str):
         """Fetch current quote."""
         # Our client has get_quote(), DCF formulas expect quote()
-        if hasattr(self.client, 'get_quote'):
-            return self.client.get_quote(symbol)
-        # Fallback: extract from basic_financials if available
+        if self._quote_fn is not None:
+            return self._quote_fn(symbol)
+        return self._quote_fallback(symbol)
+
+    def company_profile2(self, symbol: str):
+        """Fetch company profile."""
+        if self._profile_fn is not None:
+            return self._cached("profile", symbol, lambda: self._profile_fn(symbol))
+        return self._profile_fallback(symbol)
+
+    def stock_candles(self, symbol: str, resolution: str, from_ts: int, to_ts: int):
+        """Fetch historical candles."""
+        if self._candles_fn is None:
+            raise ValueError(f"{symbol}: Candle data not available")
+        # Our client uses days_back instead of from/to timestamps
+        days_back = int((to_ts - from_ts) / 86400)  # 86400 seconds in a day
+        return self._candles_fn(symbol, resolution, days_back)
+
+    def _quote_fallback(self, symbol: str):
+        """Current price from basic_financials when the client has no get_quote()."""
         try:
-            basic = self.client.get_basic_financials(symbol)
+            basic = self.company_basic_financials(symbol, "all")
             # Finnhub sometimes includes current price in metric
             current_price = basic.get('metric', {}).get('currentPrice')
             if current_price:
@@ -56,13 +114,10 @@ class FinnhubClientAdapter:
             pass
         raise ValueError(f"{symbol}: No quote data available")
 
-    def company_profile2(self, symbol: str):
-        """Fetch company profile."""
-        if hasattr(self.client, 'get_company_profile'):
-            return self.client.get_company_profile(symbol)
-        # Fallback: try to extract from basic_financials
+    def _profile_fallback(self, symbol: str):
+        """Shares outstanding from basic_financials when there is no get_company_profile()."""
         try:
-            basic = self.client.get_basic_financials(symbol)
+            basic = self.company_basic_financials(symbol, "all")
             metric = basic.get('metric', {})
             # Try to get shares outstanding from metric
             shares = metric.get('marketCapitalization')
@@ -74,15 +129,12 @@ class FinnhubClientAdapter:
             pass
         raise ValueError(f"{symbol}: No profile data available")
 
-    def stock_candles(self, symbol: str, resolution: str, from_ts: int, to_ts: int):
-        """Fetch historical candles."""
-        if hasattr(self.client, 'get_candles'):
-            # Our client uses days_back instead of from/to timestamps
-            # Calculate days_back from timestamps
-            from datetime import datetime
-            days_back = int((to_ts - from_ts) / 86400)  # 86400 seconds in a day
-            return self.client.get_candles(symbol, resolution, days_back)
-        raise ValueError(f"{symbol}: Candle data not available")
+
+def _as_adapter(finnhub_client) -> FinnhubClientAdapter:
+    """Wrap a client, or reuse an adapter (and its fetch cache) passed in directly."""
+    if isinstance(finnhub_client, FinnhubClientAdapter):
+        return finnhub_client
+    return FinnhubClientAdapter(finnhub_client)
 
 
 def calculate_intrinsic_value_dcf(
@@ -95,7 +147,7 @@ def calculate_intrinsic_value_dcf(
 
     Args:
         symbol: Stock ticker
-        finnhub_client: FinnhubClient instance
+        finnhub_client: FinnhubClient instance (or a FinnhubClientAdapter to share its cache)
         **kwargs: Optional overrides for DCF parameters
 
     Returns:
@@ -110,8 +162,7 @@ def calculate_intrinsic_value_dcf(
         Or None if calculation fails
     """
     try:
-        # Wrap client with adapter
-        adapter = FinnhubClientAdapter(finnhub_client)
+        adapter = _as_adapter(finnhub_client)
 
         # Calculate DCF
         result = calculate_two_stage_dcf(
@@ -161,7 +212,7 @@ def calculate_wacc_score(
 
     Args:
         symbol: Stock ticker
-        finnhub_client: FinnhubClient instance
+        finnhub_client: FinnhubClient instance (or a FinnhubClientAdapter to share its cache)
         **kwargs: Optional overrides
 
     Returns:
@@ -174,7 +225,7 @@ def calculate_wacc_score(
         Or None if calculation fails
     """
     try:
-        adapter = FinnhubClientAdapter(finnhub_client)
+        adapter = _as_adapter(finnhub_client)
         result = calculate_wacc(symbol, adapter, **kwargs)
         return result
     except Exception as e:
@@ -194,7 +245,7 @@ def calculate_var_risk(
 
     Args:
         symbol: Stock ticker
-        finnhub_client: FinnhubClient instance
+        finnhub_client: FinnhubClient instance (or a FinnhubClientAdapter to share its cache)
         confidence_level: VaR confidence (default 95%)
         horizon_days: VaR horizon in days (default 30)
         **kwargs: Optional overrides
@@ -210,7 +261,7 @@ def calculate_var_risk(
         Or None if calculation fails
     """
     try:
-        adapter = FinnhubClientAdapter(finnhub_client)
+        adapter = _as_adapter(finnhub_client)
         result = calculate_monte_carlo_var(
             symbol,
             adapter,
@@ -219,18 +270,110 @@ def calculate_var_risk(
             **kwargs
         )
 
-        var_absolute = result['value']
-        s0 = result['components']['S0']
-        var_percent = (var_absolute / s0) * 100 if s0 > 0 else None
-
-        return {
-            'var_absolute': var_absolute,
-            'var_percent': var_percent,
-            'components': result['components'],
-            'assumptions': result['assumptions'],
-            'data_quality': result['data_quality'],
-            'confidence': result['confidence'],
-        }
+        return _var_risk_payload(result)
     except Exception as e:
         logger.warning(f"{symbol}: VaR calculation failed: {e}")
         return None
+
+
+def _var_risk_payload(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a calculate_monte_carlo_var result as returned by calculate_var_risk."""
+    var_absolute = result['value']
+    s0 = result['components']['S0']
+    var_percent = (var_absolute / s0) * 100 if s0 > 0 else None
+
+    return {
+        'var_absolute': var_absolute,
+        'var_percent': var_percent,
+        'components': result['components'],
+        'assumptions': result['assumptions'],
+        'data_quality': result['data_quality'],
+        'confidence': result['confidence'],
+    }
+
+
+def _run_many(
+    calculate: Callable[..., Optional[Dict[str, Any]]],
+    symbols: List[str],
+    finnhub_client,
+    max_workers: int,
+    **kwargs,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Run one calculate_* wrapper over many symbols on a shared adapter."""
+    if not symbols:
+        return {}
+
+    adapter = _as_adapter(finnhub_client)
+    workers = max(1, min(max_workers, len(symbols)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(lambda symbol: calculate(symbol, adapter, **kwargs), symbols)
+        )
+    return dict(zip(symbols, results))
+
+
+def calculate_intrinsic_value_dcf_many(
+    symbols: List[str],
+    finnhub_client,
+    max_workers: int = MAX_WORKERS,
+    **kwargs
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    calculate_intrinsic_value_dcf for many symbols, fetched concurrently.
+
+    All symbols share one FinnhubClientAdapter, so its day cache also serves
+    later WACC/VaR calls when the same adapter is passed on.
+
+    Returns:
+        Dict symbol -> result (None where the calculation failed)
+    """
+    return _run_many(calculate_intrinsic_value_dcf, symbols, finnhub_client, max_workers, **kwargs)
+
+
+def calculate_wacc_score_many(
+    symbols: List[str],
+    finnhub_client,
+    max_workers: int = MAX_WORKERS,
+    **kwargs
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """calculate_wacc_score for many symbols; see calculate_intrinsic_value_dcf_many."""
+    return _run_many(calculate_wacc_score, symbols, finnhub_client, max_workers, **kwargs)
+
+
+def calculate_var_risk_many(
+    symbols: List[str],
+    finnhub_client,
+    confidence_level: float = 0.95,
+    horizon_days: int = 30,
+    max_workers: int = MAX_WORKERS,
+    **kwargs
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    calculate_var_risk for many symbols in one vectorized simulation.
+
+    Quotes and candles are fetched concurrently through a shared adapter,
+    then calculate_monte_carlo_var_batch simulates all symbols at once.
+
+    Returns:
+        Dict symbol -> result (None where the calculation failed)
+    """
+    if not symbols:
+        return {}
+
+    try:
+        results = calculate_monte_carlo_var_batch(
+            symbols,
+            _as_adapter(finnhub_client),
+            confidence_level=confidence_level,
+            horizon_days=horizon_days,
+            max_workers=max_workers,
+            **kwargs
+        )
+    except Exception as e:
+        logger.warning(f"VaR batch calculation failed: {e}")
+        return {symbol: None for symbol in symbols}
+
+    return {
+        symbol: _var_risk_payload(results[symbol]) if symbol in results else None
+        for symbol in symbols
+    }
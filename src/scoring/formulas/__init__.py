@@ -12,15 +12,14 @@ literature. Do NOT modify the mathematical logic without consulting the
 original sources.
 """
 
-from .dcf_two_stage import calculate_two_stage_dcf, test_calculate_two_stage_dcf
-from .wacc import calculate_wacc, test_calculate_wacc
-from .var_monte_carlo import calculate_monte_carlo_var, test_calculate_monte_carlo_var
+from .dcf_two_stage import calculate_two_stage_dcf, calculate_two_stage_dcf_batch
+from .wacc import calculate_wacc
+from .var_monte_carlo import calculate_monte_carlo_var, calculate_monte_carlo_var_batch
 
 __all__ = [
     "calculate_two_stage_dcf",
+    "calculate_two_stage_dcf_batch",
     "calculate_wacc",
     "calculate_monte_carlo_var",
-    "test_calculate_two_stage_dcf",
-    "test_calculate_wacc",
-    "test_calculate_monte_carlo_var",
+    "calculate_monte_carlo_var_batch",
 ]
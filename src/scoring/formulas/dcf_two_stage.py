@@ -13,13 +13,16 @@
 
 import logging
 import math
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Parallele Finnhub-Requests in calculate_two_stage_dcf_batch
+MAX_WORKERS = 16
+
 # FINNHUB-MAPPING
 FINNHUB_FIELDS = {
     # /company-basic-financials
@@ -44,6 +47,20 @@ def _get_nested(data: Dict[str, Any], path: str) -> Any:
     return cur
 
 
+def _flatten_finnhub_bundle(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Alle Knoten des Bündels unter ihrem Dot-Pfad (``flat[path] == _get_nested(data, path)``)."""
+    flat: Dict[str, Any] = {}
+    stack = [("", data)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((path + ".", value))
+    return flat
+
+
 def _require(value: Any, symbol: str, field_name: str) -> Any:
     if value is None:
         raise ValueError(f"{symbol}: Kritisches Finnhub-Feld fehlt: {field_name}")
@@ -55,39 +72,52 @@ def _as_decimal_if_percent(x: float, symbol: str, field_name: str) -> float:
     Finnhub liefert manche Kennzahlen als Prozent (z.B. 31.4 für 31.4%).
     Heuristik: Werte > 1.5 werden als Prozent interpretiert.
     """
-    if not np.isfinite(x):
+    if not math.isfinite(x):
         raise ValueError(f"{symbol}: Ungültiger Wert für {field_name}: {x}")
     return x / 100.0 if x > 1.5 else x
 
 
-def _sort_series_points(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    def _key(p: Dict[str, Any]) -> str:
-        return str(p.get("period", ""))
+def _period_key(p: Dict[str, Any]) -> str:
+    return str(p.get("period", ""))
 
-    return sorted(points, key=_key)
+
+def _sort_series_points(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(points, key=_period_key)
 
 
 def _extract_latest_value(points: List[Dict[str, Any]], symbol: str, field_name: str) -> float:
     if not points:
         raise ValueError(f"{symbol}: Kritische Zeitreihe leer: {field_name}")
-    pts = _sort_series_points(points)
-    v = pts[-1].get("v")
+    # O(M) statt Sortierung; reversed() -> bei gleicher Periode gewinnt wie bisher der letzte Punkt
+    latest = max(reversed(points), key=_period_key)
+    return _point_value(latest, symbol, field_name, "latest.v")
+
+
+def _point_value(point: Dict[str, Any], symbol: str, field_name: str, label: str = "v") -> float:
+    """Wert eines Zeitreihen-Punkts als float; fehlend/nicht-numerisch -> ValueError mit Symbol."""
+    v = point.get("v")
     if v is None:
-        raise ValueError(f"{symbol}: Kritischer Zeitreihen-Wert fehlt: {field_name} (latest.v)")
+        raise ValueError(f"{symbol}: Kritischer Zeitreihen-Wert fehlt: {field_name} ({label})")
     try:
         return float(v)
     except Exception as exc:
         raise ValueError(f"{symbol}: Nicht-numerischer Zeitreihen-Wert für {field_name}: {v}") from exc
 
 
-def _compute_cagr(
-    end_value: float, start_value: float, years: float, symbol: str, context: str
-) -> float:
-    if years <= 0:
-        raise ValueError(f"{symbol}: CAGR-Jahre müssen > 0 sein ({context})")
-    if start_value <= 0 or end_value <= 0:
-        raise ValueError(f"{symbol}: CAGR benötigt positive Werte ({context}); start={start_value}, end={end_value}")
-    return (end_value / start_value) ** (1.0 / years) - 1.0
+def _compute_log_cagr(values: np.ndarray, symbol: str, context: str) -> float:
+    """
+    Wachstumsrate aus der Steigung einer Log-Regression über alle Punkte.
+
+    Robuster gegen Ausreißer an den Endpunkten als (end/start)^(1/years) - 1;
+    bei genau zwei Punkten identisch mit der klassischen CAGR.
+    """
+    if values.size < 2:
+        raise ValueError(f"{symbol}: CAGR benötigt mindestens 2 Werte ({context})")
+    if not (values > 0).all():
+        raise ValueError(f"{symbol}: CAGR benötigt positive Werte ({context}); values={values.tolist()}")
+    t = np.arange(values.size, dtype=np.float64)
+    slope = np.polyfit(t, np.log(values), 1)[0]
+    return float(np.expm1(slope))
 
 
 def calculate_two_stage_dcf(
@@ -116,7 +146,7 @@ def calculate_two_stage_dcf(
       - Terminal: FCFE_{n+1} über stable reinvestment rate = g_stable / ROE_stable
 
     Pfad B (Fallback, wenn Net Income Serie fehlt):
-      - g_HG aus FCFE CAGR (aus series.annual.freeCashFlow)
+      - g_HG aus FCFE CAGR (Log-Regression über series.annual.freeCashFlow)
       - FCFE_t = FCFE_0 * (1 + g_HG)^t
       - FCFE_{n+1} = FCFE_n * (1 + g_stable)
 
@@ -144,8 +174,96 @@ def calculate_two_stage_dcf(
     ValueError: Wenn kritische Finnhub-Daten fehlen (keine Dummy-Werte).
     """
 
+    # Terminalbedingung hängt nicht von Finnhub ab: Fehlkonfiguration vor dem Fetch melden
+    _stable_cost_of_equity(symbol, risk_free_rate, market_risk_premium, kwargs)
+
     data = _fetch_finnhub_data(symbol, finnhub_client)
+    return _two_stage_dcf_from_data(
+        symbol, data, lookback_years, risk_free_rate, market_risk_premium, **kwargs
+    )
+
+
+def calculate_two_stage_dcf_batch(
+    symbols: List[str],
+    finnhub_client: object,
+    max_workers: int = MAX_WORKERS,
+    lookback_years: int = 5,
+    risk_free_rate: float = 0.04,
+    market_risk_premium: float = 0.055,
+    **kwargs: Any,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Two-Stage DCF für viele Symbole.
+
+    Die Finnhub-Fetches (I/O-bound) laufen parallel; die Bewertung selbst ist
+    pro Symbol bereits über die Jahre vektorisiert. Symbole mit fehlenden oder
+    ungültigen Daten werden geloggt und fehlen im Ergebnis.
+
+    Returns:
+        Dict symbol -> Ergebnis von calculate_two_stage_dcf
+    """
+    if not symbols:
+        return {}
+
+    # Gleiche Parameter für alle Symbole: ungültige Terminalbedingung einmal, vor allen Fetches
+    _stable_cost_of_equity("batch", risk_free_rate, market_risk_premium, kwargs)
+
+    def _fetch(symbol: str) -> Optional[Dict[str, Any]]:
+        try:
+            return _fetch_finnhub_data(symbol, finnhub_client)
+        except Exception:
+            return None  # bereits in _fetch_finnhub_data geloggt
+
+    workers = max(1, min(max_workers, len(symbols)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        bundles = list(executor.map(_fetch, symbols))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for symbol, data in zip(symbols, bundles):
+        if data is None:
+            continue
+        try:
+            results[symbol] = _two_stage_dcf_from_data(
+                symbol, data, lookback_years, risk_free_rate, market_risk_premium, **kwargs
+            )
+        except (ValueError, TypeError) as exc:
+            logger.warning("%s: DCF nicht berechenbar - überspringe: %s", symbol, exc)
+    return results
+
+
+def _stable_cost_of_equity(
+    symbol: str, risk_free_rate: float, market_risk_premium: float, kwargs: Dict[str, Any]
+) -> float:
+    """
+    r_e,stable aus Override oder CAPM mit stable_beta; prüft r_e,stable > g_stable.
+
+    Braucht keine Finnhub-Daten und kann daher vor dem Fetch laufen.
+    """
+    stable_growth_rate = float(kwargs.get("stable_growth_rate", risk_free_rate))
+    if "cost_of_equity_stable" in kwargs:
+        re_stable = float(kwargs["cost_of_equity_stable"])
+    else:
+        stable_beta = float(kwargs.get("stable_beta", 1.0))
+        re_stable = float(risk_free_rate + stable_beta * market_risk_premium)
+
+    if re_stable <= stable_growth_rate:
+        raise ValueError(f"{symbol}: Terminalbedingung verletzt: r_e,stable ({re_stable}) <= g_stable ({stable_growth_rate})")
+    return re_stable
+
 
+def _two_stage_dcf_from_data(
+    symbol: str,
+    data: Dict[str, Any],
+    lookback_years: int,
+    risk_free_rate: float,
+    market_risk_premium: float,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Bewertungslogik von calculate_two_stage_dcf auf einem bereits geladenen Datenbündel."""
+    # Feldzugriffe als O(1)-Lookup statt Pfad-Traversierung
+    flat = data.get("_flat")
+    if flat is None:
+        flat = _flatten_finnhub_bundle(data)
     assumptions: List[str] = []
     components: Dict[str, Any] = {}
 
@@ -159,7 +277,7 @@ def calculate_two_stage_dcf(
     )
 
     # Shares outstanding
-    shares_outstanding = _get_nested(data, FINNHUB_FIELDS["shares_outstanding"])
+    shares_outstanding = flat.get(FINNHUB_FIELDS["shares_outstanding"])
     if shares_outstanding is None:
         if "shares_outstanding_override" in kwargs:
             shares_outstanding = float(kwargs["shares_outstanding_override"])
@@ -171,7 +289,7 @@ def calculate_two_stage_dcf(
         raise ValueError(f"{symbol}: shares_outstanding muss > 0 sein (got {shares_outstanding})")
 
     # Series: FCFE proxy (Finnhub freeCashFlow)
-    fcf_points = _get_nested(data, FINNHUB_FIELDS["free_cash_flow_series_annual"])
+    fcf_points = flat.get(FINNHUB_FIELDS["free_cash_flow_series_annual"])
     _require(fcf_points, symbol, FINNHUB_FIELDS["free_cash_flow_series_annual"])
     if not isinstance(fcf_points, list) or len(fcf_points) < 2:
         raise ValueError(f"{symbol}: Zu wenige Datenpunkte in series.annual.freeCashFlow (min 2 benötigt)")
@@ -180,8 +298,8 @@ def calculate_two_stage_dcf(
     components["fcfe0"] = fcfe0
 
     # Optional: Net income series for Damodaran-style growth derivation
-    net_income_points = _get_nested(data, FINNHUB_FIELDS["net_income_series_annual"])
-    roe_raw = _get_nested(data, FINNHUB_FIELDS["roe"])
+    net_income_points = flat.get(FINNHUB_FIELDS["net_income_series_annual"])
+    roe_raw = flat.get(FINNHUB_FIELDS["roe"])
 
     use_net_income_path = isinstance(net_income_points, list) and len(net_income_points) >= 1 and roe_raw is not None
 
@@ -194,7 +312,7 @@ def calculate_two_stage_dcf(
             raise ValueError(f"{symbol}: NetIncome_0 muss > 0 sein für Damodaran-Pfad (got {net_income0})")
 
         equity_reinvestment_rate = 1.0 - (fcfe0 / net_income0)
-        if not np.isfinite(equity_reinvestment_rate) or equity_reinvestment_rate < 0 or equity_reinvestment_rate > 1:
+        if not math.isfinite(equity_reinvestment_rate) or equity_reinvestment_rate < 0 or equity_reinvestment_rate > 1:
             raise ValueError(
                 f"{symbol}: Ungültige Equity Reinvestment Rate (1 - FCFE/NI)={equity_reinvestment_rate} "
                 f"(FCFE0={fcfe0}, NI0={net_income0})"
@@ -212,15 +330,22 @@ def calculate_two_stage_dcf(
         assumptions.append("High-growth rate via Damodaran: g_high = ROE * EquityReinvestmentRate (aus Finnhub series + metric).")
     else:
         # Fallback: CAGR from FCFE series (must still come from series.annual.*)
-        pts = _sort_series_points(fcf_points)
-        years = min(lookback_years, len(pts) - 1)
-        if years < 1:
+        if lookback_years < 1:
             raise ValueError(f"{symbol}: lookback_years zu klein oder zu wenige FCFE-Datenpunkte")
-        start_value = float(pts[-(years + 1)].get("v"))
-        end_value = float(pts[-1].get("v"))
-        g_high = _compute_cagr(end_value, start_value, float(years), symbol, "FCFE CAGR")
+        window = _sort_series_points(fcf_points)[-(lookback_years + 1):]
+        values = np.array(
+            [
+                _point_value(p, symbol, "series.annual.freeCashFlow", f"{p.get('period')}.v")
+                for p in window
+            ],
+            dtype=np.float64,
+        )
+        g_high = _compute_log_cagr(values, symbol, "FCFE CAGR")
         components["g_high"] = g_high
-        assumptions.append("High-growth rate via FCFE CAGR aus Finnhub series.annual.freeCashFlow (NetIncome-Serie fehlte).")
+        assumptions.append(
+            f"High-growth rate via Log-Regressions-CAGR über die letzten {values.size} FCFE-Punkte "
+            "aus Finnhub series.annual.freeCashFlow (NetIncome-Serie fehlte)."
+        )
 
     if g_high is None:
         raise ValueError(f"{symbol}: Konnte g_high nicht bestimmen (kritisch)")
@@ -230,39 +355,33 @@ def calculate_two_stage_dcf(
         re_hg = float(kwargs["cost_of_equity_high_growth"])
         assumptions.append("Cost of equity (HG) via cost_of_equity_high_growth override.")
     else:
-        beta_raw = _get_nested(data, FINNHUB_FIELDS["beta"])
+        beta_raw = flat.get(FINNHUB_FIELDS["beta"])
         beta = float(_require(beta_raw, symbol, FINNHUB_FIELDS["beta"]))
         re_hg = float(risk_free_rate + beta * market_risk_premium)
         assumptions.append("Cost of equity (HG) via CAPM: rf + beta * MRP (beta aus Finnhub).")
 
+    re_stable = _stable_cost_of_equity(symbol, risk_free_rate, market_risk_premium, kwargs)
     if "cost_of_equity_stable" in kwargs:
-        re_stable = float(kwargs["cost_of_equity_stable"])
         assumptions.append("Cost of equity (stable) via cost_of_equity_stable override.")
     else:
-        stable_beta = float(kwargs.get("stable_beta", 1.0))
-        re_stable = float(risk_free_rate + stable_beta * market_risk_premium)
         assumptions.append("Cost of equity (stable) via CAPM mit stable_beta (default 1.0).")
 
-    if re_stable <= stable_growth_rate:
-        raise ValueError(f"{symbol}: Terminalbedingung verletzt: r_e,stable ({re_stable}) <= g_stable ({stable_growth_rate})")
-
     components["re_high_growth"] = re_hg
     components["re_stable"] = re_stable
     components["stable_growth_rate"] = stable_growth_rate
     components["high_growth_years"] = high_growth_years
 
-    # Project cash flows
-    pv_fcfe = 0.0
-    fcfe_series_proj: List[float] = []
+    # Project cash flows (vektorisiert über t = 1..n)
+    t_vec = np.arange(1, high_growth_years + 1, dtype=np.float64)
+    growth = np.power(1.0 + g_high, t_vec)
+    disc = np.power(1.0 + re_hg, t_vec)
+    one_plus_g_stable = 1.0 + stable_growth_rate
 
     if use_net_income_path and equity_reinvestment_rate is not None:
         # Project net income & FCFE in HG
         net_income0 = float(components["net_income0"])
-        for t in range(1, high_growth_years + 1):
-            ni_t = net_income0 * ((1.0 + g_high) ** t)
-            fcfe_t = ni_t * (1.0 - equity_reinvestment_rate)
-            fcfe_series_proj.append(fcfe_t)
-            pv_fcfe += fcfe_t / ((1.0 + re_hg) ** t)
+        fcfe_series_proj = net_income0 * growth * (1.0 - equity_reinvestment_rate)
+        pv_fcfe = math.fsum(fcfe_series_proj / disc)
 
         # Terminal FCFE_{n+1}
         stable_roe = kwargs.get("stable_roe", None)
@@ -279,31 +398,30 @@ def calculate_two_stage_dcf(
             stable_reinv = None
             assumptions.append("Terminal FCFE fallback: FCFE_(n+1) = FCFE_n*(1+g_stable) (stable_roe nicht gesetzt).")
 
-        fcfe_n = fcfe_series_proj[-1]
+        fcfe_n = float(fcfe_series_proj[-1])
         if stable_reinv is None:
-            fcfe_n1 = fcfe_n * (1.0 + stable_growth_rate)
+            fcfe_n1 = fcfe_n * one_plus_g_stable
         else:
             # NetIncome_{n} and NetIncome_{n+1} in stable growth
-            ni_n = net_income0 * ((1.0 + g_high) ** high_growth_years)
-            ni_n1 = ni_n * (1.0 + stable_growth_rate)
+            ni_n = net_income0 * float(growth[-1])
+            ni_n1 = ni_n * one_plus_g_stable
             fcfe_n1 = ni_n1 * (1.0 - stable_reinv)
 
     else:
         # Project FCFE directly in HG
-        for t in range(1, high_growth_years + 1):
-            fcfe_t = fcfe0 * ((1.0 + g_high) ** t)
-            fcfe_series_proj.append(fcfe_t)
-            pv_fcfe += fcfe_t / ((1.0 + re_hg) ** t)
+        fcfe_series_proj = fcfe0 * growth
+        pv_fcfe = math.fsum(fcfe_series_proj / disc)
 
-        fcfe_n = fcfe_series_proj[-1]
-        fcfe_n1 = fcfe_n * (1.0 + stable_growth_rate)
+        fcfe_n = float(fcfe_series_proj[-1])
+        fcfe_n1 = fcfe_n * one_plus_g_stable
         assumptions.append("Terminal FCFE via FCFE_n*(1+g_stable) (NetIncome-Serie fehlte).")
 
     if fcfe_n1 <= 0:
         raise ValueError(f"{symbol}: FCFE_(n+1) muss > 0 sein für Terminal Value (got {fcfe_n1})")
 
     terminal_value = fcfe_n1 / (re_stable - stable_growth_rate)
-    pv_terminal = terminal_value / ((1.0 + re_hg) ** high_growth_years)
+    # (1 + r_e,HG)^n liegt bereits als letzter Diskontfaktor vor
+    pv_terminal = terminal_value / float(disc[-1])
 
     equity_value = pv_fcfe + pv_terminal
 
@@ -318,7 +436,7 @@ def calculate_two_stage_dcf(
     intrinsic_per_share = equity_value / shares_outstanding
 
     components["pv_fcfe_high_growth"] = pv_fcfe
-    components["fcfe_projected_high_growth"] = fcfe_series_proj
+    components["fcfe_projected_high_growth"] = fcfe_series_proj.tolist()
     components["fcfe_n_plus_1"] = fcfe_n1
     components["terminal_value"] = terminal_value
     components["pv_terminal_value"] = pv_terminal
@@ -339,8 +457,8 @@ def calculate_two_stage_dcf(
         FINNHUB_FIELDS["current_price"],
     ]
 
-    present_required = sum(1 for f in required_fields if _get_nested(data, f) is not None)
-    present_optional = sum(1 for f in optional_fields if _get_nested(data, f) is not None)
+    present_required = sum(1 for f in required_fields if flat.get(f) is not None)
+    present_optional = sum(1 for f in optional_fields if flat.get(f) is not None)
     dq_required = present_required / max(1, len(required_fields))
     dq_optional = present_optional / max(1, len(optional_fields))
     confidence = float(round(dq_required * 0.85 + dq_optional * 0.15, 4))
@@ -364,19 +482,39 @@ def calculate_two_stage_dcf(
 # FINNHUB-DATA-FETCHER
 # ============================================================================
 def _fetch_finnhub_data(symbol: str, client: object) -> Dict[str, Any]:
-    """Holt und validiert benötigte Finnhub-Daten (ohne Dummy-Fallbacks)."""
-    try:
-        basic = client.company_basic_financials(symbol, "all")
-        quote = client.quote(symbol)
+    """
+    Datenbündel für symbol; nutzt client.fetch_all (z.B. den Tages-Cache von
+    FinnhubClientAdapter), falls vorhanden.
+    """
+    if hasattr(client, "fetch_all"):
+        return client.fetch_all(symbol)
+    return _fetch_finnhub_bundle(symbol, client)
 
+
+def _fetch_finnhub_bundle(symbol: str, client: object) -> Dict[str, Any]:
+    """
+    Holt und validiert benötigte Finnhub-Daten (ohne Dummy-Fallbacks).
+
+    Die drei Requests sind unabhängig: Quote und Profile laufen in Threads,
+    basic-financials im aufrufenden Thread. Setzt voraus, dass der Client
+    parallele GETs verträgt (requests.Session tut das).
+    """
+    try:
         # profile2 ist kritisch für shareOutstanding
         if hasattr(client, "company_profile2"):
-            profile = client.company_profile2(symbol)
+            fetch_profile = client.company_profile2
         elif hasattr(client, "company_profile"):  # seltene API-Wrapper-Variante
-            profile = client.company_profile(symbol)
+            fetch_profile = client.company_profile
         else:
             raise ValueError(f"{symbol}: Finnhub-Client hat keine Methode company_profile2/company_profile")
 
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            quote_future = executor.submit(client.quote, symbol)
+            profile_future = executor.submit(fetch_profile, symbol)
+            basic = client.company_basic_financials(symbol, "all")
+            quote = quote_future.result()
+            profile = profile_future.result()
+
         if not isinstance(basic, dict) or "metric" not in basic:
             raise ValueError(f"{symbol}: Kein 'metric' Feld in /company-basic-financials")
 
@@ -386,66 +524,10 @@ def _fetch_finnhub_data(symbol: str, client: object) -> Dict[str, Any]:
         if not isinstance(profile, dict):
             raise ValueError(f"{symbol}: Ungültige Profile-Antwort")
 
-        return {"metric": basic.get("metric", {}), "series": basic.get("series", {}), "quote": quote, "profile": profile}
+        data = {"metric": basic.get("metric", {}), "series": basic.get("series", {}), "quote": quote, "profile": profile}
+        data["_flat"] = _flatten_finnhub_bundle(data)
+        return data
     except Exception as exc:
         logger.error("Finnhub-Fetch fehlgeschlagen für %s: %s", symbol, exc)
         raise
 
-
-# ============================================================================
-# TEST-CASE (Damodaran: Nestle, Table 14.9 / Terminal Value)
-# ============================================================================
-def test_calculate_two_stage_dcf():
-    """Test mit Damodaran-Nestle-Beispiel (Table 14.9; Ziel ~109.09 pro Aktie)."""
-
-    class MockFinnhubClient:
-        def company_basic_financials(self, symbol: str, metric: str):
-            # Werte in "SFr mil" (wie im Buch). Units sind egal, solange konsistent.
-            # Wir liefern year0 (implizit) NetIncome0 & FCFE0, daraus folgen g_high über ROE*reinvest.
-            return {
-                "metric": {
-                    "roe": 31.40,  # % (wird zu 0.3140)
-                },
-                "series": {
-                    "annual": {
-                        # year0 (implizit): FCFE0 ~ 9,606.3 (aus Buch rückgerechnet),
-                        # plus ein älterer Punkt, damit die Zeitreihe nicht leer ist.
-                        "freeCashFlow": [
-                            {"period": "2022", "v": 9230.0},
-                            {"period": "2023", "v": 9606.3},
-                        ],
-                        "netIncome": [
-                            {"period": "2022", "v": 10618.0},
-                            {"period": "2023", "v": 11061.7},
-                        ],
-                    }
-                },
-            }
-
-        def quote(self, symbol: str):
-            return {"c": 0.0}
-
-        def company_profile2(self, symbol: str):
-            return {"shareOutstanding": 2621.3}
-
-    client = MockFinnhubClient()
-
-    result = calculate_two_stage_dcf(
-        "NESN",
-        client,
-        high_growth_years=5,
-        # Buchannahmen:
-        risk_free_rate=0.01,
-        stable_growth_rate=0.01,
-        stable_roe=0.15,
-        cost_of_equity_high_growth=0.0464,
-        cost_of_equity_stable=0.0538,
-        cash_and_marketable_securities=5851.0,
-    )
-
-    # Buchziel: ca. 109.09; wegen Rundungen tolerieren wir leicht.
-    assert abs(result["value"] - 109.09) < 0.75, f"Value mismatch: {result['value']}"
-    assert result["confidence"] > 0.80, f"Low confidence: {result['confidence']}"
-    assert len(result["assumptions"]) > 0, "Assumptions missing"
-
-    print(f"Two-Stage DCF Test PASSED: {result['value']:.4f} (confidence={result['confidence']})")
@@ -11,13 +11,17 @@
 
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Parallele Finnhub-Requests in calculate_monte_carlo_var_batch
+MAX_WORKERS = 16
+
 FINNHUB_FIELDS = {
     "current_price": "quote.c",
     # stock/candle response (typisch): {"c":[...], "t":[...], "s":"ok"}
@@ -89,6 +93,101 @@ def calculate_monte_carlo_var(
     ValueError bei fehlenden Finnhub-Daten (ohne Dummy-Fallbacks).
     """
 
+    _validate_params(symbol, confidence_level, horizon_days, simulations)
+
+    seed = kwargs.get("seed", None)
+    rng = np.random.default_rng(seed) if seed is not None else np.random.default_rng()
+
+    s0, sigma, assumptions = _resolve_inputs(symbol, finnhub_client, lookback_days, kwargs)
+
+    T = float(horizon_days / 365.0)
+    z = rng.standard_normal(simulations)
+    st = s0 * np.exp((risk_free_rate - 0.5 * sigma ** 2) * T + sigma * math.sqrt(T) * z)
+    pnl = st - s0
+
+    var_percentile = (1.0 - confidence_level) * 100.0
+    q = float(np.percentile(pnl, var_percentile))
+
+    return _var_result(s0, sigma, q, T, simulations, confidence_level, risk_free_rate, assumptions, kwargs)
+
+
+def calculate_monte_carlo_var_batch(
+    symbols: List[str],
+    finnhub_client: object,
+    confidence_level: float = 0.95,
+    horizon_days: int = 30,
+    simulations: int = 10_000,
+    lookback_days: int = 365,
+    risk_free_rate: float = 0.05,
+    max_workers: int = MAX_WORKERS,
+    **kwargs: Any,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Monte-Carlo VaR für viele Symbole in einer einzigen vektorisierten Simulation.
+
+    S0 und sigma werden parallel von Finnhub geholt und zu (N,)-Arrays gestapelt.
+    Danach gibt es genau eine Normal-Ziehung Z (simulations,), die alle Symbole
+    teilen; S_T wird als (N, simulations)-Matrix berechnet und das
+    (1-alpha)-Quantil zeilenweise genommen. S_T ist unter GBM exakt in einem
+    Schritt simulierbar, eine Zeitachse (Pfade über horizon_days) ist daher
+    nicht nötig.
+
+    Gleiche Parameter/Overrides wie calculate_monte_carlo_var (gelten für alle
+    Symbole). Symbole, deren Inputs nicht geholt werden können, werden geloggt
+    und fehlen im Ergebnis.
+
+    Returns:
+        Dict symbol -> Ergebnis-Dict wie calculate_monte_carlo_var
+    """
+    _validate_params("batch", confidence_level, horizon_days, simulations)
+    if not symbols:
+        return {}
+
+    def _one(symbol: str) -> Optional[Tuple[float, float, List[str]]]:
+        try:
+            s0_i, sigma_i, assumptions_i = _resolve_inputs(symbol, finnhub_client, lookback_days, kwargs)
+        except Exception as exc:
+            logger.warning("%s: VaR nicht berechenbar - überspringe: %s", symbol, exc)
+            return None
+        return s0_i, sigma_i, assumptions_i
+
+    workers = max(1, min(max_workers, len(symbols)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetched = list(executor.map(_one, symbols))
+
+    ok = [(symbol, inputs) for symbol, inputs in zip(symbols, fetched) if inputs is not None]
+    if not ok:
+        return {}
+
+    s0 = np.array([inputs[0] for _, inputs in ok])
+    sigma = np.array([inputs[1] for _, inputs in ok])
+
+    seed = kwargs.get("seed", None)
+    rng = np.random.default_rng(seed) if seed is not None else np.random.default_rng()
+
+    T = float(horizon_days / 365.0)
+    z = rng.standard_normal(simulations)
+
+    # PnL (N, simulations) in einem Buffer: S0 * exp(drift + diffusion * Z) - S0
+    pnl = np.multiply.outer(sigma * math.sqrt(T), z)
+    pnl += ((risk_free_rate - 0.5 * sigma ** 2) * T)[:, None]
+    np.exp(pnl, out=pnl)
+    pnl *= s0[:, None]
+    pnl -= s0[:, None]
+
+    var_percentile = (1.0 - confidence_level) * 100.0
+    q = np.percentile(pnl, var_percentile, axis=1)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for row, (symbol, (s0_i, sigma_i, assumptions_i)) in enumerate(ok):
+        assumptions_i.append("Batch-Simulation: alle Symbole teilen dieselben Normal-Ziehungen Z.")
+        results[symbol] = _var_result(
+            s0_i, sigma_i, float(q[row]), T, simulations, confidence_level, risk_free_rate, assumptions_i, kwargs
+        )
+    return results
+
+
+def _validate_params(symbol: str, confidence_level: float, horizon_days: int, simulations: int) -> None:
     if not (0.50 < confidence_level < 0.9999):
         raise ValueError(f"{symbol}: confidence_level muss (0.5, 0.9999) sein (got {confidence_level})")
     if horizon_days <= 0:
@@ -96,11 +195,12 @@ def calculate_monte_carlo_var(
     if simulations < 1000:
         raise ValueError(f"{symbol}: simulations sollte >= 1000 sein (got {simulations})")
 
-    assumptions: List[str] = []
-    components: Dict[str, Any] = {}
 
-    seed = kwargs.get("seed", None)
-    rng = np.random.default_rng(seed) if seed is not None else np.random.default_rng()
+def _resolve_inputs(
+    symbol: str, finnhub_client: object, lookback_days: int, kwargs: Dict[str, Any]
+) -> Tuple[float, float, List[str]]:
+    """S0 (Quote) und sigma (Candles) oder deren Overrides; validiert beide."""
+    assumptions: List[str] = []
 
     # S0
     if "current_price_override" in kwargs:
@@ -129,27 +229,34 @@ def calculate_monte_carlo_var(
     if sigma <= 0 or not np.isfinite(sigma):
         raise ValueError(f"{symbol}: sigma muss > 0 und endlich sein (got {sigma})")
 
-    T = float(horizon_days / 365.0)
-    z = rng.standard_normal(simulations)
-    st = s0 * np.exp((risk_free_rate - 0.5 * sigma ** 2) * T + sigma * math.sqrt(T) * z)
-    pnl = st - s0
+    return s0, sigma, assumptions
 
+
+def _var_result(
+    s0: float,
+    sigma: float,
+    q: float,
+    T: float,
+    simulations: int,
+    confidence_level: float,
+    risk_free_rate: float,
+    assumptions: List[str],
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Ergebnis-Dict aus dem PnL-Quantil q (gemeinsam für Einzel- und Batch-Pfad)."""
     var_percentile = (1.0 - confidence_level) * 100.0
-    q = float(np.percentile(pnl, var_percentile))
     var_value = float(-q)
 
-    components.update(
-        {
-            "S0": s0,
-            "sigma": sigma,
-            "risk_free_rate": risk_free_rate,
-            "T_years": T,
-            "simulations": simulations,
-            "confidence_level": confidence_level,
-            "percentile_used": var_percentile,
-            "pnl_percentile_value": q,
-        }
-    )
+    components: Dict[str, Any] = {
+        "S0": s0,
+        "sigma": sigma,
+        "risk_free_rate": risk_free_rate,
+        "T_years": T,
+        "simulations": simulations,
+        "confidence_level": confidence_level,
+        "percentile_used": var_percentile,
+        "pnl_percentile_value": q,
+    }
 
     # Data quality / confidence
     # Wenn wir Overrides nutzen, ist Finnhub-Completeness hier nicht der Treiber.
@@ -7,58 +7,36 @@ CLI wrapper for Monte Carlo Fair Value calculation - invoked by TypeScript via c
 Usage:
     python3 monte_carlo_cli.py --symbol AAPL --iterations 1000
     python3 monte_carlo_cli.py --symbol MSFT --iterations 100 --risk_free_rate 0.045
+    python3 monte_carlo_cli.py --symbols AAPL,MSFT,NVDA --iterations 1000
 """
 
 import sys
 import json
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-
-class FinnhubClientAdapter:
-    """
-    Adapter to make FinnhubClient compatible with formula module expectations.
-
-    The formula modules expect methods like:
-    - company_basic_financials(symbol, metric)
-    - quote(symbol)
-    - company_profile2(symbol)
-
-    But FinnhubClient has:
-    - get_basic_financials(symbol)
-    - get_quote(symbol)
-    - get_company_profile(symbol)
-    """
-
-    def __init__(self, finnhub_client):
-        self.client = finnhub_client
-
-    def company_basic_financials(self, symbol: str, metric: str = "all"):
-        """Adapter for company_basic_financials method."""
-        return self.client.get_basic_financials(symbol)
-
-    def quote(self, symbol: str):
-        """Adapter for quote method."""
-        return self.client.get_quote(symbol)
-
-    def company_profile2(self, symbol: str):
-        """Adapter for company_profile2 method."""
-        return self.client.get_company_profile(symbol)
+# Parallel symbols for --symbols (each symbol also fetches its endpoints in parallel)
+MAX_WORKERS = 8
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Monte Carlo Fair Value CLI"
     )
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         "--symbol",
-        required=True,
         help="Stock symbol"
     )
+    target.add_argument(
+        "--symbols",
+        help="Comma-separated stock symbols; prints one JSON object keyed by symbol"
+    )
     parser.add_argument(
         "--iterations",
         type=int,
@@ -84,6 +62,7 @@ def main():
         # Import heavy dependencies lazily so "--help" works even when optional
         # runtime packages (e.g. numpy) are missing in the current Python env.
         from scoring.formulas.monte_carlo_lite import calculate_monte_carlo_fair_value
+        from scoring.dcf_adapter import FinnhubClientAdapter
         from data_py.finnhub_client import FinnhubClient
         from data_py.cache import SQLiteCache
 
@@ -100,17 +79,35 @@ def main():
         # Create Finnhub client
         finnhub_client = FinnhubClient(api_key=api_key, cache=cache)
 
-        # Wrap with adapter
+        # Wrap with adapter; its day cache serves every symbol of a --symbols run
         client_adapter = FinnhubClientAdapter(finnhub_client)
 
+        def run_one(symbol: str) -> dict:
+            return calculate_monte_carlo_fair_value(
+                symbol,
+                client_adapter,
+                iterations=args.iterations,
+                risk_free_rate=args.risk_free_rate,
+                market_risk_premium=args.market_risk_premium,
+            )
+
+        if args.symbols:
+            # Network-bound: run symbols concurrently, report failures per symbol
+            symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+
+            def run_safe(symbol: str) -> dict:
+                try:
+                    return run_one(symbol)
+                except Exception as exc:
+                    return {"error": str(exc), "symbol": symbol, "iterations": args.iterations}
+
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(symbols)))) as executor:
+                results = dict(zip(symbols, executor.map(run_safe, symbols)))
+            print(json.dumps(results, ensure_ascii=False))
+            sys.exit(0)
+
         # Calculate Monte Carlo fair value
-        result = calculate_monte_carlo_fair_value(
-            args.symbol,
-            client_adapter,
-            iterations=args.iterations,
-            risk_free_rate=args.risk_free_rate,
-            market_risk_premium=args.market_risk_premium,
-        )
+        result = run_one(args.symbol)
 
         # Output JSON to stdout
         print(json.dumps(result, ensure_ascii=False))
@@ -119,7 +116,7 @@ def main():
     except Exception as exc:  # pragma: no cover - defensive CLI guard
         error = {
             "error": str(exc),
-            "symbol": args.symbol,
+            "symbol": args.symbol or args.symbols,
             "iterations": args.iterations,
         }
         print(json.dumps(error), file=sys.stderr)
@@ -1,6 +1,9 @@
 """Quality gate with red flag checks for stock screening."""
 
-from typing import Optional
+from typing import Any, Mapping, Optional
+
+import numpy as np
+
 from .config import RED_FLAG_THRESHOLDS, MAX_MISSING_RATIO, FINNHUB_FIELDS
 
 
@@ -29,6 +32,37 @@ RED_FLAGS = {
     "overleveraged": lambda m: _debt_equity_ratio(m)
     > RED_FLAG_THRESHOLDS["max_debt_equity"],
 }
+RED_FLAG_ITEMS = tuple(RED_FLAGS.items())
+# Column order of the flag matrix returned by passes_quality_gate_batch
+RED_FLAG_NAMES = tuple(RED_FLAGS)
+
+# Required fields for scoring
+REQUIRED_FIELDS = (
+    "beta",
+    "roic",
+    "grossMargin",
+    "enterpriseValueOverEBITDA",
+    "freeCashFlow",
+    "priceBookMrq",
+    "marketCapitalization",
+    "totalDebt",
+    "totalEquity",
+    "roa",
+)
+
+
+def _metric_columns(metrics: Mapping[str, Any], *fields: str) -> list[np.ndarray]:
+    """
+    Float arrays for ``fields`` from a DataFrame or dict of equal-length arrays.
+
+    None/NaN entries and absent columns come back as NaN; an empty mapping
+    gives empty arrays (an empty universe).
+    """
+    n = len(metrics[next(iter(metrics))]) if len(metrics) else 0
+    return [
+        np.asarray(metrics[field], dtype=float) if field in metrics else np.full(n, np.nan)
+        for field in fields
+    ]
 
 
 def passes_quality_gate(metrics: dict) -> tuple[bool, list[str]]:
@@ -48,7 +82,7 @@ def passes_quality_gate(metrics: dict) -> tuple[bool, list[str]]:
     """
     triggered_flags = []
 
-    for flag_name, check_func in RED_FLAGS.items():
+    for flag_name, check_func in RED_FLAG_ITEMS:
         if check_func(metrics):
             triggered_flags.append(flag_name)
 
@@ -56,6 +90,50 @@ def passes_quality_gate(metrics: dict) -> tuple[bool, list[str]]:
     return passes, triggered_flags
 
 
+def _red_flag_columns(metrics: Mapping[str, Any]) -> dict[str, np.ndarray]:
+    """Vectorized RED_FLAGS: flag name -> bool array (N,)."""
+    roa, fcf, debt, equity = _metric_columns(
+        metrics, "roa", "freeCashFlow", "totalDebt", "totalEquity"
+    )
+    if "totalEquity" not in metrics:
+        # Same default as _debt_equity_ratio for an absent key
+        equity = np.ones_like(equity)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        debt_equity = np.where(equity > 0, np.nan_to_num(debt, nan=0.0) / equity, np.inf)
+
+    return {
+        "unprofitable": np.nan_to_num(roa, nan=0.0) <= 0,
+        "cash_burner": np.nan_to_num(fcf, nan=0.0) <= 0,
+        "overleveraged": debt_equity > RED_FLAG_THRESHOLDS["max_debt_equity"],
+    }
+
+
+def passes_quality_gate_batch(metrics: Mapping[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized passes_quality_gate for a whole universe.
+
+    Missing values follow the per-symbol rules: missing ROA or FCF is treated
+    as 0 (flagged), missing debt as 0, an absent totalEquity column as 1, and
+    missing (None/NaN) or non-positive equity makes debt/equity infinite.
+    Unlike the per-symbol check, a None debt entry counts as 0 instead of
+    raising.
+
+    Args:
+        metrics: pandas DataFrame or dict of equal-length arrays with the
+            metric columns (roa, freeCashFlow, totalDebt, totalEquity)
+
+    Returns:
+        Tuple of (passes: bool array (N,), flags: bool array (N, 3)); flag
+        columns are ordered as RED_FLAG_NAMES
+    """
+    columns = _red_flag_columns(metrics)
+    flags = np.column_stack([columns[name] for name in RED_FLAG_NAMES])
+
+    passes = ~flags.any(axis=1)
+    return passes, flags
+
+
 def has_sufficient_data(metrics: dict) -> tuple[bool, float]:
     """
     Check if a stock has sufficient data for scoring.
@@ -66,23 +144,9 @@ def has_sufficient_data(metrics: dict) -> tuple[bool, float]:
     Returns:
         Tuple of (sufficient: bool, missing_ratio: float)
     """
-    # Required fields for scoring
-    required_fields = [
-        "beta",
-        "roic",
-        "grossMargin",
-        "enterpriseValueOverEBITDA",
-        "freeCashFlow",
-        "priceBookMrq",
-        "marketCapitalization",
-        "totalDebt",
-        "totalEquity",
-        "roa",
-    ]
-
-    total_fields = len(required_fields)
+    total_fields = len(REQUIRED_FIELDS)
     missing_count = sum(
-        1 for field in required_fields if metrics.get(field) is None
+        1 for field in REQUIRED_FIELDS if metrics.get(field) is None
     )
 
     missing_ratio = missing_count / total_fields
@@ -91,6 +155,25 @@ def has_sufficient_data(metrics: dict) -> tuple[bool, float]:
     return sufficient, missing_ratio
 
 
+def has_sufficient_data_batch(metrics: Mapping[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized has_sufficient_data for a whole universe.
+
+    Args:
+        metrics: pandas DataFrame or dict of equal-length arrays; None/NaN
+            entries and absent columns count as missing. Columns store None
+            as NaN, so unlike has_sufficient_data (which only counts None) a
+            float NaN value counts as missing here too.
+
+    Returns:
+        Tuple of (sufficient: bool array (N,), missing_ratio: float array (N,))
+    """
+    present = np.column_stack(_metric_columns(metrics, *REQUIRED_FIELDS))
+    missing_ratio = np.isnan(present).sum(axis=1) / len(REQUIRED_FIELDS)
+    sufficient = missing_ratio <= MAX_MISSING_RATIO
+    return sufficient, missing_ratio
+
+
 def should_score_symbol(metrics: dict) -> tuple[bool, str]:
     """
     Determine if a symbol should be scored.
@@ -1,31 +1,39 @@
 """Universe ranking and selection logic."""
 
+import heapq
 import logging
-from typing import Optional
-import random
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _ranking_key(entry: dict) -> tuple[float, str]:
+    """Sort key: composite_score descending, then symbol ascending."""
+    return -entry["composite_score"], entry["symbol"]
+
+
 def rank_universe(
-    scored_symbols: list[dict], seed: Optional[int] = None
+    scored_symbols: list[dict], seed: Optional[int] = None, top_k_only: bool = False
 ) -> dict:
     """
     Rank symbols by composite score and select top performers.
 
     Sorting is deterministic with alphabetical tie-breaking by symbol.
-    Pick of the Day uses a deterministic seed-based selection from top 5.
+    Pick of the Day uses a deterministic seed-based selection from top 5
+    (seed modulo the number of candidates).
 
     Args:
         scored_symbols: List of scored symbol dictionaries
         seed: Random seed for deterministic Pick of the Day selection
+        top_k_only: Only select the top 10 (partial heap selection instead of
+            a full sort); full_ranking is then None
 
     Returns:
         Dictionary containing:
         - top_10: List of top 10 symbols with scores
         - top_5: List of top 5 symbols with scores
         - pick_of_day: Single symbol dictionary
-        - full_ranking: All symbols sorted by score
+        - full_ranking: All symbols sorted by score (None if top_k_only)
     """
     if not scored_symbols:
         logger.warning("No symbols to rank")
@@ -36,30 +44,32 @@ def rank_universe(
             "full_ranking": [],
         }
 
-    # Sort by composite_score (descending), then by symbol (ascending) for determinism
-    sorted_symbols = sorted(
-        scored_symbols,
-        key=lambda x: (-x["composite_score"], x["symbol"]),
-    )
+    # Sort by composite_score (descending), then by symbol (ascending) for determinism.
+    # sorted() evaluates the key once per entry (decorate-sort-undecorate).
+    if top_k_only:
+        # O(N log 10) selection; same order as the first 10 of the full sort
+        sorted_symbols = None
+        top_10 = heapq.nsmallest(10, scored_symbols, key=_ranking_key)
+    else:
+        sorted_symbols = sorted(scored_symbols, key=_ranking_key)
+        top_10 = sorted_symbols[:10]
 
     # Extract top performers
-    top_10 = sorted_symbols[:10]
-    top_5 = sorted_symbols[:5]
+    top_5 = top_10[:5]
 
     # Pick of the Day: deterministic selection from top 5
     pick_of_day = None
     if top_5:
         if seed is not None:
-            # Use seed for deterministic selection
-            rng = random.Random(seed)
-            pick_of_day = rng.choice(top_5)
+            # Use seed for deterministic selection; date-like seeds rotate daily
+            pick_of_day = top_5[seed % len(top_5)]
         else:
             # Default to highest score
             pick_of_day = top_5[0]
 
     logger.info(
-        f"Ranking complete: {len(sorted_symbols)} symbols ranked, "
-        f"top score: {sorted_symbols[0]['composite_score']:.2f}, "
+        f"Ranking complete: {len(scored_symbols)} symbols ranked, "
+        f"top score: {top_10[0]['composite_score']:.2f}, "
         f"pick of day: {pick_of_day['symbol'] if pick_of_day else 'None'}"
     )
 
@@ -81,39 +91,37 @@ def format_ranking_summary(ranking: dict) -> str:
     Returns:
         Formatted string summary
     """
-    lines = []
-    lines.append("=" * 60)
-    lines.append("STOCK RANKING SUMMARY")
-    lines.append("=" * 60)
+    return "\n".join(_summary_lines(ranking))
+
+
+def _summary_lines(ranking: dict) -> Iterator[str]:
+    """Yield the lines of format_ranking_summary."""
+    yield "=" * 60
+    yield "STOCK RANKING SUMMARY"
+    yield "=" * 60
 
     # Pick of the Day
     if ranking["pick_of_day"]:
         pod = ranking["pick_of_day"]
-        lines.append(f"\n🌟 PICK OF THE DAY: {pod['symbol']}")
-        lines.append(f"   Composite Score: {pod['composite_score']:.2f}")
-        lines.append(
-            f"   Value: {pod['subscores']['value']:.2f} | "
-            f"Quality: {pod['subscores']['quality']:.2f} | "
-            f"Risk: {pod['subscores']['risk']:.2f} | "
-            f"Momentum: {pod['subscores']['momentum']:.2f}"
+        subscores = pod["subscores"]
+        yield f"\n🌟 PICK OF THE DAY: {pod['symbol']}"
+        yield f"   Composite Score: {pod['composite_score']:.2f}"
+        yield (
+            f"   Value: {subscores['value']:.2f} | "
+            f"Quality: {subscores['quality']:.2f} | "
+            f"Risk: {subscores['risk']:.2f} | "
+            f"Momentum: {subscores['momentum']:.2f}"
         )
 
     # Top 5
-    lines.append("\n📊 TOP 5 STOCKS:")
+    yield "\n📊 TOP 5 STOCKS:"
     for i, symbol_data in enumerate(ranking["top_5"], 1):
-        lines.append(
-            f"   {i}. {symbol_data['symbol']:6s} - "
-            f"Score: {symbol_data['composite_score']:6.2f}"
-        )
+        yield f"   {i}. {symbol_data['symbol']:6s} - Score: {symbol_data['composite_score']:6.2f}"
 
     # Top 10
     if len(ranking["top_10"]) > 5:
-        lines.append("\n📈 EXTENDED TOP 10:")
+        yield "\n📈 EXTENDED TOP 10:"
         for i, symbol_data in enumerate(ranking["top_10"][5:], 6):
-            lines.append(
-                f"   {i}. {symbol_data['symbol']:6s} - "
-                f"Score: {symbol_data['composite_score']:6.2f}"
-            )
+            yield f"   {i}. {symbol_data['symbol']:6s} - Score: {symbol_data['composite_score']:6.2f}"
 
-    lines.append("\n" + "=" * 60)
-    return "\n".join(lines)
+    yield "\n" + "=" * 60
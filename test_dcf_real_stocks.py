@@ -20,9 +20,10 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from data_py import FinnhubClient, SQLiteCache
 from scoring.dcf_adapter import (
-    calculate_intrinsic_value_dcf,
-    calculate_wacc_score,
-    calculate_var_risk,
+    FinnhubClientAdapter,
+    calculate_intrinsic_value_dcf_many,
+    calculate_wacc_score_many,
+    calculate_var_risk_many,
 )
 
 logging.basicConfig(
@@ -32,6 +33,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Symbols calculated in parallel; the client's rate limiter does the gating
+MAX_WORKERS = 4
+
 
 def print_section(title: str):
     """Print formatted section header."""
@@ -106,81 +110,64 @@ def main():
     start_time = time.time()
     request_count_start = getattr(client, 'request_count', 0)
 
-    # Track results
-    dcf_results = {}
-    wacc_results = {}
-    var_results = {}
+    # One adapter for all three calculations, so WACC/VaR reuse the DCF fetches
+    adapter = FinnhubClientAdapter(client)
     failures = []
 
     # Test DCF calculations
     print_section("TWO-STAGE DCF INTRINSIC VALUES")
 
-    for i, symbol in enumerate(test_symbols, 1):
-        print(f"[{i}/{len(test_symbols)}] Calculating DCF for {symbol}...")
-
-        try:
-            result = calculate_intrinsic_value_dcf(symbol, client)
-            dcf_results[symbol] = result
-            print_dcf_result(symbol, result)
-
-            if result is None:
-                failures.append((symbol, "DCF"))
+    print(f"Calculating DCF for {len(test_symbols)} symbols ({MAX_WORKERS} workers)...\n")
+    dcf_results = calculate_intrinsic_value_dcf_many(
+        test_symbols, adapter, max_workers=MAX_WORKERS
+    )
 
-        except Exception as e:
-            logger.error(f"{symbol}: DCF failed with exception: {e}")
-            failures.append((symbol, "DCF_EXCEPTION"))
-            print(f"  {symbol}: ❌ Exception - {e}\n")
+    for symbol in test_symbols:
+        result = dcf_results[symbol]
+        print_dcf_result(symbol, result)
 
-        # Small delay to avoid hitting rate limits too fast
-        time.sleep(0.2)
+        if result is None:
+            failures.append((symbol, "DCF"))
 
     # Test WACC calculations
     print_section("WACC (Weighted Average Cost of Capital)")
 
-    for symbol in test_symbols:
-        try:
-            result = calculate_wacc_score(symbol, client)
-            wacc_results[symbol] = result
-
-            if result:
-                wacc_pct = result['value'] * 100
-                print(f"  {symbol}: WACC = {wacc_pct:.2f}% (Confidence: {result['confidence']:.2%})")
-            else:
-                print(f"  {symbol}: ❌ WACC calculation failed")
-                failures.append((symbol, "WACC"))
+    wacc_results = calculate_wacc_score_many(
+        test_symbols, adapter, max_workers=MAX_WORKERS
+    )
 
-        except Exception as e:
-            logger.error(f"{symbol}: WACC failed: {e}")
-            failures.append((symbol, "WACC_EXCEPTION"))
+    for symbol in test_symbols:
+        result = wacc_results[symbol]
 
-        time.sleep(0.2)
+        if result:
+            wacc_pct = result['value'] * 100
+            print(f"  {symbol}: WACC = {wacc_pct:.2f}% (Confidence: {result['confidence']:.2%})")
+        else:
+            print(f"  {symbol}: ❌ WACC calculation failed")
+            failures.append((symbol, "WACC"))
 
     print()
 
     # Test VaR calculations
     print_section("MONTE CARLO VALUE-AT-RISK (95%, 30 days)")
 
-    for symbol in test_symbols:
-        try:
-            result = calculate_var_risk(symbol, client, confidence_level=0.95, horizon_days=30)
-            var_results[symbol] = result
-
-            if result:
-                var_abs = result['var_absolute']
-                var_pct = result.get('var_percent')
-                if var_pct:
-                    print(f"  {symbol}: VaR = ${var_abs:,.2f} ({var_pct:.2f}% of price)")
-                else:
-                    print(f"  {symbol}: VaR = ${var_abs:,.2f}")
-            else:
-                print(f"  {symbol}: ❌ VaR calculation failed")
-                failures.append((symbol, "VAR"))
+    var_results = calculate_var_risk_many(
+        test_symbols, adapter, confidence_level=0.95, horizon_days=30, max_workers=MAX_WORKERS
+    )
 
-        except Exception as e:
-            logger.error(f"{symbol}: VaR failed: {e}")
-            failures.append((symbol, "VAR_EXCEPTION"))
+    for symbol in test_symbols:
+        result = var_results[symbol]
 
-        time.sleep(0.2)
+        if result:
+            var_abs = result['var_absolute']
+            var_pct = result.get('var_percent')
+            if var_pct:
+                print(f"  {symbol}: VaR = ${var_abs:,.2f} ({var_pct:.2f}% of price)")
+            else:
+                print(f"  {symbol}: VaR = ${var_abs:,.2f}")
+        else:
+            print(f"  {symbol}: ❌ VaR calculation failed")
+            failures.append((symbol, "VAR"))
 
     print()
 
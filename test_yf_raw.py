@@ -1,10 +1,27 @@
 #!/usr/bin/env python3
-"""Check raw yfinance DataFrame structure."""
+"""Check raw yfinance DataFrame structure.
 
-import yfinance as yf
+By default the cash flow statement comes from the yf_client SQLite cache
+(rebuilt as a DataFrame with YYYY-MM-DD columns, as the adapter sees it);
+pass --live to fetch the untouched DataFrame from Yahoo instead.
+"""
 
-ticker = yf.Ticker("AAPL")
-cf = ticker.cashflow
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+if "--live" in sys.argv:
+    import yfinance as yf
+
+    ticker = yf.Ticker("AAPL")
+    cf = ticker.cashflow
+else:
+    from data_py.yf_client import fetch_financials
+
+    cf = pd.DataFrame.from_dict(fetch_financials("AAPL")["cashflow"], orient="index")
 
 print("=== Cashflow DataFrame ===")
 print(f"Shape: {cf.shape}")
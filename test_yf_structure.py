@@ -2,6 +2,7 @@
 """Debug: Check actual structure of yfinance data."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 
@@ -11,8 +12,13 @@ from data_py.yf_client import fetch_financials, fetch_balance_sheet
 
 print("=== Testing AAPL ===\n")
 
-# Fetch financials
-fin_data = fetch_financials("AAPL")
+# Fetch financials and balance sheet concurrently (independent requests)
+with ThreadPoolExecutor(max_workers=2) as executor:
+    fin_future = executor.submit(fetch_financials, "AAPL")
+    bs_future = executor.submit(fetch_balance_sheet, "AAPL")
+    fin_data = fin_future.result()
+    bs_data = bs_future.result()
+
 cashflow = fin_data.get("cashflow", {})
 financials = fin_data.get("financials", {})
 
@@ -29,7 +35,6 @@ else:
     print(f"   Available keys: {list(cashflow.keys())[:10]}")
 
 # Check balance sheet
-bs_data = fetch_balance_sheet("AAPL")
 bs = bs_data.get("balance_sheet", {})
 
 print(f"\n\nBalance Sheet keys: {list(bs.keys())[:10]}...")
@@ -0,0 +1,48 @@
+"""Tests for the FinnhubClientAdapter fetch cache."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from collections import Counter
+
+from scoring.dcf_adapter import FinnhubClientAdapter
+
+
+class MockClient:
+    def __init__(self):
+        self.calls = Counter()
+        self.price = 100.0
+
+    def get_basic_financials(self, symbol):
+        self.calls["basic"] += 1
+        return {"metric": {"beta": 1.1}, "series": {}}
+
+    def get_quote(self, symbol):
+        self.calls["quote"] += 1
+        return {"c": self.price}
+
+    def get_company_profile(self, symbol):
+        self.calls["profile"] += 1
+        return {"shareOutstanding": 10.0}
+
+
+class TestFetchAll(unittest.TestCase):
+    def test_fundamentals_cached_quote_live(self):
+        client = MockClient()
+        adapter = FinnhubClientAdapter(client)
+
+        first = adapter.fetch_all("AAPL")
+        client.price = 120.0
+        second = adapter.fetch_all("AAPL")
+
+        self.assertEqual(first["quote"]["c"], 100.0)
+        self.assertEqual(second["quote"]["c"], 120.0)
+        self.assertEqual(client.calls, Counter(basic=1, profile=1, quote=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
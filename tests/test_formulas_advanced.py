@@ -0,0 +1,90 @@
+"""Tests for the per-client day cache behind the advanced formula fetches."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import gc
+import unittest
+
+from formulas.advanced import utils
+from formulas.advanced.ev_ebitda_regression import _fetch_universe_data
+from formulas.advanced.var_monte_carlo import _closes_for
+
+
+class MockCandleClient:
+    def __init__(self, close: float):
+        self.close = close
+        self.calls = []
+
+    def stock_candles(self, symbol: str, resolution: str, _from: int, to: int):
+        self.calls.append((_from, to))
+        return {"s": "ok", "c": [self.close] * 250}
+
+
+class MockFinancialsClient:
+    def __init__(self, ev_ebitda: float):
+        self.ev_ebitda = ev_ebitda
+
+    def company_basic_financials(self, symbol: str, metric: str):
+        return {
+            "metric": {"enterpriseValueOverEBITDA": self.ev_ebitda, "roic": 0.1, "beta": 1.0},
+            "series": {
+                "annual": {"freeCashFlow": [{"period": str(i), "v": 100 + i} for i in range(5)]}
+            },
+        }
+
+
+class TestDailyCache(unittest.TestCase):
+    def setUp(self):
+        utils._DAILY_CACHE.clear()
+
+    def test_closes_are_cached_per_client(self):
+        client = MockCandleClient(100.0)
+        _closes_for("AAPL", client, 365)
+        _closes_for("AAPL", client, 365)
+        self.assertEqual(len(client.calls), 1)
+
+    def test_as_of_date_is_part_of_the_key(self):
+        client = MockCandleClient(100.0)
+        _closes_for("AAPL", client, 365, as_of_ts=1_600_000_000)
+        _closes_for("AAPL", client, 365, as_of_ts=1_700_000_000)
+        _closes_for("AAPL", client, 365, as_of_ts=1_700_000_100)  # gleicher UTC-Tag
+        self.assertEqual(
+            [to for _, to in client.calls], [1_600_000_000, 1_700_000_000]
+        )
+
+    def test_new_client_never_sees_old_closes(self):
+        # Nach GC kann CPython die id des alten Clients wiederverwenden
+        for close in (100.0, 200.0, 300.0):
+            client = MockCandleClient(close)
+            self.assertEqual(_closes_for("AAPL", client, 365)[0], close)
+            del client
+            gc.collect()
+
+    def test_universe_payload_is_per_client_and_copied(self):
+        first = MockFinancialsClient(5.0)
+        _, X, y = _fetch_universe_data(["A", "B"], first)
+        X[:] = 0.0
+        y[:] = 0.0
+
+        _, X_again, y_again = _fetch_universe_data(["A", "B"], first)
+        self.assertEqual(y_again.tolist(), [5.0, 5.0])
+        self.assertEqual(X_again[:, 0].tolist(), [0.1, 0.1])
+
+        _, _, y_other = _fetch_universe_data(["A", "B"], MockFinancialsClient(8.0))
+        self.assertEqual(y_other.tolist(), [8.0, 8.0])
+
+    def test_cache_entries_die_with_client(self):
+        client = MockCandleClient(100.0)
+        _closes_for("AAPL", client, 365)
+        self.assertEqual(len(utils._DAILY_CACHE), 1)
+        del client
+        gc.collect()
+        self.assertEqual(len(utils._DAILY_CACHE), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
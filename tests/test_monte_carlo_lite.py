@@ -0,0 +1,62 @@
+"""Tests for the Latin hypercube normals behind the Monte Carlo fair value."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from statistics import NormalDist
+
+import numpy as np
+
+from scoring.formulas.monte_carlo_lite import _latin_hypercube_normals, _norm_ppf
+
+_REFERENCE = NormalDist()
+
+
+class TestNormPpf(unittest.TestCase):
+    def test_matches_reference_inverse_cdf(self):
+        # Central region plus both tails (the rational approximation switches at 0.02425)
+        u = np.concatenate(
+            [np.linspace(0.001, 0.999, 999), [1e-10, 1e-6, 0.02, 0.0243, 0.98, 1 - 1e-6, 1 - 1e-10]]
+        )
+        expected = np.array([_REFERENCE.inv_cdf(x) for x in u])
+        np.testing.assert_allclose(_norm_ppf(u), expected, rtol=1e-8, atol=1e-9)
+
+    def test_mirroring_u_is_negating_z(self):
+        u = np.linspace(0.0005, 0.9995, 1000)
+        np.testing.assert_allclose(_norm_ppf(1.0 - u), -_norm_ppf(u), atol=1e-9)
+
+
+class TestLatinHypercubeNormals(unittest.TestCase):
+    def _strata(self, z, n):
+        u = np.array([[_REFERENCE.cdf(x) for x in row] for row in z])
+        return np.floor(u * n).astype(int)
+
+    def test_one_point_per_stratum(self):
+        n, dims = 200, 3
+        z = _latin_hypercube_normals(np.random.default_rng(7), n, dims)
+
+        self.assertEqual(z.shape, (n, dims))
+        strata = self._strata(z, n)
+        for d in range(dims):
+            self.assertEqual(sorted(strata[:, d]), list(range(n)))
+
+    def test_antithetic_half_is_also_stratified(self):
+        n = 100
+        z = _latin_hypercube_normals(np.random.default_rng(3), n, 3)
+        mirrored = self._strata(-z, n)
+        for d in range(3):
+            self.assertEqual(sorted(mirrored[:, d]), list(range(n)))
+
+    def test_seeded_draws_are_reproducible(self):
+        first = _latin_hypercube_normals(np.random.default_rng(11), 50, 3, dtype=np.float32)
+        second = _latin_hypercube_normals(np.random.default_rng(11), 50, 3, dtype=np.float32)
+        self.assertEqual(first.dtype, np.float32)
+        np.testing.assert_array_equal(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
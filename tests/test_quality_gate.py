@@ -0,0 +1,112 @@
+"""Tests for the vectorized quality gate against the per-symbol checks."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+
+import numpy as np
+
+from scoring.quality_gate import (
+    RED_FLAG_NAMES,
+    REQUIRED_FIELDS,
+    has_sufficient_data,
+    has_sufficient_data_batch,
+    passes_quality_gate,
+    passes_quality_gate_batch,
+)
+
+UNIVERSE = [
+    {"roa": 0.08, "freeCashFlow": 1e6, "totalDebt": 1e6, "totalEquity": 2e6},
+    {"roa": -0.02, "freeCashFlow": 1e6, "totalDebt": 1e6, "totalEquity": 2e6},
+    {"roa": 0.05, "freeCashFlow": -5e5, "totalDebt": 1e6, "totalEquity": 2e6},
+    {"roa": 0.05, "freeCashFlow": 1e6, "totalDebt": 8e6, "totalEquity": 2e6},
+    {"roa": 0.05, "freeCashFlow": 1e6, "totalDebt": 1e6, "totalEquity": -1e6},
+    {"roa": None, "freeCashFlow": None, "totalDebt": 0.0, "totalEquity": 1e6},
+]
+
+
+def _columns(rows):
+    return {key: [row[key] for row in rows] for key in rows[0]}
+
+
+class TestPassesQualityGateBatch(unittest.TestCase):
+    """Batch gate must agree with passes_quality_gate row by row."""
+
+    def test_matches_scalar_gate(self):
+        passes, flags = passes_quality_gate_batch(_columns(UNIVERSE))
+
+        self.assertEqual(flags.shape, (len(UNIVERSE), len(RED_FLAG_NAMES)))
+        for i, metrics in enumerate(UNIVERSE):
+            expected_pass, expected_flags = passes_quality_gate(metrics)
+            self.assertEqual(bool(passes[i]), expected_pass)
+            triggered = [name for name, hit in zip(RED_FLAG_NAMES, flags[i]) if hit]
+            self.assertEqual(triggered, expected_flags)
+
+    def test_accepts_numpy_columns(self):
+        passes, _ = passes_quality_gate_batch(
+            {
+                "roa": np.array([0.1, np.nan]),
+                "freeCashFlow": np.array([1.0, 1.0]),
+                "totalDebt": np.array([1.0, 1.0]),
+                "totalEquity": np.array([1.0, 1.0]),
+            }
+        )
+        self.assertEqual(passes.tolist(), [True, False])
+
+
+    def test_absent_equity_column_matches_scalar_default(self):
+        rows = [
+            {"roa": 0.1, "freeCashFlow": 1.0, "totalDebt": 2.0},
+            {"roa": 0.1, "freeCashFlow": 1.0, "totalDebt": 5.0},
+        ]
+        passes, flags = passes_quality_gate_batch(_columns(rows))
+
+        for i, metrics in enumerate(rows):
+            expected_pass, expected_flags = passes_quality_gate(metrics)
+            self.assertEqual(bool(passes[i]), expected_pass)
+            triggered = [name for name, hit in zip(RED_FLAG_NAMES, flags[i]) if hit]
+            self.assertEqual(triggered, expected_flags)
+
+
+    def test_empty_universe(self):
+        passes, flags = passes_quality_gate_batch({})
+        self.assertEqual(passes.shape, (0,))
+        self.assertEqual(flags.shape, (0, len(RED_FLAG_NAMES)))
+
+
+class TestHasSufficientDataBatch(unittest.TestCase):
+    """Batch data check must agree with has_sufficient_data row by row."""
+
+    def test_matches_scalar_check(self):
+        full = {field: 1.0 for field in REQUIRED_FIELDS}
+        rows = [
+            full,
+            {**full, "beta": None, "roic": None, "grossMargin": None},
+            {**full, "beta": None, "roic": None, "grossMargin": None, "roa": None},
+            {field: None for field in REQUIRED_FIELDS},
+        ]
+
+        sufficient, missing_ratio = has_sufficient_data_batch(_columns(rows))
+
+        for i, metrics in enumerate(rows):
+            expected_sufficient, expected_ratio = has_sufficient_data(metrics)
+            self.assertEqual(bool(sufficient[i]), expected_sufficient)
+            self.assertAlmostEqual(float(missing_ratio[i]), expected_ratio)
+
+    def test_absent_column_counts_as_missing(self):
+        columns = {field: [1.0] for field in REQUIRED_FIELDS if field != "beta"}
+        _, missing_ratio = has_sufficient_data_batch(columns)
+        self.assertAlmostEqual(float(missing_ratio[0]), 0.1)
+
+    def test_empty_universe(self):
+        sufficient, missing_ratio = has_sufficient_data_batch({})
+        self.assertEqual(sufficient.shape, (0,))
+        self.assertEqual(missing_ratio.shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
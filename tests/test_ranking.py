@@ -0,0 +1,53 @@
+"""Tests for universe ranking."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+
+from scoring.ranking import rank_universe
+
+
+def _universe(n: int = 60):
+    # Many tied scores so the symbol tie-break matters
+    return [
+        {"symbol": f"S{i:03d}", "composite_score": float((i * 37) % 11), "subscores": {}}
+        for i in range(n)
+    ]
+
+
+class TestRankUniverseTopK(unittest.TestCase):
+    """top_k_only must select exactly what the full sort selects."""
+
+    def test_matches_full_sort(self):
+        scored = _universe()
+        full = rank_universe(scored, seed=7)
+        partial = rank_universe(scored, seed=7, top_k_only=True)
+
+        self.assertEqual(partial["top_10"], full["top_10"])
+        self.assertEqual(partial["top_5"], full["top_5"])
+        self.assertEqual(partial["pick_of_day"], full["pick_of_day"])
+        self.assertIsNone(partial["full_ranking"])
+
+    def test_small_universe(self):
+        scored = _universe(3)
+        partial = rank_universe(scored, top_k_only=True)
+        self.assertEqual(len(partial["top_10"]), 3)
+        self.assertEqual(partial["pick_of_day"], partial["top_5"][0])
+
+
+class TestPickOfDay(unittest.TestCase):
+    def test_seed_selects_by_modulo(self):
+        ranking = rank_universe(_universe(), seed=12)
+        self.assertEqual(ranking["pick_of_day"], ranking["top_5"][12 % 5])
+
+    def test_without_seed_picks_top(self):
+        ranking = rank_universe(_universe())
+        self.assertEqual(ranking["pick_of_day"], ranking["top_5"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
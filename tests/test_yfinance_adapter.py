@@ -0,0 +1,64 @@
+"""Tests for the process-wide yfinance payload memo."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from data_py import yfinance_adapter
+from data_py.yfinance_adapter import YFinanceClient
+
+
+class TestSharedFetch(unittest.TestCase):
+    def setUp(self):
+        yfinance_adapter._SHARED_CACHE.clear()
+        self.client = YFinanceClient(persist_results=False)
+
+    def tearDown(self):
+        yfinance_adapter._SHARED_CACHE.clear()
+
+    def test_concurrent_misses_fetch_once(self):
+        calls = []
+        release = threading.Event()
+
+        def fetch(symbol, cache_ttl_hours):
+            calls.append(symbol)
+            release.wait(timeout=5)
+            return {"symbol": symbol}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.client._shared_fetch, "info", fetch, "AAPL")
+                for _ in range(4)
+            ]
+            while not yfinance_adapter._INFLIGHT:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(calls, ["AAPL"])
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(yfinance_adapter._INFLIGHT, {})
+
+    def test_failed_fetch_is_not_cached(self):
+        def failing(symbol, cache_ttl_hours):
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.client._shared_fetch("info", failing, "MSFT")
+
+        self.assertEqual(yfinance_adapter._INFLIGHT, {})
+        result = self.client._shared_fetch(
+            "info", lambda symbol, cache_ttl_hours: {"ok": True}, "MSFT"
+        )
+        self.assertEqual(result, {"ok": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for the yfinance daemon's Unix-socket protocol."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+
+from data_py.yfinance_daemon import YFinanceDaemon, claim_socket_path
+
+
+class StubClient:
+    def get_quote(self, symbol):
+        return {"c": 123.0, "symbol": symbol}
+
+    def get_candles(self, symbol, days_back=365):
+        return {"s": "ok", "days_back": days_back}
+
+
+class TestYFinanceDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmpdir.name, "yfinance.sock")
+        self.server = YFinanceDaemon(self.socket_path, StubClient(), max_workers=2)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def _exchange(self, *lines):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(5)
+            conn.connect(self.socket_path)
+            conn.sendall("".join(line + "\n" for line in lines).encode("utf-8"))
+            buf = b""
+            while buf.count(b"\n") < len(lines):
+                chunk = conn.recv(4096)
+                if not chunk:
+                    break
+                buf += chunk
+        return [json.loads(line) for line in buf.decode("utf-8").splitlines()]
+
+    def test_request_response(self):
+        request = {"id": 1, "symbol": "AAPL", "method": "get_quote"}
+        (reply,) = self._exchange(json.dumps(request))
+        self.assertEqual(reply, {"id": 1, "result": {"c": 123.0, "symbol": "AAPL"}})
+
+    def test_args_are_passed_through(self):
+        request = {"id": 2, "symbol": "AAPL", "method": "get_candles", "args": {"days_back": 30}}
+        (reply,) = self._exchange(json.dumps(request))
+        self.assertEqual(reply["result"]["days_back"], 30)
+
+    def test_malformed_json(self):
+        (reply,) = self._exchange("{not json")
+        self.assertIsNone(reply["id"])
+        self.assertIn("Invalid JSON", reply["error"])
+
+    def test_non_object_json(self):
+        replies = self._exchange("[]", '"x"', "1")
+        self.assertEqual(len(replies), 3)
+        for reply in replies:
+            self.assertEqual(reply, {"id": None, "error": "Request must be a JSON object"})
+
+    def test_unknown_method(self):
+        (reply,) = self._exchange(json.dumps({"id": 7, "symbol": "AAPL", "method": "nope"}))
+        self.assertEqual(reply["id"], 7)
+        self.assertIn("Unsupported method", reply["error"])
+
+    def test_socket_is_owner_only(self):
+        mode = stat.S_IMODE(os.stat(self.socket_path).st_mode)
+        self.assertEqual(mode, 0o600)
+
+    def test_claim_refuses_live_socket(self):
+        with self.assertRaises(RuntimeError):
+            claim_socket_path(self.socket_path)
+        self.assertTrue(os.path.exists(self.socket_path))
+
+
+class TestClaimSocketPath(unittest.TestCase):
+    def test_removes_stale_socket(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stale.sock")
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(path)
+            stale.close()  # file stays, nobody listens
+
+            claim_socket_path(path)
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -131,4 +131,24 @@ describe('YFinanceBatchProvider mapping parity', () => {
     expect(technical.avgVolume10Day).not.toBeNull();
     expect(technical.candles).toHaveLength(260);
   });
+
+  it('accepts columnar candles as emitted by yfinance_batch.py', () => {
+    const provider = new YFinanceBatchProvider();
+    const quote: Quote = { c: 110, h: 112, l: 108, o: 109, pc: 100, t: 0 };
+    const rows = buildCandles();
+    const columns = {
+      t: rows.map((c) => c.t),
+      close: rows.map((c) => c.close),
+      high: rows.map((c) => c.high),
+      low: rows.map((c) => c.low),
+      volume: rows.map((c) => c.volume),
+    };
+
+    const fromColumns = provider.mapBatchTechnicalMetrics('TEST', quote, columns);
+    const fromRows = provider.mapBatchTechnicalMetrics('TEST', quote, rows);
+
+    expect(fromColumns?.candles).toHaveLength(260);
+    expect(fromColumns?.priceReturn52Week).toBeCloseTo(fromRows?.priceReturn52Week ?? NaN, 10);
+    expect(fromColumns?.avgVolume3Month).toBeCloseTo(fromRows?.avgVolume3Month ?? NaN, 10);
+  });
 });